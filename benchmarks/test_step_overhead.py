@@ -0,0 +1,319 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Measures the per-step overhead of the Lightning loops on CPU against equivalent hand-written PyTorch loops.
+
+Each scenario is run with the ``Trainer`` and with a plain loop doing the same work. The time spent by the ``Trainer``
+is attributed to stages (fetch, hooks, closure, logging, progress bar) using the exclusive time of the profiled
+actions, so nested actions are only counted once.
+
+Run ``python benchmarks/test_step_overhead.py [output.json]`` to write the results as JSON.
+"""
+import gc
+import json
+import os
+import sys
+import time
+from collections import defaultdict
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+import torch
+from torch.utils.data import DataLoader
+
+from pytorch_lightning import Callback, LightningModule, seed_everything, Trainer
+from pytorch_lightning.profiler import BaseProfiler
+
+_EXTEND_BENCHMARKS = os.getenv("PL_RUNNING_BENCHMARKS", "0") == "1"
+_SHORT_BENCHMARKS = not _EXTEND_BENCHMARKS
+_MARK_SHORT_BM = pytest.mark.skipif(_SHORT_BENCHMARKS, reason="Only run during Benchmarking")
+
+NUM_STEPS = 500
+NUM_RUNS = 3
+STAGES = ("fetch", "hooks", "closure", "logging", "progress_bar")
+_HOOK_PREFIXES = ("on_", "training_epoch_end", "configure_", "setup", "teardown", "backward", "optimizer_")
+# the logger connector methods run every step
+_LOGGING_METHODS = ("on_train_split_start", "update_train_step_metrics", "on_batch_end")
+
+
+def _stage(action_name: str) -> Optional[str]:
+    if action_name in ("logging", "progress_bar"):
+        return action_name
+    if action_name.startswith(("get_train_batch", "training_batch_to_device")):
+        return "fetch"
+    if action_name.startswith(("training_step_and_backward", "optimizer_step_and_closure", "closure", "zero_grad")):
+        return "closure"
+    if action_name.startswith(("model_forward", "training_step", "backward")):
+        return "closure"
+    if action_name.startswith(_HOOK_PREFIXES):
+        return "hooks"
+    return None
+
+
+class StageProfiler(BaseProfiler):
+    """Accumulates the exclusive time of the profiled actions per stage."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.durations: Dict[str, float] = defaultdict(float)
+        self._stack: List[Tuple[str, float, float]] = []
+
+    def start(self, action_name: str) -> None:
+        # (name, start time, time spent in nested actions)
+        self._stack.append((action_name, time.perf_counter(), 0.0))
+
+    def stop(self, action_name: str) -> None:
+        if not self._stack or self._stack[-1][0] != action_name:
+            # `profile_iterable` stops the action once more when the iterable is exhausted
+            return
+        _, start, nested = self._stack.pop()
+        duration = time.perf_counter() - start
+        stage = _stage(action_name)
+        if stage is not None:
+            self.durations[stage] += duration - nested
+        else:
+            # unattributed actions, e.g. `run_training_epoch`, are left to the caller
+            duration = 0.0
+        if self._stack:
+            name, parent_start, parent_nested = self._stack[-1]
+            self._stack[-1] = (name, parent_start, parent_nested + duration)
+
+    def summary(self) -> str:
+        return json.dumps(self.durations)
+
+    def wrap(self, fn: Callable, action_name: str) -> Callable:
+        @wraps(fn)
+        def wrapped(*args: Any, **kwargs: Any) -> Any:
+            with self.profile(action_name):
+                return fn(*args, **kwargs)
+
+        return wrapped
+
+
+class _Dataset(torch.utils.data.Dataset):
+    def __init__(self, length: int) -> None:
+        self.data = torch.randn(length, 4)
+
+    def __getitem__(self, index: int) -> torch.Tensor:
+        return self.data[index]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+class NoOpModel(LightningModule):
+    """The smallest model, so the time measured is the framework's."""
+
+    def __init__(self, num_logs: int = 0, num_dataloaders: int = 1, automatic_optimization: bool = True) -> None:
+        super().__init__()
+        self.layer = torch.nn.Linear(4, 1)
+        self.num_logs = num_logs
+        self.num_dataloaders = num_dataloaders
+        self.automatic_optimization = automatic_optimization
+
+    def forward(self, batch: Any) -> torch.Tensor:
+        if isinstance(batch, dict):
+            batch = torch.cat(list(batch.values()))
+        return self.layer(batch).sum()
+
+    def training_step(self, batch: Any, batch_idx: int) -> Optional[torch.Tensor]:
+        loss = self(batch)
+        for i in range(self.num_logs):
+            self.log(f"metric_{i}", loss.detach())
+        if self.automatic_optimization:
+            return loss
+        opt = self.optimizers()
+        opt.zero_grad()
+        self.manual_backward(loss)
+        opt.step()
+
+    def configure_optimizers(self) -> torch.optim.Optimizer:
+        return torch.optim.SGD(self.parameters(), lr=0.01)
+
+    def train_dataloader(self) -> Any:
+        if self.num_dataloaders == 1:
+            return DataLoader(_Dataset(NUM_STEPS))
+        return {str(i): DataLoader(_Dataset(NUM_STEPS)) for i in range(self.num_dataloaders)}
+
+
+class NoOpCallback(Callback):
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+        pass
+
+    def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
+        pass
+
+    def on_before_backward(self, trainer, pl_module, loss):
+        pass
+
+    def on_after_backward(self, trainer, pl_module):
+        pass
+
+    def on_before_optimizer_step(self, trainer, pl_module, optimizer, optimizer_idx):
+        pass
+
+    def on_before_zero_grad(self, trainer, pl_module, optimizer):
+        pass
+
+
+# name: (model kwargs, number of callbacks, accumulate_grad_batches)
+SCENARIOS = {
+    "no_op": ({}, 0, 1),
+    "many_logs": ({"num_logs": 100}, 0, 1),
+    "many_callbacks": ({}, 20, 1),
+    "manual_optimization": ({"automatic_optimization": False}, 0, 1),
+    "gradient_accumulation": ({}, 0, 4),
+    "multiple_dataloaders": ({"num_dataloaders": 2}, 0, 1),
+}
+
+# upper bounds of the overhead per step, about 4 times the overhead measured on a CPU machine
+MAX_OVERHEAD_US_PER_STEP = {
+    "no_op": 2000,
+    "many_logs": 100000,
+    "many_callbacks": 2000,
+    "manual_optimization": 1500,
+    "gradient_accumulation": 1500,
+    "multiple_dataloaders": 2000,
+}
+
+
+def lightning_loop(
+    model_kwargs: dict, num_callbacks: int, accumulate_grad_batches: int, num_steps: int
+) -> Tuple[float, Dict[str, float]]:
+    seed_everything(0)
+    model = NoOpModel(**model_kwargs)
+    profiler = StageProfiler()
+    trainer = Trainer(
+        max_steps=num_steps,
+        limit_val_batches=0,
+        weights_summary=None,
+        checkpoint_callback=False,
+        logger=False,
+        profiler=profiler,
+        callbacks=[NoOpCallback() for _ in range(num_callbacks)],
+        accumulate_grad_batches=accumulate_grad_batches,
+    )
+    for name in _LOGGING_METHODS:
+        setattr(trainer.logger_connector, name, profiler.wrap(getattr(trainer.logger_connector, name), "logging"))
+    model.log = profiler.wrap(model.log, "logging")
+    progress_bar = trainer.progress_bar_callback
+    for name in ("on_train_batch_start", "on_train_batch_end", "on_train_epoch_start"):
+        setattr(progress_bar, name, profiler.wrap(getattr(progress_bar, name), "progress_bar"))
+
+    start = time.perf_counter()
+    trainer.fit(model)
+    duration = time.perf_counter() - start
+    return duration, dict(profiler.durations)
+
+
+def vanilla_loop(model_kwargs: dict, num_callbacks: int, accumulate_grad_batches: int, num_steps: int) -> float:
+    seed_everything(0)
+    model = NoOpModel(**model_kwargs)
+    optimizer = model.configure_optimizers()
+    dataloaders = model.train_dataloader()
+    callbacks = [NoOpCallback() for _ in range(num_callbacks)]
+    metrics = defaultdict(float)
+
+    def batches() -> Iterator:
+        # restart the dataloaders like new epochs would
+        while True:
+            if isinstance(dataloaders, dict):
+                yield from (dict(zip(dataloaders, batch)) for batch in zip(*dataloaders.values()))
+            else:
+                yield from dataloaders
+
+    start = time.perf_counter()
+    for batch_idx, batch in enumerate(batches()):
+        if batch_idx == num_steps * accumulate_grad_batches:
+            break
+        for callback in callbacks:
+            callback.on_train_batch_start(None, model, batch, batch_idx, 0)
+        loss = model(batch)
+        for i in range(model.num_logs):
+            metrics[f"metric_{i}"] += loss.detach()
+        for callback in callbacks:
+            callback.on_before_backward(None, model, loss)
+        loss.backward()
+        for callback in callbacks:
+            callback.on_after_backward(None, model)
+        if (batch_idx + 1) % accumulate_grad_batches == 0:
+            for callback in callbacks:
+                callback.on_before_optimizer_step(None, model, optimizer, 0)
+            optimizer.step()
+            for callback in callbacks:
+                callback.on_before_zero_grad(None, model, optimizer)
+            optimizer.zero_grad()
+        for callback in callbacks:
+            callback.on_train_batch_end(None, model, loss, batch, batch_idx, 0)
+    return time.perf_counter() - start
+
+
+def measure_step_overhead(name: str, num_steps: int = NUM_STEPS, num_runs: int = NUM_RUNS) -> Dict[str, Any]:
+    """Returns the microseconds per step of the ``Trainer`` and of the plain loop for a scenario, keeping the
+    fastest run of each."""
+    scenario = SCENARIOS[name]
+    lightning, vanilla, stages = float("inf"), float("inf"), {}
+    for _ in range(num_runs):
+        gc.collect()
+        duration, durations = lightning_loop(*scenario, num_steps)
+        if duration < lightning:
+            lightning, stages = duration, durations
+        gc.collect()
+        vanilla = min(vanilla, vanilla_loop(*scenario, num_steps))
+
+    # the optimizer steps and the batches are not equal with gradient accumulation. `max_steps` counts the former
+    num_batches = num_steps * scenario[2]
+    to_us = 1e6 / num_batches
+    stages = {stage: stages.get(stage, 0.0) * to_us for stage in STAGES}
+    stages["other"] = max(lightning * to_us - sum(stages.values()), 0.0)
+    return {
+        "lightning_us_per_step": lightning * to_us,
+        "vanilla_us_per_step": vanilla * to_us,
+        "overhead_us_per_step": (lightning - vanilla) * to_us,
+        "stages_us_per_step": stages,
+    }
+
+
+@_MARK_SHORT_BM
+@pytest.mark.parametrize("name", list(SCENARIOS))
+def test_step_overhead(name):
+    """Check that the per-step measurements are produced and add up for every scenario, and that the overhead of
+    the ``Trainer`` stays bounded."""
+    result = measure_step_overhead(name)
+    json.dumps(result)
+    assert set(result["stages_us_per_step"]) == set(STAGES) | {"other"}
+    assert all(v >= 0 for v in result["stages_us_per_step"].values())
+    assert sum(result["stages_us_per_step"].values()) >= result["lightning_us_per_step"] * 0.99
+    # the closure and fetch stages are always measured
+    assert result["stages_us_per_step"]["closure"] > 0
+    assert result["stages_us_per_step"]["fetch"] > 0
+    assert result["overhead_us_per_step"] < MAX_OVERHEAD_US_PER_STEP[name], (
+        f"The Trainer overhead of {result['overhead_us_per_step']:.0f} us per step is above the threshold of"
+        f" {MAX_OVERHEAD_US_PER_STEP[name]} us"
+    )
+
+
+def _main(path: Optional[str] = None) -> None:
+    results = {name: measure_step_overhead(name) for name in SCENARIOS}
+    output = json.dumps(results, indent=2)
+    if path is None:
+        print(output)
+        return
+    with open(path, "w") as f:
+        f.write(output)
+
+
+if __name__ == "__main__":
+    _main(*sys.argv[1:2])
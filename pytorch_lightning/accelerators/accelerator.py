@@ -153,6 +153,7 @@ class Accelerator:
         This method is called to teardown the training process.
         It is the right place to release memory and free other resources.
         """
+        self.training_type_plugin.checkpoint_io.teardown()
         self.training_type_plugin.teardown()
 
     def batch_to_device(
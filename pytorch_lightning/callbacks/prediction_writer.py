@@ -17,11 +17,19 @@ BasePredictionWriter
 
 Aids in saving predictions
 """
-from typing import Any, Optional, Sequence
+import os
+import queue
+import threading
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import torch
 
 import pytorch_lightning as pl
 from pytorch_lightning.callbacks.base import Callback
-from pytorch_lightning.utilities import LightningEnum
+from pytorch_lightning.utilities import LightningEnum, rank_zero_warn
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.cloud_io import get_filesystem
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
 
@@ -120,3 +128,169 @@ class BasePredictionWriter(Callback):
         is_distributed = trainer.accelerator_connector.is_distributed
         epoch_batch_indices = trainer.predict_loop.epoch_batch_indices if is_distributed else None
         self.write_on_epoch_end(trainer, pl_module, trainer.predict_loop.predictions, epoch_batch_indices)
+
+
+class ShardedPredictionWriter(BasePredictionWriter):
+    """
+    Streams the predictions to shard files, so they never need to be held in memory all at once.
+
+    The predictions are moved to CPU as they are produced and grouped in shards of ``batches_per_shard`` batches. The
+    shards are written by a background thread while the next batches are predicted. The queue of shards waiting to be
+    written is bounded by ``max_queue_size``, so the prediction loop waits for the disk instead of growing the memory.
+
+    Each rank writes its own files, named ``predictions-dl{dataloader_idx}-rank{global_rank}-{shard_idx:05d}``.
+    In distributed runs, the dataset indices of the predictions are written along with them.
+
+    Args:
+        output_dir: Directory the shard files are written to.
+        batches_per_shard: Number of batches written in each shard file.
+        file_format: ``"npy"`` concatenates the predictions along their first dimension and saves them with
+            :func:`numpy.save`, the dataset indices in a ``-indices.npy`` file. The predictions should be tensors.
+            ``"pt"`` saves a dictionary with the list of predictions of the batches and their dataset indices with
+            :func:`torch.save`, which supports any type of predictions.
+        max_queue_size: Number of shards waiting to be written before the prediction loop blocks.
+
+    Example::
+
+        from pytorch_lightning.callbacks import ShardedPredictionWriter
+
+        writer = ShardedPredictionWriter("predictions", batches_per_shard=1000)
+        trainer = Trainer(callbacks=writer)
+        trainer.predict(model, dataloaders=dataloader, return_predictions=False)
+
+    Other formats can be supported by overriding :meth:`write_shard`.
+    """
+
+    FILE_FORMATS = ("npy", "pt")
+
+    def __init__(
+        self, output_dir: str, batches_per_shard: int = 100, file_format: str = "npy", max_queue_size: int = 2
+    ) -> None:
+        super().__init__("batch")
+        if file_format not in self.FILE_FORMATS:
+            raise MisconfigurationException(f"`file_format` should be one of {self.FILE_FORMATS}, got {file_format!r}.")
+        if batches_per_shard < 1 or max_queue_size < 1:
+            raise MisconfigurationException(
+                "`batches_per_shard` and `max_queue_size` should be at least 1,"
+                f" got {batches_per_shard} and {max_queue_size}."
+            )
+        self.output_dir = output_dir
+        self.batches_per_shard = batches_per_shard
+        self.file_format = file_format
+        self.max_queue_size = max_queue_size
+
+        self._predictions: List[Any] = []
+        self._batch_indices: List[Sequence[int]] = []
+        self._dataloader_idx: Optional[int] = None
+        self._global_rank = 0
+        self._num_shards: Dict[int, int] = {}
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        self._error: Optional[BaseException] = None
+
+    def on_predict_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        if trainer.predict_loop.return_predictions:
+            rank_zero_warn(
+                "The predictions are also kept in memory to be returned by `trainer.predict`."
+                " Pass `return_predictions=False` to only stream them to the shard files."
+            )
+        # the thread of a previous run interrupted by an exception
+        self._stop(raise_error=False)
+        get_filesystem(self.output_dir).makedirs(self.output_dir, exist_ok=True)
+        self._global_rank = trainer.global_rank
+        self._predictions, self._batch_indices = [], []
+        self._dataloader_idx = None
+        self._num_shards = {}
+        self._error = None
+        self._queue = queue.Queue(maxsize=self.max_queue_size)
+        self._thread = threading.Thread(target=self._write_loop, name="ShardedPredictionWriter", daemon=True)
+        self._thread.start()
+
+    def write_on_batch_end(
+        self,
+        trainer: "pl.Trainer",
+        pl_module: "pl.LightningModule",
+        prediction: Any,
+        batch_indices: Optional[Sequence[int]],
+        batch: Any,
+        batch_idx: int,
+        dataloader_idx: int,
+    ) -> None:
+        if self.file_format == "npy" and not isinstance(prediction, torch.Tensor):
+            raise MisconfigurationException(
+                f"The `npy` format requires the predictions to be tensors, got {type(prediction).__name__}."
+                " Use `file_format='pt'` instead."
+            )
+        if dataloader_idx != self._dataloader_idx:
+            self._flush()
+            self._dataloader_idx = dataloader_idx
+        self._predictions.append(apply_to_collection(prediction, torch.Tensor, lambda t: t.detach().cpu()))
+        if batch_indices is not None:
+            self._batch_indices.append(list(batch_indices))
+        if len(self._predictions) >= self.batches_per_shard:
+            self._flush()
+
+    def on_predict_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self._flush()
+        self._stop()
+
+    def teardown(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", stage: Optional[str] = None) -> None:
+        # the prediction was interrupted, the pending shards are dropped
+        self._predictions, self._batch_indices = [], []
+        self._stop(raise_error=False)
+
+    def write_shard(self, path: str, predictions: List[Any], batch_indices: Optional[List[Sequence[int]]]) -> None:
+        """Writes the predictions of the batches of a shard. Called from the background thread.
+
+        Args:
+            path: The path of the shard file, without extension.
+            predictions: The predictions of the batches, on CPU.
+            batch_indices: The dataset indices of the predictions of each batch, in distributed runs only.
+        """
+        fs = get_filesystem(path)
+        if self.file_format == "pt":
+            with fs.open(f"{path}.pt", "wb") as f:
+                torch.save({"predictions": predictions, "batch_indices": batch_indices}, f)
+            return
+        # numpy does not support bfloat16
+        predictions = [p.float() if p.dtype == torch.bfloat16 else p for p in predictions]
+        array = torch.cat([p.reshape(-1, *p.shape[1:]) for p in predictions]).numpy()
+        with fs.open(f"{path}.npy", "wb") as f:
+            np.save(f, array)
+        if batch_indices is not None:
+            with fs.open(f"{path}-indices.npy", "wb") as f:
+                np.save(f, np.concatenate(batch_indices).astype(np.int64))
+
+    def _flush(self) -> None:
+        if not self._predictions:
+            return
+        if self._error is not None:
+            raise self._error
+        shard_idx = self._num_shards.get(self._dataloader_idx, 0)
+        self._num_shards[self._dataloader_idx] = shard_idx + 1
+        filename = f"predictions-dl{self._dataloader_idx}-rank{self._global_rank}-{shard_idx:05d}"
+        # blocks while `max_queue_size` shards are waiting to be written
+        self._queue.put((os.path.join(self.output_dir, filename), self._predictions, self._batch_indices or None))
+        self._predictions, self._batch_indices = [], []
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            # after an error, the queue is still drained so the prediction loop never blocks on it
+            if self._error is None:
+                try:
+                    self.write_shard(*item)
+                except BaseException as e:
+                    self._error = e
+
+    def _stop(self, raise_error: bool = True) -> None:
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        self._queue = None
+        if raise_error and self._error is not None:
+            raise self._error
@@ -16,7 +16,8 @@ import io
 import math
 import os
 import sys
-from typing import Optional, Union
+import threading
+from typing import Any, Dict, Optional, Union
 
 # check if ipywidgets is installed before importing tqdm.auto
 # to ensure it won't fail and a progress bar is displayed
@@ -26,6 +27,7 @@ else:
     from tqdm import tqdm as _tqdm
 
 from pytorch_lightning.callbacks.progress.base import ProgressBarBase
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
 _PAD_SIZE = 5
 
@@ -96,17 +98,34 @@ class ProgressBar(ProgressBarBase):
             together. This corresponds to
             :paramref:`~pytorch_lightning.trainer.trainer.Trainer.process_position` in the
             :class:`~pytorch_lightning.trainer.trainer.Trainer`.
+        refresh_interval: If set, the progress bars are refreshed every ``refresh_interval`` seconds by a background
+            thread instead of every ``refresh_rate`` batches. The training loop then only increments the batch
+            counters, and the metrics shown are collected at most once per interval.
+
+    Raises:
+        MisconfigurationException:
+            If ``refresh_interval`` is not positive.
     """
 
-    def __init__(self, refresh_rate: int = 1, process_position: int = 0):
+    def __init__(self, refresh_rate: int = 1, process_position: int = 0, refresh_interval: Optional[float] = None):
         super().__init__()
+        if refresh_interval is not None and refresh_interval <= 0:
+            raise MisconfigurationException(f"`refresh_interval` should be positive, got {refresh_interval}.")
         self._refresh_rate = refresh_rate
         self._process_position = process_position
+        self._refresh_interval = refresh_interval
         self._enabled = True
         self.main_progress_bar = None
         self.val_progress_bar = None
         self.test_progress_bar = None
         self.predict_progress_bar = None
+        # state shared with the render thread when ``refresh_interval`` is set
+        self._main_bar_n = 0
+        self._metrics_requested = False
+        self._metrics: Optional[Dict[str, Any]] = None
+        self._render_lock = threading.RLock()
+        self._render_thread: Optional[threading.Thread] = None
+        self._render_stop = threading.Event()
 
     def __getstate__(self):
         # can't pickle the tqdm objects
@@ -115,8 +134,17 @@ class ProgressBar(ProgressBarBase):
         state["val_progress_bar"] = None
         state["test_progress_bar"] = None
         state["predict_progress_bar"] = None
+        # nor the threading objects
+        state["_render_lock"] = None
+        state["_render_thread"] = None
+        state["_render_stop"] = None
         return state
 
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._render_lock = threading.RLock()
+        self._render_stop = threading.Event()
+
     @property
     def refresh_rate(self) -> int:
         return self._refresh_rate
@@ -125,6 +153,10 @@ class ProgressBar(ProgressBarBase):
     def process_position(self) -> int:
         return self._process_position
 
+    @property
+    def refresh_interval(self) -> Optional[float]:
+        return self._refresh_interval
+
     @property
     def is_enabled(self) -> bool:
         return self._enabled and self.refresh_rate > 0
@@ -205,19 +237,35 @@ class ProgressBar(ProgressBarBase):
         )
         return bar
 
+    def setup(self, trainer, pl_module, stage: Optional[str] = None) -> None:
+        if self.refresh_interval is not None and self.is_enabled and self._render_thread is None:
+            self._render_stop.clear()
+            self._render_thread = threading.Thread(target=self._render_loop, name="ProgressBar", daemon=True)
+            self._render_thread.start()
+
+    def teardown(self, trainer, pl_module, stage: Optional[str] = None) -> None:
+        if self._render_thread is not None:
+            self._render_stop.set()
+            self._render_thread.join()
+            self._render_thread = None
+
     def on_sanity_check_start(self, trainer, pl_module):
         super().on_sanity_check_start(trainer, pl_module)
-        self.val_progress_bar = self.init_sanity_tqdm()
-        self.main_progress_bar = Tqdm(disable=True)  # dummy progress bar
+        with self._render_lock:
+            self.val_progress_bar = self.init_sanity_tqdm()
+            self.main_progress_bar = Tqdm(disable=True)  # dummy progress bar
 
     def on_sanity_check_end(self, trainer, pl_module):
         super().on_sanity_check_end(trainer, pl_module)
-        self.main_progress_bar.close()
-        self.val_progress_bar.close()
+        with self._render_lock:
+            self._render()
+            self.main_progress_bar.close()
+            self.val_progress_bar.close()
 
     def on_train_start(self, trainer, pl_module):
         super().on_train_start(trainer, pl_module)
-        self.main_progress_bar = self.init_train_tqdm()
+        with self._render_lock:
+            self.main_progress_bar = self.init_train_tqdm()
 
     def on_train_epoch_start(self, trainer, pl_module):
         super().on_train_epoch_start(trainer, pl_module)
@@ -228,11 +276,19 @@ class ProgressBar(ProgressBarBase):
             val_checks_per_epoch = total_train_batches // trainer.val_check_batch
             total_val_batches = total_val_batches * val_checks_per_epoch
         total_batches = total_train_batches + total_val_batches
-        reset(self.main_progress_bar, total=total_batches, current=self.train_batch_idx)
-        self.main_progress_bar.set_description(f"Epoch {trainer.current_epoch}")
+        with self._render_lock:
+            reset(self.main_progress_bar, total=total_batches, current=self.train_batch_idx)
+            self.main_progress_bar.set_description(f"Epoch {trainer.current_epoch}")
+            self._main_bar_n = self.train_batch_idx
 
     def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
         super().on_train_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
+        if self.refresh_interval is not None:
+            self._main_bar_n += 1
+            if self._metrics_requested:
+                self._metrics_requested = False
+                self._metrics = self.get_metrics(trainer, pl_module)
+            return
         total_batches = self.total_train_batches + self.total_val_batches
         total_batches = convert_inf(total_batches)
         if self._should_update(self.train_batch_idx, total_batches):
@@ -241,55 +297,70 @@ class ProgressBar(ProgressBarBase):
 
     def on_validation_start(self, trainer, pl_module):
         super().on_validation_start(trainer, pl_module)
-        if trainer.sanity_checking:
-            reset(self.val_progress_bar, total=sum(trainer.num_sanity_val_batches), current=self.val_batch_idx)
-        else:
-            self._update_bar(self.main_progress_bar)  # fill up remaining
-            self.val_progress_bar = self.init_validation_tqdm()
-            reset(self.val_progress_bar, total=self.total_val_batches, current=self.val_batch_idx)
+        with self._render_lock:
+            if trainer.sanity_checking:
+                reset(self.val_progress_bar, total=sum(trainer.num_sanity_val_batches), current=self.val_batch_idx)
+            else:
+                if self.refresh_interval is None:
+                    self._update_bar(self.main_progress_bar)  # fill up remaining
+                self.val_progress_bar = self.init_validation_tqdm()
+                reset(self.val_progress_bar, total=self.total_val_batches, current=self.val_batch_idx)
 
     def on_validation_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
         super().on_validation_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
+        if self.refresh_interval is not None:
+            self._main_bar_n += 1
+            return
         if self._should_update(self.val_batch_idx, convert_inf(self.total_val_batches)):
             self._update_bar(self.val_progress_bar)
             self._update_bar(self.main_progress_bar)
 
     def on_validation_end(self, trainer, pl_module):
         super().on_validation_end(trainer, pl_module)
-        if self.main_progress_bar is not None:
-            self.main_progress_bar.set_postfix(self.get_metrics(trainer, pl_module))
-        self.val_progress_bar.close()
+        with self._render_lock:
+            self._render()
+            if self.main_progress_bar is not None:
+                self.main_progress_bar.set_postfix(self.get_metrics(trainer, pl_module))
+            self.val_progress_bar.close()
 
     def on_train_end(self, trainer, pl_module):
         super().on_train_end(trainer, pl_module)
-        self.main_progress_bar.close()
+        with self._render_lock:
+            self._render()
+            self.main_progress_bar.close()
 
     def on_test_start(self, trainer, pl_module):
         super().on_test_start(trainer, pl_module)
-        self.test_progress_bar = self.init_test_tqdm()
-        self.test_progress_bar.total = convert_inf(self.total_test_batches)
+        with self._render_lock:
+            self.test_progress_bar = self.init_test_tqdm()
+            self.test_progress_bar.total = convert_inf(self.total_test_batches)
 
     def on_test_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
         super().on_test_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
-        if self._should_update(self.test_batch_idx, self.total_test_batches):
+        if self.refresh_interval is None and self._should_update(self.test_batch_idx, self.total_test_batches):
             self._update_bar(self.test_progress_bar)
 
     def on_test_end(self, trainer, pl_module):
         super().on_test_end(trainer, pl_module)
-        self.test_progress_bar.close()
+        with self._render_lock:
+            self._render()
+            self.test_progress_bar.close()
 
     def on_predict_epoch_start(self, trainer, pl_module):
         super().on_predict_epoch_start(trainer, pl_module)
-        self.predict_progress_bar = self.init_predict_tqdm()
-        self.predict_progress_bar.total = convert_inf(self.total_predict_batches)
+        with self._render_lock:
+            self.predict_progress_bar = self.init_predict_tqdm()
+            self.predict_progress_bar.total = convert_inf(self.total_predict_batches)
 
     def on_predict_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
         super().on_predict_batch_end(trainer, pl_module, outputs, batch, batch_idx, dataloader_idx)
-        if self._should_update(self.predict_batch_idx, self.total_predict_batches):
+        if self.refresh_interval is None and self._should_update(self.predict_batch_idx, self.total_predict_batches):
             self._update_bar(self.predict_progress_bar)
 
     def on_predict_end(self, trainer, pl_module):
-        self.predict_progress_bar.close()
+        with self._render_lock:
+            self._render()
+            self.predict_progress_bar.close()
 
     def print(
         self, *args, sep: str = " ", end: str = os.linesep, file: Optional[io.TextIOBase] = None, nolock: bool = False
@@ -309,6 +380,40 @@ class ProgressBar(ProgressBarBase):
             s = sep.join(map(str, args))
             active_progress_bar.write(s, end=end, file=file, nolock=nolock)
 
+    def _render_loop(self) -> None:
+        while not self._render_stop.wait(self.refresh_interval):
+            with self._render_lock:
+                self._render()
+            # the training loop collects the metrics at its next batch
+            self._metrics_requested = True
+
+    def _render(self) -> None:
+        """Moves the bars to the batch counters when ``refresh_interval`` is set.
+
+        Called by the render thread, or by the main thread before a bar is closed, while holding the render lock.
+        """
+        if self.refresh_interval is None:
+            return
+        bars = (
+            (self.main_progress_bar, self._main_bar_n),
+            (self.val_progress_bar, self.val_batch_idx),
+            (self.test_progress_bar, self.test_batch_idx),
+            (self.predict_progress_bar, self.predict_batch_idx),
+        )
+        for bar, n in bars:
+            if bar is None or bar.disable:
+                continue
+            if bar.total is not None:
+                n = min(n, bar.total)
+            changed = n != bar.n
+            bar.n = n
+            if bar is self.main_progress_bar and self._metrics is not None:
+                metrics, self._metrics = self._metrics, None
+                bar.set_postfix(metrics, refresh=False)
+                changed = True
+            if changed:
+                bar.refresh()
+
     def _should_update(self, current, total) -> bool:
         return self.is_enabled and (current % self.refresh_rate == 0 or current == total)
 
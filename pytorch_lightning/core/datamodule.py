@@ -15,7 +15,7 @@
 
 import functools
 from argparse import ArgumentParser, Namespace
-from typing import Any, List, Mapping, Optional, Sequence, Tuple, Union
+from typing import Any, Callable, List, Mapping, Optional, Sequence, Tuple, TypeVar, Union
 
 from torch.utils.data import DataLoader, Dataset, IterableDataset
 
@@ -23,6 +23,9 @@ from pytorch_lightning.core.hooks import CheckpointHooks, DataHooks
 from pytorch_lightning.core.mixins import HyperparametersMixin
 from pytorch_lightning.utilities import rank_zero_deprecation
 from pytorch_lightning.utilities.argparse import add_argparse_args, from_argparse_args, get_init_arguments_and_types
+from pytorch_lightning.utilities.shared_memory import share_on_node
+
+T = TypeVar("T")
 
 
 class LightningDataModule(CheckpointHooks, DataHooks, HyperparametersMixin):
@@ -417,6 +420,26 @@ class LightningDataModule(CheckpointHooks, DataHooks, HyperparametersMixin):
             datamodule.test_dataloader = test_dataloader
         return datamodule
 
+    def share_on_node(self, name: str, fn: Callable[[], T]) -> T:
+        """Builds data in :meth:`setup` on the local rank 0 of each node only and shares its tensors and NumPy arrays
+        with the other processes of the node, so that a node holds a single copy of them instead of one per process.
+
+        See :func:`~pytorch_lightning.utilities.shared_memory.share_on_node`.
+
+        Args:
+            name: The name of the data, unique among the calls of this method within a run.
+            fn: Builds the data, called on the local rank 0 of each node.
+
+        Example::
+
+            def setup(self, stage):
+                features, labels = self.share_on_node("train", lambda: preprocess(self.data_dir))
+                self.train_dataset = TensorDataset(features, labels)
+        """
+        if self.trainer is None:
+            return fn()
+        return share_on_node(self.trainer.training_type_plugin, name, fn)
+
     def __new__(cls, *args: Any, **kwargs: Any) -> "LightningDataModule":
         obj = super().__new__(cls)
         # track `DataHooks` calls
@@ -41,6 +41,7 @@ from pytorch_lightning.utilities import rank_zero_deprecation, rank_zero_warn
 from pytorch_lightning.utilities.apply_func import apply_to_collection, convert_to_tensors
 from pytorch_lightning.utilities.cloud_io import get_filesystem
 from pytorch_lightning.utilities.distributed import distributed_available, sync_ddp
+from pytorch_lightning.utilities.epoch_outputs import EpochOutputReducer
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.memory import get_model_size_mb
 from pytorch_lightning.utilities.model_summary import ModelSummary, summarize
@@ -1218,6 +1219,46 @@ class LightningModule(
         """
         return []
 
+    def configure_epoch_output_reducers(self) -> Optional[Dict[str, Union[str, EpochOutputReducer]]]:
+        """
+        Configure how the step outputs are accumulated for :meth:`training_epoch_end`,
+        :meth:`validation_epoch_end` and :meth:`test_epoch_end`.
+
+        By default, the output of every step is kept until the end of the epoch, so the memory used grows with the
+        number of steps. When a reducer is declared for each key of the step outputs, the outputs are instead folded
+        as they are produced and the ``*_epoch_end`` hooks receive a dictionary with the reduced value of each key,
+        per dataloader or optimizer when there are several. The keys without a reducer are dropped.
+
+        The available reducers are:
+
+        - ``"sum"``: the sum of the values, kept on their device.
+        - ``"mean"``: the mean of the values of the steps, kept on their device.
+        - ``"cat"``: the values concatenated along their first dimension, moved to CPU as they are produced.
+        - ``"disk"``: the values concatenated along their first dimension, written to a temporary file as they are
+          produced and returned as a memory-mapped tensor.
+
+        An instance of a subclass of :class:`~pytorch_lightning.utilities.epoch_outputs.EpochOutputReducer` can
+        also be used.
+
+        Return:
+            A dictionary mapping the keys of the step outputs to their reducer, or ``None`` to keep every step output.
+
+        Example::
+
+            def validation_step(self, batch, batch_idx):
+                x, y = batch
+                logits = self(x)
+                return {"loss": F.cross_entropy(logits, y), "preds": logits.argmax(-1)}
+
+            def configure_epoch_output_reducers(self):
+                return {"loss": "mean", "preds": "cat"}
+
+            def validation_epoch_end(self, outputs):
+                self.log("val_loss", outputs["loss"])
+                histogram = torch.bincount(outputs["preds"])
+        """
+        return None
+
     def configure_optimizers(self):
         r"""
         Choose what optimizers and learning-rate schedulers to use in your optimization.
@@ -48,6 +48,15 @@ class ModelIO:
     CHECKPOINT_HYPER_PARAMS_KEY = "hyper_parameters"
     CHECKPOINT_HYPER_PARAMS_NAME = "hparams_name"
     CHECKPOINT_HYPER_PARAMS_TYPE = "hparams_type"
+    # only required to resume training, these keys can be skipped by ``load_from_checkpoint``
+    CHECKPOINT_TRAINING_STATE_KEYS = (
+        "optimizer_states",
+        "lr_schedulers",
+        "callbacks",
+        "loops",
+        "native_amp_scaling_state",
+        "amp_scaling_state",
+    )
 
     @classmethod
     def load_from_checkpoint(
@@ -56,6 +65,7 @@ class ModelIO:
         map_location: Optional[Union[Dict[str, str], str, torch.device, int, Callable]] = None,
         hparams_file: Optional[str] = None,
         strict: bool = True,
+        skip_training_state: bool = False,
         **kwargs,
     ):
         r"""
@@ -89,6 +99,9 @@ class ModelIO:
                 `hparams` as :class:`~dict`.
             strict: Whether to strictly enforce that the keys in :attr:`checkpoint_path` match the keys
                 returned by this module's state dict. Default: `True`.
+            skip_training_state: Whether to skip the training state stored under the keys listed in
+                ``CHECKPOINT_TRAINING_STATE_KEYS`` (optimizer states, callbacks, loops, ...). Its tensors are then never
+                read from the checkpoint file and ``on_load_checkpoint`` does not receive it. Default: `False`.
             kwargs: Any extra keyword args needed to init the model. Can also be used to override saved
                 hyperparameter values.
 
@@ -125,10 +138,11 @@ class ModelIO:
             pretrained_model.freeze()
             y_hat = pretrained_model(x)
         """
+        skip_keys = cls.CHECKPOINT_TRAINING_STATE_KEYS if skip_training_state else None
         if map_location is not None:
-            checkpoint = pl_load(checkpoint_path, map_location=map_location)
+            checkpoint = pl_load(checkpoint_path, map_location=map_location, skip_keys=skip_keys)
         else:
-            checkpoint = pl_load(checkpoint_path, map_location=lambda storage, loc: storage)
+            checkpoint = pl_load(checkpoint_path, map_location=lambda storage, loc: storage, skip_keys=skip_keys)
 
         if hparams_file is not None:
             extension = hparams_file.split(".")[-1]
@@ -22,7 +22,7 @@ import csv
 import logging
 import os
 from argparse import Namespace
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import torch
 
@@ -41,6 +41,9 @@ class ExperimentWriter:
     Currently supports to log hyperparameters and metrics in YAML and CSV
     format, respectively.
 
+    Metrics are buffered in memory until :meth:`save` is called, which appends them to the CSV file.
+    The file is only rewritten when new metric keys show up, so that the header gains the new columns.
+
     Args:
         log_dir: Directory for the experiment logs
     """
@@ -51,6 +54,8 @@ class ExperimentWriter:
     def __init__(self, log_dir: str) -> None:
         self.hparams = {}
         self.metrics = []
+        self.metrics_keys: List[str] = []
+        self._num_logged = 0
 
         self.log_dir = log_dir
         if os.path.exists(self.log_dir) and os.listdir(self.log_dir):
@@ -75,29 +80,57 @@ class ExperimentWriter:
             return value
 
         if step is None:
-            step = len(self.metrics)
+            step = self._num_logged
 
         metrics = {k: _handle_value(v) for k, v in metrics_dict.items()}
         metrics["step"] = step
         self.metrics.append(metrics)
+        self._num_logged += 1
 
     def save(self) -> None:
-        """Save recorded hparams and metrics into files"""
+        """Save recorded hparams and append the buffered metrics to the metrics file"""
         hparams_file = os.path.join(self.log_dir, self.NAME_HPARAMS_FILE)
         save_hparams_to_yaml(hparams_file, self.hparams)
 
         if not self.metrics:
             return
 
-        last_m = {}
-        for m in self.metrics:
-            last_m.update(m)
-        metrics_keys = list(last_m.keys())
+        is_first_save = not self.metrics_keys
+        new_keys = self._record_new_keys()
+        if is_first_save:
+            self._write_rows(mode="w")
+        elif new_keys:
+            self._rewrite_with_new_header()
+        else:
+            self._write_rows(mode="a")
 
-        with open(self.metrics_file_path, "w", newline="") as f:
-            self.writer = csv.DictWriter(f, fieldnames=metrics_keys)
-            self.writer.writeheader()
-            self.writer.writerows(self.metrics)
+        self.metrics = []
+
+    def _record_new_keys(self) -> List[str]:
+        new_keys = []
+        for m in self.metrics:
+            for k in m:
+                if k not in self.metrics_keys and k not in new_keys:
+                    new_keys.append(k)
+        self.metrics_keys.extend(new_keys)
+        return new_keys
+
+    def _write_rows(self, mode: str) -> None:
+        with open(self.metrics_file_path, mode, newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=self.metrics_keys)
+            if mode == "w":
+                writer.writeheader()
+            writer.writerows(self.metrics)
+
+    def _rewrite_with_new_header(self) -> None:
+        # stream the previous rows into a new file with the extended header to keep the memory bounded
+        tmp_path = self.metrics_file_path + ".part"
+        with open(self.metrics_file_path, newline="") as src, open(tmp_path, "w", newline="") as dst:
+            writer = csv.DictWriter(dst, fieldnames=self.metrics_keys)
+            writer.writeheader()
+            writer.writerows(csv.DictReader(src))
+            writer.writerows(self.metrics)
+        os.replace(tmp_path, self.metrics_file_path)
 
 
 class CSVLogger(LightningLoggerBase):
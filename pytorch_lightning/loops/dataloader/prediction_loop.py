@@ -1,11 +1,14 @@
-from typing import Any, List, Optional, Sequence, Union
+from typing import Any, List, Mapping, Optional, Sequence, Tuple, Union
 
+import torch
 from deprecate.utils import void
 from torch.utils.data import DataLoader
 
 from pytorch_lightning.loops.dataloader.dataloader_loop import DataLoaderLoop
 from pytorch_lightning.loops.epoch.prediction_epoch_loop import PredictionEpochLoop
+from pytorch_lightning.overrides.distributed import IndexBatchSamplerWrapper
 from pytorch_lightning.plugins import DDPSpawnPlugin
+from pytorch_lightning.utilities.data import BucketBatchSampler
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.types import _PREDICT_OUTPUT
 
@@ -91,6 +94,14 @@ class PredictionLoop(DataLoaderLoop):
         dl_predictions, dl_batch_indices = self.epoch_loop.run(
             dataloader_iter, self.current_dataloader_idx, dl_max_batches, self.num_dataloaders, self.return_predictions
         )
+        batch_sampler = getattr(self.current_dataloader, "batch_sampler", None)
+        if (
+            dl_batch_indices
+            and isinstance(batch_sampler, IndexBatchSamplerWrapper)
+            and isinstance(batch_sampler._sampler, BucketBatchSampler)
+        ):
+            # the batches were formed from the samples sorted by length
+            dl_predictions, dl_batch_indices = _restore_sample_order(dl_predictions, dl_batch_indices)
         self.predictions.append(dl_predictions)
         self.epoch_batch_indices.append(dl_batch_indices)
 
@@ -139,3 +150,35 @@ class PredictionLoop(DataLoaderLoop):
         """Calls ``on_predict_model_eval`` hook"""
         model_ref = self.trainer.lightning_module
         model_ref.on_predict_model_eval()
+
+
+def _restore_sample_order(predictions: List[Any], batch_indices: List[List[int]]) -> Tuple[List[Any], List[List[int]]]:
+    """Splits the predictions of each batch per sample and sorts them by dataset index.
+
+    Returns:
+        the predictions of each sample and their indices, each as a batch of one
+    """
+    samples = []
+    for prediction, indices in zip(predictions, batch_indices):
+        samples.extend(zip(indices, _unbind(prediction, len(indices))))
+    samples.sort(key=lambda x: x[0])
+    return [prediction for _, prediction in samples], [[idx] for idx, _ in samples]
+
+
+def _unbind(prediction: Any, batch_size: int) -> List[Any]:
+    """Splits the prediction of a batch along the first dimension of its tensors."""
+    if isinstance(prediction, torch.Tensor) and prediction.ndim > 0 and len(prediction) == batch_size:
+        return list(prediction)
+    if isinstance(prediction, Mapping):
+        values = {k: _unbind(v, batch_size) for k, v in prediction.items()}
+        return [type(prediction)({k: v[i] for k, v in values.items()}) for i in range(batch_size)]
+    if isinstance(prediction, (list, tuple)):
+        values = [_unbind(v, batch_size) for v in prediction]
+        is_namedtuple = isinstance(prediction, tuple) and hasattr(prediction, "_fields")
+        if is_namedtuple:
+            return [type(prediction)(*(v[i] for v in values)) for i in range(batch_size)]
+        return [type(prediction)(v[i] for v in values) for i in range(batch_size)]
+    raise MisconfigurationException(
+        "The predictions of a dataloader using a `BucketBatchSampler` are returned per sample, which requires them to"
+        f" be tensors or collections of tensors with a first dimension of the batch size, got {prediction!r}."
+    )
@@ -20,7 +20,9 @@ from torch import Tensor
 
 from pytorch_lightning.loops.base import Loop
 from pytorch_lightning.trainer.progress import Progress
+from pytorch_lightning.utilities.epoch_outputs import _EpochOutputReduction
 from pytorch_lightning.utilities.memory import recursive_detach
+from pytorch_lightning.utilities.model_helpers import is_overridden
 from pytorch_lightning.utilities.types import STEP_OUTPUT
 
 
@@ -37,6 +39,8 @@ class EvaluationEpochLoop(Loop):
         self._num_dataloaders: Optional[int] = None
         self.outputs: List[STEP_OUTPUT] = []
         self.batch_progress = Progress()
+        self._should_track_outputs: bool = False
+        self._output_reduction: Optional[_EpochOutputReduction] = None
 
     @property
     def done(self) -> bool:
@@ -70,6 +74,12 @@ class EvaluationEpochLoop(Loop):
         self._dl_max_batches = dl_max_batches
         self._num_dataloaders = num_dataloaders
 
+        model = self.trainer.lightning_module
+        epoch_end_fx = "test_epoch_end" if self.trainer.testing else "validation_epoch_end"
+        # the outputs are only needed by the epoch end hook
+        self._should_track_outputs = is_overridden(epoch_end_fx, model)
+        self._output_reduction = _EpochOutputReduction.from_module(model) if self._should_track_outputs else None
+
     def advance(
         self, dataloader_iter: Iterator, dataloader_idx: int, dl_max_batches: int, num_dataloaders: int
     ) -> None:
@@ -119,11 +129,14 @@ class EvaluationEpochLoop(Loop):
         # track epoch level outputs
         self.outputs = self._track_output_for_epoch_end(self.outputs, output)
 
-    def on_run_end(self) -> List[STEP_OUTPUT]:
-        """Returns the outputs of the whole run"""
+    def on_run_end(self) -> Union[List[STEP_OUTPUT], Dict[str, Any]]:
+        """Returns the outputs of the whole run, reduced if the model configured reducers"""
         outputs = self.outputs
+        if self._output_reduction is not None:
+            outputs = self._output_reduction.compute()
         # free memory
         self.outputs = []
+        self._output_reduction = None
         return outputs
 
     def evaluation_step(self, batch: Any, batch_idx: int, dataloader_idx: int) -> Optional[STEP_OUTPUT]:
@@ -222,6 +235,12 @@ class EvaluationEpochLoop(Loop):
     def _track_output_for_epoch_end(
         self, outputs: List[STEP_OUTPUT], output: Optional[STEP_OUTPUT]
     ) -> List[STEP_OUTPUT]:
+        if not self._should_track_outputs:
+            return outputs
+        if self._output_reduction is not None:
+            # fold the output instead of keeping it until the end of the epoch
+            self._output_reduction.update(output)
+            return outputs
         if output is not None:
             if isinstance(output, dict):
                 output = recursive_detach(output, to_cpu=self.trainer.move_metrics_to_cpu)
@@ -19,6 +19,7 @@ from pytorch_lightning import loops  # import as loops to avoid circular imports
 from pytorch_lightning.loops.batch import TrainingBatchLoop
 from pytorch_lightning.trainer.connectors.logger_connector.result import ResultCollection
 from pytorch_lightning.trainer.progress import Progress, SchedulerProgress
+from pytorch_lightning.utilities.epoch_outputs import _EpochOutputReduction
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.model_helpers import is_overridden
 from pytorch_lightning.utilities.types import STEP_OUTPUT
@@ -52,6 +53,8 @@ class TrainingEpochLoop(loops.Loop):
         self._dataloader_idx: Optional[int] = None
         self._warning_cache: WarningCache = WarningCache()
         self._epoch_output: Optional[List[List[STEP_OUTPUT]]] = None
+        # the reduction of the outputs of each optimizer, when the model configured reducers
+        self._output_reductions: Optional[List[_EpochOutputReduction]] = None
 
     @property
     def batch_idx(self) -> int:
@@ -84,7 +87,14 @@ class TrainingEpochLoop(loops.Loop):
         self._dataloader_idx = 0
 
         # track epoch output
-        self._epoch_output = [[] for _ in range(self.batch_loop.num_active_optimizers(self.total_batch_idx))]
+        num_optimizers = self.batch_loop.num_active_optimizers(self.total_batch_idx)
+        self._epoch_output = [[] for _ in range(num_optimizers)]
+        self._output_reductions = None
+        model = self.trainer.lightning_module
+        if is_overridden("training_epoch_end", model):
+            reductions = [_EpochOutputReduction.from_module(model) for _ in range(num_optimizers)]
+            if reductions and reductions[0] is not None:
+                self._output_reductions = reductions
 
         if not self.restarting:
             self.batch_progress.current.reset()
@@ -201,7 +211,13 @@ class TrainingEpochLoop(loops.Loop):
         self.trainer.logger_connector.epoch_end_reached()
 
         # prepare epoch output
-        processed_outputs = self._prepare_outputs(self._epoch_output, batch_mode=False)
+        if self._output_reductions is not None:
+            processed_outputs = [reduction.compute() for reduction in self._output_reductions]
+            # if there is only one optimiser then we collapse that dimension
+            if len(processed_outputs) == 1:
+                processed_outputs = processed_outputs[0]
+        else:
+            processed_outputs = self._prepare_outputs(self._epoch_output, batch_mode=False)
 
         # get the model and call model.training_epoch_end
         model = self.trainer.lightning_module
@@ -233,6 +249,7 @@ class TrainingEpochLoop(loops.Loop):
         epoch_output = self._epoch_output
         # free memory
         self._epoch_output = None
+        self._output_reductions = None
         return epoch_output
 
     def teardown(self) -> None:
@@ -273,6 +290,15 @@ class TrainingEpochLoop(loops.Loop):
         if not hook_overridden:
             return
 
+        if self._output_reductions is not None:
+            # fold the outputs instead of keeping them until the end of the epoch
+            for opt_idx, opt_outputs in enumerate(batch_end_outputs):
+                for tbptt_output in opt_outputs:
+                    out = {"loss": tbptt_output.minimize} if tbptt_output.minimize is not None else {}
+                    out.update(tbptt_output.extra)
+                    self._output_reductions[opt_idx].update(out)
+            return
+
         # track the outputs to reduce at the end of the epoch
         for opt_idx, opt_outputs in enumerate(batch_end_outputs):
             # with 1 step (no tbptt) don't use a sequence at epoch end
@@ -1,5 +1,8 @@
 from pytorch_lightning.plugins.base_plugin import Plugin
+from pytorch_lightning.plugins.io.async_plugin import AsyncCheckpointIO
 from pytorch_lightning.plugins.io.checkpoint_plugin import CheckpointIO
+from pytorch_lightning.plugins.io.delta_plugin import DeltaCheckpointIO
+from pytorch_lightning.plugins.io.sharded_plugin import ShardedCheckpointIO
 from pytorch_lightning.plugins.io.torch_plugin import TorchCheckpointIO
 from pytorch_lightning.plugins.plugins_registry import (  # noqa: F401
     call_training_type_register_plugins,
@@ -31,7 +34,10 @@ from pytorch_lightning.plugins.training_type.tpu_spawn import TPUSpawnPlugin
 from pytorch_lightning.plugins.training_type.training_type_plugin import TrainingTypePlugin
 
 __all__ = [
+    "AsyncCheckpointIO",
     "CheckpointIO",
+    "DeltaCheckpointIO",
+    "ShardedCheckpointIO",
     "TorchCheckpointIO",
     "ApexMixedPrecisionPlugin",
     "DataParallelPlugin",
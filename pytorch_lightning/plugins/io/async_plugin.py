@@ -0,0 +1,119 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+import torch
+
+from pytorch_lightning.plugins.io.checkpoint_plugin import CheckpointIO
+from pytorch_lightning.plugins.io.torch_plugin import TorchCheckpointIO
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.utilities.types import _PATH
+
+
+class AsyncCheckpointIO(CheckpointIO):
+    """
+    CheckpointIO that saves checkpoints in a background thread so training is not blocked by serialization and
+    file-writes.
+
+    The tensors of the checkpoint are first copied to CPU on the calling thread, so the training loop can keep
+    updating the weights while the snapshot is written by the wrapped ``checkpoint_io``.
+
+    Example::
+
+        Trainer(plugins=[AsyncCheckpointIO()])
+
+    Args:
+        checkpoint_io: The ``CheckpointIO`` used to write the checkpoints. Defaults to ``TorchCheckpointIO``.
+        max_pending_saves: Maximum number of saves in flight. When reached, ``save_checkpoint`` blocks until the
+            oldest save completes. Keep it at ``1`` when ``ModelCheckpoint`` removes previous checkpoints so a file
+            is never removed before it has been written.
+        pin_memory: Whether to copy CUDA tensors into pinned memory with non-blocking transfers.
+    """
+
+    def __init__(
+        self, checkpoint_io: Optional[CheckpointIO] = None, max_pending_saves: int = 1, pin_memory: bool = False
+    ) -> None:
+        if max_pending_saves < 1:
+            raise MisconfigurationException(f"`max_pending_saves` should be at least 1, got {max_pending_saves}.")
+        self.checkpoint_io = checkpoint_io if checkpoint_io is not None else TorchCheckpointIO()
+        self.max_pending_saves = max_pending_saves
+        self.pin_memory = pin_memory
+
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = threading.BoundedSemaphore(max_pending_saves)
+        self._futures: List[Future] = []
+        self._error: Optional[BaseException] = None
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        self._raise_if_failed()
+        checkpoint = self._snapshot(checkpoint)
+
+        # bound the number of checkpoints held in memory
+        self._slots.acquire()
+        if self._executor is None:
+            # a single worker keeps the writes ordered
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="AsyncCheckpointIO")
+        future = self._executor.submit(self.checkpoint_io.save_checkpoint, checkpoint, path, storage_options)
+        future.add_done_callback(self._on_save_done)
+        self._futures = [f for f in self._futures if not f.done()] + [future]
+
+    def load_checkpoint(self, path: _PATH, storage_options: Optional[Any] = None) -> Dict[str, Any]:
+        # the checkpoint might still be in flight
+        self.wait()
+        return self.checkpoint_io.load_checkpoint(path, storage_options=storage_options)
+
+    def wait(self) -> None:
+        """Blocks until all the pending saves are written and re-raises the first error that occurred."""
+        for future in self._futures:
+            # errors are recorded by ``_on_save_done``
+            future.exception()
+        self._futures = []
+        self._raise_if_failed()
+
+    def teardown(self) -> None:
+        try:
+            self.wait()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def _snapshot(self, checkpoint: Dict[str, Any]) -> Dict[str, Any]:
+        def to_cpu(tensor: torch.Tensor) -> torch.Tensor:
+            tensor = tensor.detach()
+            if tensor.device.type == "cpu":
+                return tensor.clone()
+            if self.pin_memory:
+                buffer = torch.empty(tensor.shape, dtype=tensor.dtype, layout=tensor.layout, pin_memory=True)
+                return buffer.copy_(tensor, non_blocking=True)
+            return tensor.cpu()
+
+        checkpoint = apply_to_collection(checkpoint, torch.Tensor, to_cpu)
+        if self.pin_memory and torch.cuda.is_available():
+            # the non-blocking copies need to be finished before the writer thread reads the buffers
+            torch.cuda.synchronize()
+        return checkpoint
+
+    def _on_save_done(self, future: Future) -> None:
+        self._slots.release()
+        if future.exception() is not None and self._error is None:
+            self._error = future.exception()
+
+    def _raise_if_failed(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise RuntimeError("An error occurred while saving a checkpoint asynchronously.") from error
@@ -14,6 +14,7 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
+import pytorch_lightning as pl
 from pytorch_lightning.utilities.types import _PATH
 
 
@@ -34,6 +35,9 @@ class CheckpointIO(ABC):
 
     """
 
+    # key of the loaded checkpoint listing the top-level keys which hold a list with the state saved by every rank
+    RANK_LOCAL_KEYS = "rank_local_keys"
+
     @abstractmethod
     def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
         """Save model/training states as a checkpoint file through state-dump and file-write.
@@ -55,3 +59,31 @@ class CheckpointIO(ABC):
 
         Returns: The loaded checkpoint.
         """
+
+    @property
+    def saves_rank_local_states(self) -> bool:
+        """Whether :meth:`save_rank_checkpoint` saves the states of every rank, so that the training type plugins
+        sharding their states across the ranks do not need to gather them on a single rank first."""
+        return False
+
+    def save_rank_checkpoint(
+        self, checkpoint: Dict[str, Any], path: _PATH, training_type_plugin: "pl.plugins.ParallelPlugin"
+    ) -> None:
+        """Called on every rank of a parallel training type plugin to save the checkpoint. By default, only the rank
+        which should save the checkpoint writes it.
+
+        When :attr:`saves_rank_local_states` is enabled, the keys listed by
+        :attr:`~pytorch_lightning.plugins.training_type.ParallelPlugin.rank_local_checkpoint_keys` hold a different
+        state on every rank and all of them need to be saved. When loading, each of these keys holds the list of the
+        states saved by every rank, and the checkpoint lists these keys under ``RANK_LOCAL_KEYS``.
+
+        Args:
+            checkpoint: dict containing model and trainer state
+            path: write-target path
+            training_type_plugin: the plugin the processes are synchronized with
+        """
+        if training_type_plugin.should_rank_save_checkpoint:
+            self.save_checkpoint(checkpoint, path)
+
+    def teardown(self) -> None:
+        """This method is called to teardown the process and release any pending save."""
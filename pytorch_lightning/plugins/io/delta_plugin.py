@@ -0,0 +1,228 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import json
+import os
+import uuid
+from collections import defaultdict
+from typing import Any, Callable, Dict, NamedTuple, Optional, Set
+
+import torch
+
+from pytorch_lightning.plugins.io.checkpoint_plugin import CheckpointIO
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.cloud_io import atomic_save, get_filesystem
+from pytorch_lightning.utilities.cloud_io import load as pl_load
+from pytorch_lightning.utilities.types import _PATH
+
+
+class _TensorBlob(NamedTuple):
+    """Placeholder stored in a delta checkpoint for a tensor written to a pack file."""
+
+    pack: str
+    digest: str
+
+
+class DeltaCheckpointIO(CheckpointIO):
+    """
+    CheckpointIO that only writes the tensors which changed since the previous checkpoint.
+
+    Each tensor is content-hashed. New or modified tensors are written together in a pack file under
+    ``<checkpoint dir>/.blobs`` while unchanged tensors, such as frozen, pruned or quantized layers, reference the pack
+    written by a previous checkpoint. Quantized tensors are hashed with their quantization parameters, sparse tensors
+    by their indices and values. The checkpoint file itself only holds the checkpoint structure. The first checkpoint
+    saved by a process contains all the tensors and acts as the base of the following ones.
+
+    Delta checkpoints need to be loaded through this plugin, or be turned into a standalone checkpoint with
+    :meth:`consolidate`. The delta checkpoints written to a directory are listed in ``.blobs/manifest.json``. Packs
+    which are no longer referenced by any of them, e.g. after ``ModelCheckpoint`` removed older checkpoints, are
+    removed by :meth:`compact`.
+
+    Example::
+
+        Trainer(callbacks=ModelCheckpoint(every_n_train_steps=100), plugins=[DeltaCheckpointIO()])
+
+    Args:
+        compact_on_teardown: Whether to call :meth:`compact` on the checkpoint directories at the end of the run.
+            Compacting reads every checkpoint listed in the manifest and rewrites the packs which are partly
+            referenced, so it is disabled by default.
+    """
+
+    BLOBS_DIR = ".blobs"
+    MANIFEST = "manifest.json"
+
+    def __init__(self, compact_on_teardown: bool = False) -> None:
+        self.compact_on_teardown = compact_on_teardown
+        # for each blobs directory, the pack holding each tensor digest already written
+        self._index: Dict[str, Dict[str, str]] = defaultdict(dict)
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        blobs_dir = self._blobs_dir(path)
+        index = self._index[blobs_dir]
+        pack = f"{os.path.basename(str(path))}-{uuid.uuid4().hex[:8]}.pack"
+        new_blobs = {}
+
+        def to_blob(tensor: torch.Tensor) -> _TensorBlob:
+            digest = _digest(tensor)
+            if digest not in index and digest not in new_blobs:
+                new_blobs[digest] = tensor
+            return _TensorBlob(index.get(digest, pack), digest)
+
+        delta = apply_to_collection(checkpoint, torch.Tensor, to_blob)
+        if new_blobs:
+            get_filesystem(blobs_dir).makedirs(blobs_dir, exist_ok=True)
+            atomic_save(new_blobs, os.path.join(blobs_dir, pack))
+            index.update(dict.fromkeys(new_blobs, pack))
+        atomic_save({"delta_checkpoint": delta}, path)
+        self._write_manifest(blobs_dir, self._read_manifest(blobs_dir) | {os.path.basename(str(path))})
+
+    def load_checkpoint(
+        self,
+        path: _PATH,
+        map_location: Optional[Callable] = lambda storage, loc: storage,
+        storage_options: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """Loads a checkpoint and reads the tensors it references from the pack files. Checkpoints which are not
+        delta checkpoints are loaded with :func:`torch.load`.
+
+        Args:
+            path: Path to checkpoint
+            map_location: a function, :class:`torch.device`, string or a dict specifying how to remap storage
+            locations.
+            storage_options: Optional parameters when loading the model/training states, unused.
+
+        Returns: The loaded checkpoint.
+        """
+        checkpoint = pl_load(path, map_location=map_location)
+        if not isinstance(checkpoint, dict) or "delta_checkpoint" not in checkpoint:
+            return checkpoint
+        delta = checkpoint["delta_checkpoint"]
+        blobs_dir = self._blobs_dir(path)
+        packs = {blob.pack for blob in self._collect_blobs(delta)}
+        packs = {pack: pl_load(os.path.join(blobs_dir, pack), map_location=map_location) for pack in packs}
+        return apply_to_collection(delta, _TensorBlob, lambda blob: packs[blob.pack][blob.digest])
+
+    def consolidate(self, path: _PATH, output_path: _PATH) -> None:
+        """Writes the delta checkpoint at ``path`` as a standalone checkpoint to ``output_path``."""
+        atomic_save(self.load_checkpoint(path), output_path)
+
+    def compact(self, dirpath: _PATH) -> None:
+        """Removes the pack files and the tensors of a pack which are not referenced by any delta checkpoint of
+        ``dirpath``.
+
+        Only the checkpoints listed in the manifest are read, the ones which no longer exist are removed from it.
+        """
+        fs = get_filesystem(dirpath)
+        blobs_dir = os.path.join(str(dirpath), self.BLOBS_DIR)
+        if not fs.isdir(blobs_dir):
+            return
+
+        referenced: Dict[str, Set[str]] = defaultdict(set)
+        checkpoints = set()
+        for name in self._read_manifest(blobs_dir):
+            path = os.path.join(str(dirpath), name)
+            if not fs.exists(path):
+                continue
+            checkpoint = pl_load(path, map_location="cpu")
+            if not isinstance(checkpoint, dict) or "delta_checkpoint" not in checkpoint:
+                # overwritten by a checkpoint saved without this plugin
+                continue
+            checkpoints.add(name)
+            for blob in self._collect_blobs(checkpoint["delta_checkpoint"]):
+                referenced[blob.pack].add(blob.digest)
+        self._write_manifest(blobs_dir, checkpoints)
+
+        index = self._index[blobs_dir]
+        for pack_path in fs.ls(blobs_dir, detail=False):
+            pack = os.path.basename(pack_path)
+            if not pack.endswith(".pack"):
+                continue
+            if pack not in referenced:
+                fs.rm(pack_path)
+                stale = [digest for digest, p in index.items() if p == pack]
+            else:
+                blobs = pl_load(pack_path, map_location="cpu")
+                if len(blobs) == len(referenced[pack]):
+                    continue
+                atomic_save({digest: blobs[digest] for digest in referenced[pack]}, pack_path)
+                stale = [digest for digest in blobs if digest not in referenced[pack]]
+            for digest in stale:
+                index.pop(digest, None)
+
+    def teardown(self) -> None:
+        if self.compact_on_teardown:
+            for blobs_dir in self._index:
+                self.compact(os.path.dirname(blobs_dir))
+
+    def _blobs_dir(self, path: _PATH) -> str:
+        return os.path.join(os.path.dirname(str(path)), self.BLOBS_DIR)
+
+    def _read_manifest(self, blobs_dir: str) -> Set[str]:
+        fs = get_filesystem(blobs_dir)
+        manifest = os.path.join(blobs_dir, self.MANIFEST)
+        if not fs.exists(manifest):
+            return set()
+        with fs.open(manifest, "r") as f:
+            return set(json.load(f))
+
+    def _write_manifest(self, blobs_dir: str, checkpoints: Set[str]) -> None:
+        fs = get_filesystem(blobs_dir)
+        fs.makedirs(blobs_dir, exist_ok=True)
+        manifest = os.path.join(blobs_dir, self.MANIFEST)
+        # swap in the complete manifest, as `atomic_save` does for the checkpoints
+        tmp_manifest = f"{manifest}.part"
+        try:
+            with fs.open(tmp_manifest, "w") as f:
+                json.dump(sorted(checkpoints), f)
+            fs.mv(tmp_manifest, manifest)
+        finally:
+            if fs.exists(tmp_manifest):
+                fs.rm(tmp_manifest)
+
+    @staticmethod
+    def _collect_blobs(delta: Dict[str, Any]) -> Set[_TensorBlob]:
+        blobs = set()
+        apply_to_collection(delta, _TensorBlob, blobs.add)
+        return blobs
+
+
+def _digest(tensor: torch.Tensor) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    _update_digest(h, tensor.detach().cpu())
+    return h.hexdigest()
+
+
+def _update_digest(h: "hashlib.blake2b", tensor: torch.Tensor) -> None:
+    h.update(f"{tensor.layout}{tensor.dtype}{tuple(tensor.shape)}".encode())
+    if tensor.is_quantized:
+        qscheme = tensor.qscheme()
+        h.update(str(qscheme).encode())
+        if qscheme in (torch.per_tensor_affine, torch.per_tensor_symmetric):
+            h.update(f"{tensor.q_scale()!r}{tensor.q_zero_point()}".encode())
+        else:
+            h.update(str(tensor.q_per_channel_axis()).encode())
+            _update_digest(h, tensor.q_per_channel_scales())
+            _update_digest(h, tensor.q_per_channel_zero_points())
+        _update_digest(h, tensor.int_repr())
+        return
+    if tensor.is_sparse:
+        # the same values can be stored in any order and with duplicated indices until coalesced
+        tensor = tensor.coalesce()
+        _update_digest(h, tensor.indices())
+        _update_digest(h, tensor.values())
+        return
+    if tensor.dtype == torch.bfloat16:
+        # not supported by numpy, the conversion is lossless
+        tensor = tensor.float()
+    h.update(tensor.contiguous().numpy().data)
@@ -0,0 +1,201 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import hashlib
+import os
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import torch
+
+import pytorch_lightning as pl
+from pytorch_lightning.plugins.io.checkpoint_plugin import CheckpointIO
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.cloud_io import atomic_save, get_filesystem
+from pytorch_lightning.utilities.cloud_io import load as pl_load
+from pytorch_lightning.utilities.types import _PATH
+
+
+class _ShardedTensor(NamedTuple):
+    """Placeholder stored in the manifest for a tensor written to a shard file."""
+
+    shard: int
+    key: int
+
+
+class ShardedCheckpointIO(CheckpointIO):
+    """
+    CheckpointIO that saves each checkpoint as a directory of shard files, so that every rank writes a part of the
+    checkpoint concurrently instead of funnelling the whole state through the global zero process.
+
+    The directory contains a ``manifest.ckpt`` file, holding the checkpoint with each tensor replaced by a reference
+    to its shard, and one ``shard-{rank}-of-{num_shards}.ckpt`` file per rank. The tensors are split across the
+    ranks so that each rank writes a similar number of bytes.
+
+    The states which differ on every rank, like the optimizer states partitioned by the sharded training type plugins,
+    are not gathered on a single rank: every rank writes its own in a ``rank-{rank}-of-{world_size}.ckpt`` file.
+
+    When loading, the shards are read in parallel threads. As every shard listed in the manifest is read, a
+    checkpoint can be restored with any number of processes.
+
+    Example::
+
+        Trainer(accelerator="ddp", gpus=4, plugins=[ShardedCheckpointIO()])
+
+    Args:
+        max_load_workers: Maximum number of threads used to read the shards.
+    """
+
+    MANIFEST_NAME = "manifest.ckpt"
+
+    def __init__(self, max_load_workers: int = 8) -> None:
+        self.max_load_workers = max_load_workers
+
+    @property
+    def saves_rank_local_states(self) -> bool:
+        return True
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], path: _PATH, storage_options: Optional[Any] = None) -> None:
+        self.save_shard(checkpoint, path, global_rank=0, num_shards=1)
+
+    def save_rank_checkpoint(
+        self, checkpoint: Dict[str, Any], path: _PATH, training_type_plugin: "pl.plugins.ParallelPlugin"
+    ) -> None:
+        global_rank, world_size = training_type_plugin.global_rank, training_type_plugin.world_size
+        rank_local_keys = [key for key in training_type_plugin.rank_local_checkpoint_keys if key in checkpoint]
+        shared = {key: value for key, value in checkpoint.items() if key not in rank_local_keys}
+        num_shards = world_size
+        if world_size > 1:
+            # the tensors can only be split across the ranks if all of them hold the same states, otherwise the ones
+            # of the global zero rank are saved as the other checkpoint plugins do
+            signature = self.signature(shared)
+            if not training_type_plugin.reduce_boolean_decision(signature == training_type_plugin.broadcast(signature)):
+                num_shards = 1
+        if global_rank < num_shards:
+            # every rank writes its own shard concurrently
+            self.save_shard(
+                shared,
+                path,
+                global_rank=global_rank,
+                num_shards=num_shards,
+                rank_local_keys=rank_local_keys,
+                num_ranks=world_size,
+            )
+        if rank_local_keys:
+            get_filesystem(path).makedirs(str(path), exist_ok=True)
+            rank_states = {key: checkpoint[key] for key in rank_local_keys}
+            atomic_save(rank_states, os.path.join(path, self._rank_name(global_rank, world_size)))
+        training_type_plugin.barrier("save_rank_checkpoint")
+
+    def save_shard(
+        self,
+        checkpoint: Dict[str, Any],
+        path: _PATH,
+        global_rank: int,
+        num_shards: int,
+        rank_local_keys: Sequence[str] = (),
+        num_ranks: int = 1,
+    ) -> None:
+        """Writes the shard of ``global_rank``. The global zero rank also writes the manifest.
+
+        All ranks need to pass the same checkpoint, as each one of them computes the same split of the tensors. The
+        ``rank_local_keys`` written by each of the ``num_ranks`` ranks are recorded in the manifest.
+        """
+        manifest, shards = self._split(checkpoint, num_shards)
+
+        fs = get_filesystem(path)
+        fs.makedirs(str(path), exist_ok=True)
+        atomic_save(shards[global_rank], os.path.join(path, self._shard_name(global_rank, num_shards)))
+        if global_rank == 0:
+            atomic_save(
+                {
+                    "checkpoint": manifest,
+                    "num_shards": num_shards,
+                    "rank_local_keys": list(rank_local_keys),
+                    "num_ranks": num_ranks,
+                },
+                os.path.join(path, self.MANIFEST_NAME),
+            )
+
+    def load_checkpoint(
+        self,
+        path: _PATH,
+        map_location: Optional[Callable] = lambda storage, loc: storage,
+        storage_options: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """Loads a sharded checkpoint by reading all of its shards in parallel. Checkpoints saved as a single file
+        are loaded with :func:`torch.load`. Each of the rank-local keys holds the list of the states of every rank.
+
+        Args:
+            path: Path to the checkpoint directory
+            map_location: a function, :class:`torch.device`, string or a dict specifying how to remap storage
+            locations.
+            storage_options: Optional parameters when loading the model/training states, unused.
+
+        Returns: The loaded checkpoint.
+        """
+        fs = get_filesystem(path)
+        if not fs.isdir(str(path)):
+            return pl_load(path, map_location=map_location)
+
+        manifest = pl_load(os.path.join(path, self.MANIFEST_NAME), map_location=map_location)
+        num_shards = manifest["num_shards"]
+        rank_local_keys = manifest.get("rank_local_keys", [])
+        num_ranks = manifest.get("num_ranks", 1) if rank_local_keys else 0
+        paths = [os.path.join(path, self._shard_name(rank, num_shards)) for rank in range(num_shards)]
+        paths += [os.path.join(path, self._rank_name(rank, num_ranks)) for rank in range(num_ranks)]
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_load_workers, len(paths)))) as executor:
+            files = list(executor.map(lambda p: pl_load(p, map_location=map_location), paths))
+        shards, rank_states = files[:num_shards], files[num_shards:]
+
+        def restore(ref: _ShardedTensor) -> torch.Tensor:
+            return shards[ref.shard][ref.key]
+
+        checkpoint = apply_to_collection(manifest["checkpoint"], _ShardedTensor, restore)
+        if rank_local_keys:
+            for key in rank_local_keys:
+                checkpoint[key] = [states[key] for states in rank_states]
+            checkpoint[self.RANK_LOCAL_KEYS] = rank_local_keys
+        return checkpoint
+
+    @staticmethod
+    def signature(checkpoint: Dict[str, Any]) -> str:
+        """Summarizes the structure of a checkpoint, with the dtype and shape of its tensors, to verify all ranks
+        hold the same checkpoint. The values of the tensors are not compared."""
+        structure = apply_to_collection(checkpoint, torch.Tensor, lambda t: (str(t.dtype), tuple(t.shape)))
+        return hashlib.sha256(pickle.dumps(structure)).hexdigest()
+
+    @staticmethod
+    def _shard_name(rank: int, num_shards: int) -> str:
+        return f"shard-{rank:05d}-of-{num_shards:05d}.ckpt"
+
+    @staticmethod
+    def _rank_name(rank: int, num_ranks: int) -> str:
+        return f"rank-{rank:05d}-of-{num_ranks:05d}.ckpt"
+
+    @staticmethod
+    def _split(checkpoint: Dict[str, Any], num_shards: int) -> Tuple[Dict[str, Any], List[Dict[int, torch.Tensor]]]:
+        shards: List[Dict[int, torch.Tensor]] = [{} for _ in range(num_shards)]
+        shard_bytes = [0] * num_shards
+
+        def assign(tensor: torch.Tensor) -> _ShardedTensor:
+            # greedily balance the bytes written by each rank
+            shard = shard_bytes.index(min(shard_bytes))
+            shard_bytes[shard] += tensor.numel() * tensor.element_size()
+            key = len(shards[shard])
+            shards[shard][key] = tensor
+            return _ShardedTensor(shard, key)
+
+        manifest = apply_to_collection(checkpoint, torch.Tensor, assign)
+        return manifest, shards
@@ -40,7 +40,10 @@ class TorchCheckpointIO(CheckpointIO):
             atomic_save(checkpoint, path)
 
     def load_checkpoint(
-        self, path: _PATH, map_location: Optional[Callable] = lambda storage, loc: storage
+        self,
+        path: _PATH,
+        map_location: Optional[Callable] = lambda storage, loc: storage,
+        storage_options: Optional[Any] = None,
     ) -> Dict[str, Any]:
         """
         Loads checkpoint using :func:`torch.load`, with additional handling for ``fsspec`` remote loading of files.
@@ -49,6 +52,7 @@ class TorchCheckpointIO(CheckpointIO):
             path: Path to checkpoint
             map_location: a function, :class:`torch.device`, string or a dict specifying how to remap storage
             locations.
+            storage_options: Optional parameters when loading the model/training states, unused.
 
         Returns: The loaded checkpoint.
         """
@@ -92,6 +92,7 @@ class DDPSpawnPlugin(ParallelPlugin):
         self.dist = LightningDistributed()
         self.num_processes = len(parallel_devices) if parallel_devices is not None else 0
         self.mp_queue = None
+        self._shared_state_dict: Optional[Dict[str, torch.Tensor]] = None
         self._ddp_comm_state = ddp_comm_state
         self._ddp_comm_hook = ddp_comm_hook
         self._ddp_comm_wrapper = ddp_comm_wrapper
@@ -194,6 +195,9 @@ class DDPSpawnPlugin(ParallelPlugin):
         self.dist.rank = self.global_rank
         self.dist.device = self.root_device
 
+        # the tensors of the model received from the main process are in its shared memory
+        self._shared_state_dict = self.lightning_module.state_dict()
+
         # move the model to the correct device
         self.model_to_device()
 
@@ -206,6 +210,9 @@ class DDPSpawnPlugin(ParallelPlugin):
 
         results = trainer.run_stage()
 
+        # make sure the checkpoints are written before the main process reads them
+        self.checkpoint_io.teardown()
+
         # persist info in ddp_spawn
         self.transfer_distrib_spawn_state_on_fit_end(results)
 
@@ -298,13 +305,11 @@ class DDPSpawnPlugin(ParallelPlugin):
 
             # save the last weights
             last_path = None
-            if (
-                self.lightning_module.trainer.state.fn == TrainerFn.FITTING
-                and best_model_path is not None
-                and len(best_model_path) > 0
-            ):
-                last_path = re.sub(".ckpt", ".tmp_end.ckpt", best_model_path)
-                atomic_save(self.on_save(state_dict), last_path)
+            if self.lightning_module.trainer.state.fn == TrainerFn.FITTING:
+                copied = self._copy_to_shared_state_dict(state_dict)
+                if not copied and best_model_path is not None and len(best_model_path) > 0:
+                    last_path = re.sub(".ckpt", ".tmp_end.ckpt", best_model_path)
+                    atomic_save(self.on_save(state_dict), last_path)
 
             # todo, pass complete checkpoint as state dictionary
             self.mp_queue.put(best_model_path)
@@ -312,13 +317,38 @@ class DDPSpawnPlugin(ParallelPlugin):
             self.mp_queue.put(results)
             self.lightning_module.add_to_queue(self.mp_queue)  # adds the `callback_metrics` to the queue
 
+    def _copy_to_shared_state_dict(self, state_dict: Dict[str, torch.Tensor]) -> bool:
+        """Copies the weights into the tensors of the main process.
+
+        The model passed to :func:`torch.multiprocessing.spawn` has its tensors moved to shared memory, which the
+        spawned processes map when they receive it. Copying the final weights into them hands them back to the main
+        process without serializing them. On CPU, the model trains in this memory and nothing needs to be copied.
+
+        Returns:
+            Whether all the weights could be copied, which requires the same keys, shapes and dtypes.
+        """
+        shared = self._shared_state_dict
+        if (
+            shared is None
+            or shared.keys() != state_dict.keys()
+            or any(
+                not shared[k].is_shared() or shared[k].shape != v.shape or shared[k].dtype != v.dtype
+                for k, v in state_dict.items()
+            )
+        ):
+            return False
+        for k, v in state_dict.items():
+            if shared[k].data_ptr() != v.data_ptr():
+                shared[k].copy_(v)
+        return True
+
     def __recover_child_process_weights(self, best_path, last_path):
         # transfer back the best path to the trainer
         if self.lightning_module.trainer.checkpoint_callback:
             self.lightning_module.trainer.checkpoint_callback.best_model_path = best_path
         # todo, pass also best score
 
-        # load last weights
+        # load last weights, unless they were copied to the shared memory of the model
         if last_path is not None and self.lightning_module.trainer.state.fn == TrainerFn.FITTING:
             ckpt = pl_load(last_path, map_location=lambda storage, loc: storage)
             self.lightning_module.load_state_dict(ckpt)
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import contextlib
-from typing import Dict, Generator, List, Optional
+from typing import Dict, Generator, List, Optional, Tuple
 
 import torch
 
@@ -179,6 +179,11 @@ class DDPFullyShardedPlugin(DDPPlugin):
         # Setup optimizers after the Fully Sharded Model has been made
         return True
 
+    @property
+    def rank_local_checkpoint_keys(self) -> Tuple[str, ...]:
+        # the optimizer of each rank holds the states of its own shard of the flattened parameters
+        return ("optimizer_states",) if self.checkpoint_io.saves_rank_local_states else ()
+
     def training_step(self, *args, **kwargs):
         return self.model.training_step(*args, **kwargs)
 
@@ -14,7 +14,7 @@
 import os
 from abc import ABC, abstractmethod
 from contextlib import contextmanager
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import torch
 from torch.nn.parallel import DistributedDataParallel
@@ -98,6 +98,16 @@ class ParallelPlugin(TrainingTypePlugin, ABC):
         decision = bool(decision == self.world_size)
         return decision
 
+    @property
+    def rank_local_checkpoint_keys(self) -> Tuple[str, ...]:
+        """The top-level keys of the checkpoint holding a different state on every rank, saved by every rank when
+        the ``checkpoint_io`` saves the states of all ranks."""
+        return ()
+
+    def save_checkpoint(self, checkpoint: Dict[str, Any], filepath: str) -> None:
+        checkpoint = self.on_save(checkpoint)
+        self.checkpoint_io.save_rank_checkpoint(checkpoint, filepath, self)
+
     @property
     def torch_distributed_backend(self):
         torch_backend = os.getenv("PL_TORCH_DISTRIBUTED_BACKEND")
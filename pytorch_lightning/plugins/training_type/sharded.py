@@ -11,12 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Dict, Optional
+from typing import Any, Dict, Mapping, Optional, Tuple
 
 import torch
 
 import pytorch_lightning as pl
 from pytorch_lightning.core.optimizer import LightningOptimizer
+from pytorch_lightning.plugins.io.checkpoint_plugin import CheckpointIO
 from pytorch_lightning.plugins.training_type.ddp import DDPPlugin
 from pytorch_lightning.trainer.states import TrainerFn
 from pytorch_lightning.utilities import _FAIRSCALE_AVAILABLE, _FAIRSCALE_OSS_FP16_BROADCAST_AVAILABLE, rank_zero_only
@@ -70,12 +71,31 @@ class DDPShardedPlugin(DDPPlugin):
             return
         self._reinit_optimizers_with_oss()
 
+    @property
+    def rank_local_checkpoint_keys(self) -> Tuple[str, ...]:
+        # each rank saves the state of its own partition of the optimizer states
+        return ("optimizer_states",) if self.checkpoint_io.saves_rank_local_states else ()
+
     def optimizer_state(self, optimizer: "OSS") -> Optional[dict]:
         if isinstance(optimizer, LightningOptimizer):
             optimizer = optimizer._optimizer
+        if "optimizer_states" in self.rank_local_checkpoint_keys:
+            return optimizer.optim.state_dict()
         optimizer.consolidate_state_dict()
         return self._optim_state_dict(optimizer)
 
+    def load_optimizer_state_dict(self, checkpoint: Mapping[str, Any]) -> None:
+        if "optimizer_states" not in checkpoint.get(CheckpointIO.RANK_LOCAL_KEYS, ()):
+            return super().load_optimizer_state_dict(checkpoint)
+        optimizer_states = self._rank_local_state(checkpoint, "optimizer_states")
+        for optimizer, opt_state in zip(self.lightning_module.trainer.accelerator.optimizers, optimizer_states):
+            if isinstance(optimizer, LightningOptimizer):
+                optimizer = optimizer._optimizer
+            # the state of the partition of the parameters held by this rank
+            optimizer.optim.load_state_dict(opt_state)
+            for param_group, local_param_group in zip(optimizer.param_groups, optimizer.optim.param_groups):
+                param_group.update({k: v for k, v in local_param_group.items() if k != "params"})
+
     @rank_zero_only
     def _optim_state_dict(self, optimizer):
         """
@@ -158,6 +158,7 @@ class TPUSpawnPlugin(DDPSpawnPlugin):
         if self.tpu_global_core_rank != 0 and trainer.progress_bar_callback is not None:
             trainer.progress_bar_callback.disable()
 
+        self._shared_state_dict = self.lightning_module.state_dict()
         self.model_to_device()
         trainer.accelerator.setup_optimizers(trainer)
         trainer.precision_plugin.connect(self._model, None, None)
@@ -198,13 +199,14 @@ class TPUSpawnPlugin(DDPSpawnPlugin):
 
             # save the last weights
             last_path = None
-            if (
-                self.lightning_module.trainer.state.fn == TrainerFn.FITTING
-                and best_model_path is not None
-                and len(best_model_path) > 0
-            ):
-                last_path = re.sub(".ckpt", ".tmp_end.ckpt", best_model_path)
-                self.save(state_dict, last_path)
+            if self.lightning_module.trainer.state.fn == TrainerFn.FITTING:
+                # each host copies them to the shared memory of its main process
+                copied = self._copy_to_shared_state_dict(state_dict) if self.local_rank == 0 else True
+                # `xm.save` requires all the processes, so they all fall back to it when a copy failed
+                copied = self.reduce_boolean_decision(copied)
+                if not copied and best_model_path is not None and len(best_model_path) > 0:
+                    last_path = re.sub(".ckpt", ".tmp_end.ckpt", best_model_path)
+                    self.save(state_dict, last_path)
 
             if self.local_rank == 0:
                 # todo, pass complete checkpoint as state dictionary
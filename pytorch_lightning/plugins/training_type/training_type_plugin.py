@@ -27,6 +27,7 @@ from pytorch_lightning.overrides.base import unwrap_lightning_module
 from pytorch_lightning.plugins import TorchCheckpointIO
 from pytorch_lightning.plugins.base_plugin import Plugin
 from pytorch_lightning.plugins.io.checkpoint_plugin import CheckpointIO
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.types import _EVALUATE_OUTPUT, _PREDICT_OUTPUT
 
 TBroadcast = TypeVar("T")
@@ -162,9 +163,23 @@ class TrainingTypePlugin(Plugin, ABC):
 
     def load_optimizer_state_dict(self, checkpoint: Mapping[str, Any]) -> None:
         optimizer_states = checkpoint["optimizer_states"]
+        if "optimizer_states" in checkpoint.get(CheckpointIO.RANK_LOCAL_KEYS, ()):
+            optimizer_states = self._rank_local_state(checkpoint, "optimizer_states")
         for optimizer, opt_state in zip(self.lightning_module.trainer.accelerator.optimizers, optimizer_states):
             optimizer.load_state_dict(opt_state)
 
+    def _rank_local_state(self, checkpoint: Mapping[str, Any], key: str) -> Any:
+        """Returns the state saved by this rank for a key of the checkpoint holding the states of every rank."""
+        states = checkpoint[key]
+        # some training types define a world size
+        world_size = getattr(self, "world_size", 1)
+        if len(states) != world_size:
+            raise MisconfigurationException(
+                f"The `{key}` of the checkpoint were saved by {len(states)} processes and can only be restored by as"
+                f" many, got {world_size}."
+            )
+        return states[getattr(self, "global_rank", 0)]
+
     def start_training(self, trainer: "pl.Trainer") -> None:
         # double dispatch to initiate the training loop
         self._results = trainer.run_stage()
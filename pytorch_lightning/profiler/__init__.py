@@ -48,6 +48,36 @@ The profiler's results will be printed at the completion of a training `fit()`.
     on_epoch_end            |  3.919e-06            |  3.919e-06
     on_train_end            |  5.449e-06            |  5.449e-06
 
+The durations of each action are aggregated as they are recorded. For long runs, you can bound the memory used to
+estimate the percentiles of the extended report with ``reservoir_size`` and only time every ``sample_every``-th call
+of each action to reduce the overhead of the profiler.
+
+.. code-block:: python
+
+    from pytorch_lightning.profiler import SimpleProfiler
+
+    trainer = Trainer(..., profiler=SimpleProfiler(reservoir_size=1000, sample_every=10))
+
+
+Timeline Profiling
+------------------
+
+To see when each action happens, e.g. to find stalls while the batches are fetched or the checkpoints are saved, use
+the `TimelineProfiler`. It records the start and end of the actions of each thread and rank with a low overhead and
+writes them as a Chrome trace file, which can be opened in ``chrome://tracing`` or https://ui.perfetto.dev.
+
+.. code-block:: python
+
+    trainer = Trainer(..., profiler="timeline")
+
+    # or
+
+    profiler = TimelineProfiler(dirpath=".", filename="timeline", profiler=SimpleProfiler())
+    trainer = Trainer(..., profiler=profiler)
+
+Each rank writes its own file, which can be combined into a single timeline with
+``TimelineProfiler.merge(["fit-timeline-0.trace.json", "fit-timeline-1.trace.json"], "fit.trace.json")``.
+
 
 Advanced Profiling
 ------------------
@@ -200,6 +230,7 @@ from pytorch_lightning.profiler.advanced import AdvancedProfiler
 from pytorch_lightning.profiler.base import AbstractProfiler, BaseProfiler, PassThroughProfiler
 from pytorch_lightning.profiler.pytorch import PyTorchProfiler
 from pytorch_lightning.profiler.simple import SimpleProfiler
+from pytorch_lightning.profiler.timeline import TimelineProfiler
 from pytorch_lightning.profiler.xla import XLAProfiler
 
 __all__ = [
@@ -209,5 +240,6 @@ __all__ = [
     "PassThroughProfiler",
     "PyTorchProfiler",
     "SimpleProfiler",
+    "TimelineProfiler",
     "XLAProfiler",
 ]
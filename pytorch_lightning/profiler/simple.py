@@ -13,23 +13,88 @@
 # limitations under the License.
 """Profiler to check if there are any bottlenecks in your code."""
 import logging
+import math
 import os
+import random
 import time
 from collections import defaultdict
 from pathlib import Path
-from typing import Dict, Optional, Tuple, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 from pytorch_lightning.profiler.base import BaseProfiler
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
 log = logging.getLogger(__name__)
 
 
+class _ActionStats:
+    """Streaming statistics of the durations of an action.
+
+    The count, sum, minimum, maximum and sum of squares are updated in constant time while a uniform sample of the
+    durations is kept in a reservoir of at most ``reservoir_size`` elements to estimate the percentiles.
+    """
+
+    __slots__ = ("num_calls", "count", "total", "min", "max", "sum_sq", "reservoir", "reservoir_size", "_rng")
+
+    def __init__(self, reservoir: List[float], reservoir_size: Optional[int], rng: random.Random) -> None:
+        # the number of calls, including the ones which were not timed
+        self.num_calls = 0
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.sum_sq = 0.0
+        self.reservoir = reservoir
+        self.reservoir_size = reservoir_size
+        self._rng = rng
+
+    def update(self, duration: float) -> None:
+        self.count += 1
+        self.total += duration
+        self.sum_sq += duration * duration
+        if duration < self.min:
+            self.min = duration
+        if duration > self.max:
+            self.max = duration
+        if self.reservoir_size is None or len(self.reservoir) < self.reservoir_size:
+            self.reservoir.append(duration)
+        else:
+            # reservoir sampling: the i-th duration is kept with probability ``reservoir_size / i``
+            index = self._rng.randrange(self.count)
+            if index < self.reservoir_size:
+                self.reservoir[index] = duration
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> float:
+        if not self.count:
+            return 0.0
+        return math.sqrt(max(self.sum_sq / self.count - self.mean ** 2, 0.0))
+
+    @property
+    def estimated_total(self) -> float:
+        """The total duration, extrapolated to the calls which were not timed."""
+        return self.mean * max(self.num_calls, self.count)
+
+    def percentiles(self, q: Tuple[float, ...] = (50, 95, 99)) -> List[float]:
+        if not self.reservoir:
+            return [0.0] * len(q)
+        return list(np.percentile(self.reservoir, q))
+
+
 class SimpleProfiler(BaseProfiler):
     """
     This profiler simply records the duration of actions (in seconds) and reports
     the mean duration of each action and the total time spent over the entire training run.
+
+    The durations are aggregated as they are recorded, so the memory used does not grow with the length of the run
+    unless ``reservoir_size`` is ``None``. The extended report also includes the standard deviation and the 50th, 95th
+    and 99th percentiles.
     """
 
     def __init__(
@@ -38,6 +103,8 @@ class SimpleProfiler(BaseProfiler):
         filename: Optional[str] = None,
         extended: bool = True,
         output_filename: Optional[str] = None,
+        reservoir_size: Optional[int] = 1024,
+        sample_every: int = 1,
     ) -> None:
         """
         Args:
@@ -48,20 +115,47 @@ class SimpleProfiler(BaseProfiler):
             filename: If present, filename where the profiler results will be saved instead of printing to stdout.
                 The ``.txt`` extension will be used automatically.
 
+            reservoir_size: Maximum number of durations kept per action in ``recorded_durations`` to estimate the
+                percentiles. The durations are sampled uniformly once it is reached. ``None`` keeps all of them.
+
+            sample_every: Only time every ``sample_every``-th call of each action. The total time of an action is
+                extrapolated from the timed calls.
+
         Raises:
+            MisconfigurationException:
+                If ``reservoir_size`` or ``sample_every`` is not a positive integer.
             ValueError:
                 If you attempt to start an action which has already started, or
                 if you attempt to stop recording an action which was never started.
         """
         super().__init__(dirpath=dirpath, filename=filename, output_filename=output_filename)
-        self.current_actions: Dict[str, float] = {}
-        self.recorded_durations = defaultdict(list)
+        if reservoir_size is not None and reservoir_size < 1:
+            raise MisconfigurationException(f"`reservoir_size` should be a positive integer, got {reservoir_size}.")
+        if sample_every < 1:
+            raise MisconfigurationException(f"`sample_every` should be a positive integer, got {sample_every}.")
+        self.current_actions: Dict[str, Optional[float]] = {}
+        self.reservoir_size = reservoir_size
+        self.sample_every = sample_every
+        self._rng = random.Random(0)
+        # the durations kept to estimate the percentiles, which are shared with the statistics of each action
+        self.recorded_durations: Dict[str, List[float]] = defaultdict(list)
+        self.recorded_stats: Dict[str, _ActionStats] = {}
         self.extended = extended
         self.start_time = time.monotonic()
 
     def start(self, action_name: str) -> None:
         if action_name in self.current_actions:
             raise ValueError(f"Attempted to start {action_name} which has already started.")
+        stats = self.recorded_stats.get(action_name)
+        if stats is None:
+            stats = self.recorded_stats[action_name] = _ActionStats(
+                self.recorded_durations[action_name], self.reservoir_size, self._rng
+            )
+        stats.num_calls += 1
+        if self.sample_every > 1 and (stats.num_calls - 1) % self.sample_every:
+            # `None` marks a started action which is not timed
+            self.current_actions[action_name] = None
+            return
         self.current_actions[action_name] = time.monotonic()
 
     def stop(self, action_name: str) -> None:
@@ -69,12 +163,16 @@ class SimpleProfiler(BaseProfiler):
         if action_name not in self.current_actions:
             raise ValueError(f"Attempting to stop recording an action ({action_name}) which was never started.")
         start_time = self.current_actions.pop(action_name)
-        duration = end_time - start_time
-        self.recorded_durations[action_name].append(duration)
+        if start_time is not None:
+            self.recorded_stats[action_name].update(end_time - start_time)
 
     def _make_report(self) -> Tuple[list, float]:
         total_duration = time.monotonic() - self.start_time
-        report = [[a, d, 100.0 * np.sum(d) / total_duration] for a, d in self.recorded_durations.items()]
+        report = [
+            [a, stats, 100.0 * stats.estimated_total / total_duration]
+            for a, stats in self.recorded_stats.items()
+            if stats.count
+        ]
         report.sort(key=lambda x: x[2], reverse=True)
         return report, total_duration
 
@@ -87,27 +185,40 @@ class SimpleProfiler(BaseProfiler):
 
         if self.extended:
 
-            if len(self.recorded_durations) > 0:
-                max_key = max(len(k) for k in self.recorded_durations.keys())
+            if len(self.recorded_stats) > 0:
+                max_key = max(len(k) for k in self.recorded_stats.keys())
 
-                def log_row(action, mean, num_calls, total, per):
-                    row = f"{sep}{action:<{max_key}s}\t|  {mean:<15}\t|"
+                def log_row(action, mean, std, num_calls, total, per, p50, p95, p99):
+                    row = f"{sep}{action:<{max_key}s}\t|  {mean:<15}\t|  {std:<15}\t|"
                     row += f"{num_calls:<15}\t|  {total:<15}\t|  {per:<15}\t|"
+                    row += f"  {p50:<15}\t|  {p95:<15}\t|  {p99:<15}\t|"
                     return row
 
-                output_string += log_row("Action", "Mean duration (s)", "Num calls", "Total time (s)", "Percentage %")
+                output_string += log_row(
+                    "Action",
+                    "Mean duration (s)",
+                    "Std duration (s)",
+                    "Num calls",
+                    "Total time (s)",
+                    "Percentage %",
+                    "P50 (s)",
+                    "P95 (s)",
+                    "P99 (s)",
+                )
                 output_string_len = len(output_string)
                 output_string += f"{sep}{'-' * output_string_len}"
                 report, total_duration = self._make_report()
-                output_string += log_row("Total", "-", "_", f"{total_duration:.5}", "100 %")
+                output_string += log_row("Total", "-", "-", "_", f"{total_duration:.5}", "100 %", "-", "-", "-")
                 output_string += f"{sep}{'-' * output_string_len}"
-                for action, durations, duration_per in report:
+                for action, stats, duration_per in report:
                     output_string += log_row(
                         action,
-                        f"{np.mean(durations):.5}",
-                        f"{len(durations):}",
-                        f"{np.sum(durations):.5}",
+                        f"{stats.mean:.5}",
+                        f"{stats.std:.5}",
+                        f"{stats.num_calls:}",
+                        f"{stats.estimated_total:.5}",
                         f"{duration_per:.5}",
+                        *(f"{p:.5}" for p in stats.percentiles()),
                     )
         else:
 
@@ -117,7 +228,8 @@ class SimpleProfiler(BaseProfiler):
             output_string += log_row("Action", "Mean duration (s)", "Total time (s)")
             output_string += f"{sep}{'-' * 65}"
 
-            for action, durations in self.recorded_durations.items():
-                output_string += log_row(action, f"{np.mean(durations):.5}", f"{np.sum(durations):.5}")
+            for action, stats in self.recorded_stats.items():
+                if stats.count:
+                    output_string += log_row(action, f"{stats.mean:.5}", f"{stats.estimated_total:.5}")
         output_string += sep
         return output_string
@@ -0,0 +1,206 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Profiler recording the actions on a timeline which can be opened in ``chrome://tracing`` or Perfetto."""
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from pytorch_lightning.profiler.base import BaseProfiler
+from pytorch_lightning.utilities.cloud_io import get_filesystem
+from pytorch_lightning.utilities.distributed import rank_zero_only
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+
+
+class TimelineProfiler(BaseProfiler):
+    """
+    This profiler records when each action starts and ends, per thread and rank, and exports them as a Chrome trace.
+
+    Every action profiled by Lightning, such as fetching the batches, the hooks, the optimizer steps and the
+    checkpoint saves, is shown on the timeline. The events are written into a ring buffer allocated when the profiler is
+    set up, so only the latest ``capacity`` events are kept and recording an event does not allocate.
+
+    Each rank writes its own ``<stage>-<filename>-<rank>.trace.json`` file in ``dirpath`` when the stage ends.
+    The timestamps are based on the wall clock so the files of all the ranks can be combined with :meth:`merge`.
+
+    Example::
+
+        Trainer(profiler=TimelineProfiler(dirpath=".", filename="timeline"))
+
+        # keep the report of the simple profiler while recording the timeline
+        Trainer(profiler=TimelineProfiler(profiler=SimpleProfiler()))
+    """
+
+    def __init__(
+        self,
+        dirpath: Optional[Union[str, Path]] = None,
+        filename: Optional[str] = None,
+        capacity: int = 1_000_000,
+        profiler: Optional[BaseProfiler] = None,
+    ) -> None:
+        """
+        Args:
+            dirpath: Directory path for the trace files. If ``dirpath`` is ``None``, the ``trainer.log_dir`` will be
+                used, or the current working directory when there is none.
+
+            filename: Prefix of the trace files. The ``.trace.json`` extension will be used automatically.
+
+            capacity: Maximum number of events kept. The oldest events are overwritten once it is reached.
+
+            profiler: A profiler to which the actions are forwarded. Its summary is reported at the end of each stage.
+
+        Raises:
+            MisconfigurationException:
+                If ``capacity`` is not a positive integer.
+            ValueError:
+                If you attempt to stop recording an action which was never started.
+        """
+        super().__init__(dirpath=dirpath, filename=filename)
+        if capacity < 1:
+            raise MisconfigurationException(f"`capacity` should be a positive integer, got {capacity}.")
+        self.capacity = capacity
+        self.profiler = profiler
+        self._starts: Optional[np.ndarray] = None
+        self._ends: Optional[np.ndarray] = None
+        self._actions: Optional[np.ndarray] = None
+        self._threads: Optional[np.ndarray] = None
+        self._num_events = 0
+        self._action_ids: Dict[str, int] = {}
+        self._current_actions: Dict[Tuple[int, str], int] = {}
+        # converts the monotonic clock to the wall clock, which is shared by the processes
+        self._clock_offset = time.time_ns() - time.perf_counter_ns()
+
+    def start(self, action_name: str) -> None:
+        self._current_actions[(threading.get_ident(), action_name)] = time.perf_counter_ns()
+        if self.profiler is not None:
+            self.profiler.start(action_name)
+
+    def stop(self, action_name: str) -> None:
+        end = time.perf_counter_ns()
+        if self.profiler is not None:
+            self.profiler.stop(action_name)
+        thread = threading.get_ident()
+        start = self._current_actions.pop((thread, action_name), None)
+        if start is None:
+            if self.profiler is None:
+                raise ValueError(f"Attempting to stop recording an action ({action_name}) which was never started.")
+            return
+        if self._starts is None:
+            self._allocate()
+        action = self._action_ids.get(action_name)
+        if action is None:
+            action = self._action_ids[action_name] = len(self._action_ids)
+        index = self._num_events % self.capacity
+        self._starts[index] = start
+        self._ends[index] = end
+        self._actions[index] = action
+        self._threads[index] = thread
+        self._num_events += 1
+
+    def _allocate(self) -> None:
+        self._starts = np.zeros(self.capacity, dtype=np.int64)
+        self._ends = np.zeros(self.capacity, dtype=np.int64)
+        self._actions = np.zeros(self.capacity, dtype=np.int32)
+        self._threads = np.zeros(self.capacity, dtype=np.int64)
+
+    def summary(self) -> str:
+        return self.profiler.summary() if self.profiler is not None else ""
+
+    def trace_events(self) -> List[Dict[str, Any]]:
+        """Returns the recorded events, oldest first, in the Chrome trace event format."""
+        num_events = min(self._num_events, self.capacity)
+        order = np.arange(self._num_events - num_events, self._num_events) % self.capacity
+        names = list(self._action_ids)
+        rank = rank_zero_only.rank
+        events = [
+            {"name": "process_name", "ph": "M", "pid": rank, "tid": 0, "args": {"name": f"rank {rank}"}},
+            {"name": "process_sort_index", "ph": "M", "pid": rank, "tid": 0, "args": {"sort_index": rank}},
+        ]
+        for start, end, action, thread in zip(
+            self._starts[order].tolist(),
+            self._ends[order].tolist(),
+            self._actions[order].tolist(),
+            self._threads[order].tolist(),
+        ):
+            events.append(
+                {
+                    "name": names[action],
+                    "cat": self._stage or "",
+                    "ph": "X",
+                    # microseconds
+                    "ts": (start + self._clock_offset) / 1000,
+                    "dur": (end - start) / 1000,
+                    "pid": rank,
+                    "tid": thread,
+                }
+            )
+        return events
+
+    def describe(self) -> None:
+        self._export_trace()
+        super().describe()
+
+    def _export_trace(self) -> None:
+        if not self._num_events:
+            return
+        dirpath = str(self.dirpath) if self.dirpath is not None else os.getcwd()
+        filepath = os.path.join(dirpath, self._prepare_trace_filename())
+        fs = get_filesystem(filepath)
+        fs.makedirs(dirpath, exist_ok=True)
+        with fs.open(filepath, "w") as f:
+            json.dump({"traceEvents": self.trace_events(), "displayTimeUnit": "ms"}, f)
+        # the events of the next stage are written to another file
+        self._num_events = 0
+
+    def _prepare_trace_filename(self) -> str:
+        args = [arg for arg in (self._stage, self.filename or "timeline") if arg]
+        if self._local_rank is not None:
+            # the local ranks repeat on each node, the files might be written to a shared filesystem
+            args.append(str(rank_zero_only.rank))
+        return "-".join(args) + ".trace.json"
+
+    @staticmethod
+    def merge(paths: List[Union[str, Path]], output_path: Union[str, Path]) -> None:
+        """Combines the trace files written by several ranks into a single timeline."""
+        events = []
+        for path in paths:
+            with get_filesystem(path).open(str(path)) as f:
+                events.extend(json.load(f)["traceEvents"])
+        with get_filesystem(output_path).open(str(output_path), "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def setup(
+        self, stage: Optional[str] = None, local_rank: Optional[int] = None, log_dir: Optional[str] = None
+    ) -> None:
+        super().setup(stage=stage, local_rank=local_rank, log_dir=log_dir)
+        if self._starts is None:
+            self._allocate()
+        if self.profiler is not None:
+            self.profiler.setup(stage=stage, local_rank=local_rank, log_dir=log_dir)
+
+    def teardown(self, stage: Optional[str] = None) -> None:
+        super().teardown(stage=stage)
+        if self.profiler is not None:
+            self.profiler.teardown(stage=stage)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        if not self._num_events:
+            # avoid sending the empty buffers to the spawned processes
+            state.update(_starts=None, _ends=None, _actions=None, _threads=None)
+        return state
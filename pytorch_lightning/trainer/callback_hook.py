@@ -25,216 +25,275 @@ from pytorch_lightning.utilities import rank_zero_deprecation, rank_zero_warn
 from pytorch_lightning.utilities.types import STEP_OUTPUT
 
 
+class _CallbackList(list):
+    """The list of the trainer callbacks, which counts its modifications so that the hook implementers computed from
+    it can be invalidated."""
+
+    version = 0
+
+    def _modified(method: Callable) -> Callable:
+        def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            self.version += 1
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    __setitem__ = _modified(list.__setitem__)
+    __delitem__ = _modified(list.__delitem__)
+    __iadd__ = _modified(list.__iadd__)
+    __imul__ = _modified(list.__imul__)
+    append = _modified(list.append)
+    extend = _modified(list.extend)
+    insert = _modified(list.insert)
+    pop = _modified(list.pop)
+    remove = _modified(list.remove)
+    clear = _modified(list.clear)
+    sort = _modified(list.sort)
+    reverse = _modified(list.reverse)
+    del _modified
+
+
 class TrainerCallbackHookMixin(ABC):
 
     # this is just a summary on variables used in this abstract class,
     # the proper values/initialisation should be done in child class
-    callbacks: List[Callback] = []
+    _callbacks: _CallbackList = _CallbackList()
     lightning_module: "pl.LightningModule"
+    # the version of the callbacks the cached hook implementers were computed for
+    _hook_callbacks_version: Optional[int] = None
+    _callback_hook_implementers: Dict[str, List[Callback]] = {}
+
+    @property
+    def callbacks(self) -> List[Callback]:
+        return self._callbacks
+
+    @callbacks.setter
+    def callbacks(self, callbacks: List[Callback]) -> None:
+        self._callbacks = _CallbackList(callbacks)
+        self._hook_callbacks_version = None
+
+    def _callbacks_with_hook(self, hook_name: str) -> List[Callback]:
+        """Returns the callbacks which implement ``hook_name``, so the hooks left to the :class:`Callback` no-op
+        default are not called. The lists are computed once and recomputed when the callbacks change."""
+        if self._callbacks.version != self._hook_callbacks_version:
+            self._hook_callbacks_version = self._callbacks.version
+            self._callback_hook_implementers = {}
+        implementers = self._callback_hook_implementers.get(hook_name)
+        if implementers is None:
+            default = getattr(Callback, hook_name)
+            implementers = [
+                callback
+                for callback in self._callbacks
+                # hooks patched on the instance, e.g. mocks, are always called
+                if hook_name in getattr(callback, "__dict__", {})
+                or getattr(type(callback), hook_name, None) is not default
+            ]
+            self._callback_hook_implementers[hook_name] = implementers
+        return implementers
 
     def on_before_accelerator_backend_setup(self) -> None:
         """Called at the beginning of fit (train + validate), validate, test, or predict, or tune."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_before_accelerator_backend_setup"):
             callback.on_before_accelerator_backend_setup(self, self.lightning_module)
 
     def on_configure_sharded_model(self) -> None:
         """Called at the beginning of fit (train + validate), validate, test, or predict, or tune."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_configure_sharded_model"):
             callback.on_configure_sharded_model(self, self.lightning_module)
 
     def setup(self, stage: Optional[str]) -> None:
         """Called at the beginning of fit (train + validate), validate, test, or predict, or tune."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("setup"):
             callback.setup(self, self.lightning_module, stage=stage)
 
     def teardown(self, stage: Optional[str] = None) -> None:
         """Called at the end of fit (train + validate), validate, test, or predict, or tune."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("teardown"):
             callback.teardown(self, self.lightning_module, stage=stage)
 
     def on_init_start(self):
         """Called when the trainer initialization begins, model has not yet been set."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_init_start"):
             callback.on_init_start(self)
 
     def on_init_end(self):
         """Called when the trainer initialization ends, model has not yet been set."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_init_end"):
             callback.on_init_end(self)
 
     def on_fit_start(self):
         """Called when the trainer initialization begins, model has not yet been set."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_fit_start"):
             callback.on_fit_start(self, self.lightning_module)
 
     def on_fit_end(self):
         """Called when the trainer initialization begins, model has not yet been set."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_fit_end"):
             callback.on_fit_end(self, self.lightning_module)
 
     def on_sanity_check_start(self):
         """Called when the validation sanity check starts."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_sanity_check_start"):
             callback.on_sanity_check_start(self, self.lightning_module)
 
     def on_sanity_check_end(self):
         """Called when the validation sanity check ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_sanity_check_end"):
             callback.on_sanity_check_end(self, self.lightning_module)
 
     def on_train_epoch_start(self):
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_epoch_start"):
             callback.on_train_epoch_start(self, self.lightning_module)
 
     def on_train_epoch_end(self):
         """Called when the epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_epoch_end"):
             callback.on_train_epoch_end(self, self.lightning_module)
 
     def on_validation_epoch_start(self):
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_epoch_start"):
             callback.on_validation_epoch_start(self, self.lightning_module)
 
     def on_validation_epoch_end(self):
         """Called when the validation epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_epoch_end"):
             callback.on_validation_epoch_end(self, self.lightning_module)
 
     def on_test_epoch_start(self):
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_epoch_start"):
             callback.on_test_epoch_start(self, self.lightning_module)
 
     def on_test_epoch_end(self):
         """Called when the test epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_epoch_end"):
             callback.on_test_epoch_end(self, self.lightning_module)
 
     def on_predict_epoch_start(self) -> None:
         """Called when the epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_epoch_start"):
             callback.on_predict_epoch_start(self, self.lightning_module)
 
     def on_predict_epoch_end(self, outputs: List[Any]) -> None:
         """Called when the epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_epoch_end"):
             callback.on_predict_epoch_end(self, self.lightning_module, outputs)
 
     def on_epoch_start(self):
         """Called when either of train/val/test epoch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_epoch_start"):
             callback.on_epoch_start(self, self.lightning_module)
 
     def on_epoch_end(self):
         """Called when either of train/val/test epoch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_epoch_end"):
             callback.on_epoch_end(self, self.lightning_module)
 
     def on_train_start(self):
         """Called when the train begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_start"):
             callback.on_train_start(self, self.lightning_module)
 
     def on_train_end(self):
         """Called when the train ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_end"):
             callback.on_train_end(self, self.lightning_module)
 
     def on_pretrain_routine_start(self) -> None:
         """Called when the pre-train routine begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_pretrain_routine_start"):
             callback.on_pretrain_routine_start(self, self.lightning_module)
 
     def on_pretrain_routine_end(self) -> None:
         """Called when the pre-train routine ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_pretrain_routine_end"):
             callback.on_pretrain_routine_end(self, self.lightning_module)
 
     def on_batch_start(self):
         """Called when the training batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_batch_start"):
             callback.on_batch_start(self, self.lightning_module)
 
     def on_batch_end(self):
         """Called when the training batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_batch_end"):
             callback.on_batch_end(self, self.lightning_module)
 
     def on_train_batch_start(self, batch, batch_idx, dataloader_idx):
         """Called when the training batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_batch_start"):
             callback.on_train_batch_start(self, self.lightning_module, batch, batch_idx, dataloader_idx)
 
     def on_train_batch_end(self, outputs: STEP_OUTPUT, batch, batch_idx, dataloader_idx):
         """Called when the training batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_train_batch_end"):
             callback.on_train_batch_end(self, self.lightning_module, outputs, batch, batch_idx, dataloader_idx)
 
     def on_validation_batch_start(self, batch, batch_idx, dataloader_idx):
         """Called when the validation batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_batch_start"):
             callback.on_validation_batch_start(self, self.lightning_module, batch, batch_idx, dataloader_idx)
 
     def on_validation_batch_end(self, outputs: STEP_OUTPUT, batch, batch_idx, dataloader_idx):
         """Called when the validation batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_batch_end"):
             callback.on_validation_batch_end(self, self.lightning_module, outputs, batch, batch_idx, dataloader_idx)
 
     def on_test_batch_start(self, batch, batch_idx, dataloader_idx):
         """Called when the test batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_batch_start"):
             callback.on_test_batch_start(self, self.lightning_module, batch, batch_idx, dataloader_idx)
 
     def on_test_batch_end(self, outputs: STEP_OUTPUT, batch, batch_idx, dataloader_idx):
         """Called when the test batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_batch_end"):
             callback.on_test_batch_end(self, self.lightning_module, outputs, batch, batch_idx, dataloader_idx)
 
     def on_predict_batch_start(self, batch: Any, batch_idx: int, dataloader_idx: int) -> None:
         """Called when the predict batch begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_batch_start"):
             callback.on_predict_batch_start(self, self.lightning_module, batch, batch_idx, dataloader_idx)
 
     def on_predict_batch_end(self, outputs: STEP_OUTPUT, batch: Any, batch_idx: int, dataloader_idx: int) -> None:
         """Called when the predict batch ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_batch_end"):
             callback.on_predict_batch_end(self, self.lightning_module, outputs, batch, batch_idx, dataloader_idx)
 
     def on_validation_start(self):
         """Called when the validation loop begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_start"):
             callback.on_validation_start(self, self.lightning_module)
 
     def on_validation_end(self):
         """Called when the validation loop ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_validation_end"):
             callback.on_validation_end(self, self.lightning_module)
 
     def on_test_start(self):
         """Called when the test begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_start"):
             callback.on_test_start(self, self.lightning_module)
 
     def on_test_end(self):
         """Called when the test ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_test_end"):
             callback.on_test_end(self, self.lightning_module)
 
     def on_predict_start(self) -> None:
         """Called when predict begins."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_start"):
             callback.on_predict_start(self, self.lightning_module)
 
     def on_predict_end(self) -> None:
         """Called when predict ends."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_predict_end"):
             callback.on_predict_end(self, self.lightning_module)
 
     def on_keyboard_interrupt(self):
         """Called when the training is interrupted by KeyboardInterrupt."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_keyboard_interrupt"):
             callback.on_keyboard_interrupt(self, self.lightning_module)
 
     @staticmethod
@@ -301,26 +360,26 @@ class TrainerCallbackHookMixin(ABC):
 
     def on_before_backward(self, loss: torch.Tensor) -> None:
         """Called before ``loss.backward()``."""
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_before_backward"):
             callback.on_before_backward(self, self.lightning_module, loss)
 
     def on_after_backward(self):
         """
         Called after loss.backward() and before optimizers do anything.
         """
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_after_backward"):
             callback.on_after_backward(self, self.lightning_module)
 
     def on_before_optimizer_step(self, optimizer, optimizer_idx):
         """
         Called after on_after_backward() once the gradient is accumulated and before optimizer.step().
         """
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_before_optimizer_step"):
             callback.on_before_optimizer_step(self, self.lightning_module, optimizer, optimizer_idx)
 
     def on_before_zero_grad(self, optimizer):
         """
         Called after optimizer.step() and before optimizer.zero_grad().
         """
-        for callback in self.callbacks:
+        for callback in self._callbacks_with_hook("on_before_zero_grad"):
             callback.on_before_zero_grad(self, self.lightning_module, optimizer)
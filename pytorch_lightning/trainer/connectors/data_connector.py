@@ -18,14 +18,29 @@ import pytorch_lightning as pl
 from pytorch_lightning.trainer.supporters import prefetch_iterator
 from pytorch_lightning.utilities import rank_zero_deprecation
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.utilities.fetching import ThreadedDataFetcher
+from pytorch_lightning.utilities.imports import _fault_tolerant_enabled
 from pytorch_lightning.utilities.model_helpers import is_overridden
 from pytorch_lightning.utilities.types import EVAL_DATALOADERS, TRAIN_DATALOADERS
 
 
 class DataConnector:
-    def __init__(self, trainer: "pl.Trainer", multiple_trainloader_mode: str = "max_size_cycle"):
+    def __init__(
+        self,
+        trainer: "pl.Trainer",
+        multiple_trainloader_mode: str = "max_size_cycle",
+        threaded_data_fetching: Union[bool, int] = False,
+    ):
         self.trainer = trainer
         self.multiple_trainloader_mode = multiple_trainloader_mode
+        if threaded_data_fetching < 0:
+            raise MisconfigurationException(
+                "`Trainer(threaded_data_fetching)` should be a bool or a non-negative int,"
+                f" got {threaded_data_fetching}."
+            )
+        # `True` prefetches a single batch
+        self.threaded_prefetch_batches = int(threaded_data_fetching)
+        self.train_data_fetcher: Optional[ThreadedDataFetcher] = None
 
     def on_trainer_init(
         self,
@@ -60,11 +75,30 @@ class DataConnector:
         self.trainer._is_data_prepared = False
 
     def get_profiled_train_dataloader(self, train_dataloader):
+        if self.threaded_prefetch_batches:
+            return enumerate(self._get_train_data_fetcher(train_dataloader))
         profiled_dl = self.trainer.profiler.profile_iterable(
             enumerate(prefetch_iterator(train_dataloader)), "get_train_batch"
         )
         return profiled_dl
 
+    def _get_train_data_fetcher(self, train_dataloader) -> ThreadedDataFetcher:
+        if _fault_tolerant_enabled():
+            # the sampler states are captured when the batches are fetched, which would include the ones still queued
+            raise MisconfigurationException(
+                "`Trainer(threaded_data_fetching)` is not supported with fault-tolerant training."
+            )
+        self.teardown()
+        # the fetcher records the `get_train_batch` action itself
+        self.train_data_fetcher = ThreadedDataFetcher(prefetch_batches=self.threaded_prefetch_batches)
+        self.train_data_fetcher.setup(train_dataloader, stage="train", profiler=self.trainer.profiler)
+        return self.train_data_fetcher
+
+    def teardown(self) -> None:
+        if self.train_data_fetcher is not None:
+            # stops the worker thread
+            self.train_data_fetcher.teardown()
+
     def prepare_data(self) -> None:
         # on multi-gpu jobs we only want to manipulate (download, etc) on node_rank=0, local_rank=0
         # or in the case where each node needs to do its own manipulation in which case just local_rank=0
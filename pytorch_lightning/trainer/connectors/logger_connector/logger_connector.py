@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 from pprint import pprint
-from typing import Any, Dict, Iterable, Mapping, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
 import torch
 
@@ -41,6 +41,8 @@ class LoggerConnector:
         self._current_fx: Optional[str] = None
         self._batch_idx: Optional[int] = None
         self._split_idx: Optional[int] = None
+        # metrics copied to host but not yet sent to the loggers, as `(metrics, step, default step, epoch, event)`
+        self._deferred_metrics: List[Tuple[Dict[str, _METRIC], Optional[int], int, int, Optional[Any]]] = []
 
     def on_trainer_init(
         self,
@@ -48,11 +50,13 @@ class LoggerConnector:
         flush_logs_every_n_steps: int,
         log_every_n_steps: int,
         move_metrics_to_cpu: bool,
+        defer_metrics_transfer: bool = False,
     ) -> None:
         self.configure_logger(logger)
         self.trainer.flush_logs_every_n_steps = flush_logs_every_n_steps
         self.trainer.log_every_n_steps = log_every_n_steps
         self.trainer.move_metrics_to_cpu = move_metrics_to_cpu
+        self.trainer.defer_metrics_transfer = defer_metrics_transfer
 
     @property
     def should_flush_logs(self) -> bool:
@@ -91,22 +95,65 @@ class LoggerConnector:
         if self.trainer.logger is None or not metrics:
             return
 
-        # turn all tensors to scalars
-        scalar_metrics = metrics_to_scalars(metrics)
+        if self.trainer.defer_metrics_transfer:
+            self._defer_metrics(metrics, step)
+            if self.should_flush_logs or len(self._deferred_metrics) >= self.trainer.flush_logs_every_n_steps:
+                self.flush_deferred_metrics()
+            return
+
+        self._log_scalar_metrics(
+            metrics_to_scalars(metrics), step, self.trainer.global_step, self.trainer.current_epoch
+        )
+        self.trainer.logger.save()
 
+    def _log_scalar_metrics(
+        self, scalar_metrics: Dict[str, float], step: Optional[int], global_step: int, epoch: int
+    ) -> None:
         if step is None:
             step = scalar_metrics.pop("step", None)
         if step is None:
             # added metrics for convenience
-            scalar_metrics.setdefault("epoch", self.trainer.current_epoch)
-            step = self.trainer.global_step
+            scalar_metrics.setdefault("epoch", epoch)
+            step = global_step
 
         # log actual metrics
         self.trainer.logger.agg_and_log_metrics(scalar_metrics, step=step)
-        self.trainer.logger.save()
 
         self._logged_metrics.update(scalar_metrics)
 
+    def _defer_metrics(self, metrics: Dict[str, _METRIC], step: Optional[int]) -> None:
+        """Starts copying the metrics to host without blocking, so the device keeps running until they are
+        flushed."""
+        event = None
+
+        def to_host(tensor: torch.Tensor) -> torch.Tensor:
+            nonlocal event
+            tensor = tensor.detach()
+            if tensor.device.type != "cuda":
+                return tensor
+            buffer = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+            buffer.copy_(tensor, non_blocking=True)
+            event = torch.cuda.Event()
+            return buffer
+
+        metrics = apply_to_collection(metrics, torch.Tensor, to_host)
+        if event is not None:
+            # the copies are enqueued on the current stream, one event marks the completion of all of them
+            event.record()
+        self._deferred_metrics.append((metrics, step, self.trainer.global_step, self.trainer.current_epoch, event))
+
+    def flush_deferred_metrics(self) -> None:
+        """Sends the metrics deferred with ``Trainer(defer_metrics_transfer=True)`` to the loggers, with the steps
+        they were logged at."""
+        if not self._deferred_metrics:
+            return
+        deferred_metrics, self._deferred_metrics = self._deferred_metrics, []
+        for metrics, step, global_step, epoch, event in deferred_metrics:
+            if event is not None:
+                event.synchronize()
+            self._log_scalar_metrics(metrics_to_scalars(metrics), step, global_step, epoch)
+        self.trainer.logger.save()
+
     """
     Evaluation metric updates
     """
@@ -168,6 +215,7 @@ class LoggerConnector:
         if not self.trainer.sanity_checking:
             # log all the metrics as a single dict
             self.log_metrics(metrics[MetricSource.LOG])
+            self.flush_deferred_metrics()
 
         self._prepare_eval_loop_results(metrics[MetricSource.CALLBACK])
 
@@ -218,6 +266,7 @@ class LoggerConnector:
         # add the metrics to the loggers
         assert self._epoch_end_reached
         self.log_metrics(self.metrics[MetricSource.LOG])
+        self.flush_deferred_metrics()
 
         # reset result collection for next epoch
         self.trainer._results.reset(metrics=True)
@@ -312,6 +361,7 @@ class LoggerConnector:
         return self._progress_bar_metrics
 
     def teardown(self):
+        self.flush_deferred_metrics()
         args = (torch.Tensor, move_data_to_device, "cpu")
         self._logged_metrics = apply_to_collection(self._logged_metrics, *args)
         self._progress_bar_metrics = apply_to_collection(self._progress_bar_metrics, *args)
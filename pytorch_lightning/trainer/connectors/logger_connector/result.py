@@ -11,6 +11,7 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections import defaultdict
 from collections.abc import Generator
 from dataclasses import asdict, dataclass, replace
 from functools import partial, wraps
@@ -23,6 +24,7 @@ from pytorch_lightning.core.mixins import DeviceDtypeModuleMixin
 from pytorch_lightning.utilities import rank_zero_warn
 from pytorch_lightning.utilities.apply_func import apply_to_collection, apply_to_collections, move_data_to_device
 from pytorch_lightning.utilities.data import extract_batch_size
+from pytorch_lightning.utilities.distributed import sync_ddp
 from pytorch_lightning.utilities.enums import LightningEnum
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.metrics import metrics_to_scalars
@@ -347,6 +349,8 @@ class ResultCollection(dict):
         self._minimize = None
         self._batch_size = torch.tensor(1, device=device)
         self.device: Optional[Union[str, torch.device]] = device
+        # the `self.log` arguments each key was last validated with
+        self._logged_args: Dict[str, tuple] = {}
 
     @property
     def result_metrics(self) -> List[ResultMetric]:
@@ -442,29 +446,46 @@ class ResultCollection(dict):
             key += f".{dataloader_idx}"
             fx += f".{dataloader_idx}"
 
-        meta = _Metadata(
-            fx=fx,
-            name=name,
-            prog_bar=prog_bar,
-            logger=logger,
-            on_step=on_step,
-            on_epoch=on_epoch,
-            enable_graph=enable_graph,
-            dataloader_idx=dataloader_idx,
-            metric_attribute=metric_attribute,
+        # performance: only build and validate the metadata when a key is logged for the first time or with
+        # different arguments
+        args = (
+            prog_bar,
+            logger,
+            on_step,
+            on_epoch,
+            reduce_fx,
+            enable_graph,
+            sync_dist,
+            sync_dist_fn,
+            sync_dist_group,
+            metric_attribute,
+            rank_zero_only,
         )
-        meta.reduce_fx = reduce_fx
-        meta.sync = _Sync(should=sync_dist, fn=sync_dist_fn, group=sync_dist_group, rank_zero_only=rank_zero_only)
+        if key not in self or self._logged_args.get(key) != args:
+            meta = _Metadata(
+                fx=fx,
+                name=name,
+                prog_bar=prog_bar,
+                logger=logger,
+                on_step=on_step,
+                on_epoch=on_epoch,
+                enable_graph=enable_graph,
+                dataloader_idx=dataloader_idx,
+                metric_attribute=metric_attribute,
+            )
+            meta.reduce_fx = reduce_fx
+            meta.sync = _Sync(should=sync_dist, fn=sync_dist_fn, group=sync_dist_group, rank_zero_only=rank_zero_only)
 
-        # register logged value if it doesn't exist
-        if key not in self:
-            self.register_key(key, meta, value)
+            # register logged value if it doesn't exist
+            if key not in self:
+                self.register_key(key, meta, value)
 
-        # check the stored metadata and the current one match
-        elif meta != self[key].meta:
-            raise MisconfigurationException(
-                f"You called `self.log({name}, ...)` twice in `{fx}` with different arguments. This is not allowed"
-            )
+            # check the stored metadata and the current one match
+            elif meta != self[key].meta:
+                raise MisconfigurationException(
+                    f"You called `self.log({name}, ...)` twice in `{fx}` with different arguments. This is not allowed"
+                )
+            self._logged_args[key] = args
 
         if batch_size is not None:
             self.batch_size = batch_size
@@ -489,7 +510,12 @@ class ResultCollection(dict):
             result_metric.forward(v.to(self.device), self.batch_size)
             result_metric.has_reset = False
 
-        apply_to_collections(self[key], value, ResultMetric, fn)
+        result_metric = self[key]
+        if isinstance(result_metric, ResultMetric) and isinstance(value, torch.Tensor):
+            # performance: skip the collection traversal for single values
+            fn(result_metric, value)
+            return
+        apply_to_collections(result_metric, value, ResultMetric, fn)
 
     @staticmethod
     def _get_cache(result_metric: ResultMetric, on_step: bool) -> Optional[torch.Tensor]:
@@ -524,9 +550,43 @@ class ResultCollection(dict):
             forked_name += dataloader_suffix
         return name, forked_name
 
+    def _compute_epoch_values(self) -> None:
+        """Computes the epoch values of the tensor metrics together. The accumulated states of the metrics sharing
+        the same synchronization are flattened into a single buffer, so each bucket is reduced with a single call to
+        the synchronization function instead of one per metric and state."""
+        buckets = defaultdict(list)
+        for result_metric in self.result_metrics:
+            meta = result_metric.meta
+            if (
+                not result_metric.is_tensor
+                or not meta.on_epoch
+                or result_metric.has_reset
+                or not result_metric._update_called
+                or result_metric._computed is not None
+            ):
+                continue
+            sync = meta.sync
+            key = (sync.fn, sync.op, sync.group, sync.rank_zero_only, result_metric.value.device)
+            buckets[key].append(result_metric)
+
+        for (fn, op, group, rank_zero_only, _), result_metrics in buckets.items():
+            mean_metrics = [rm for rm in result_metrics if rm.meta.is_mean_reduction]
+            states = [rm.value for rm in result_metrics] + [rm.cumulated_batch_size for rm in mean_metrics]
+            # always reduce on epoch end
+            sync = _Sync(fn=fn, should=True, op=op, group=group, rank_zero_only=rank_zero_only)
+            values = sync(torch.stack(states)).unbind()
+            cumulated_batch_sizes = dict(zip(map(id, mean_metrics), values[len(result_metrics) :]))
+            for result_metric, value in zip(result_metrics, values):
+                if result_metric.meta.is_mean_reduction:
+                    value = value / cumulated_batch_sizes[id(result_metric)]
+                result_metric._computed = value
+
     def metrics(self, on_step: bool) -> Dict[MetricSource, Dict[str, _METRIC]]:
         metrics = {k: {} for k in MetricSource}
 
+        if not on_step:
+            self._compute_epoch_values()
+
         for _, result_metric in self.valid_items():
 
             # extract forward_cache or computed from the ResultMetric. ignore when the output is None
@@ -606,9 +666,37 @@ class ResultCollection(dict):
         return self.to(device="cpu")
 
     def sync(self) -> None:
-        for result_metric in self.result_metrics:
-            if result_metric.is_tensor:
+        """Synchronizes the states of the tensor metrics across processes.
+
+        The states are bucketed by dtype, device and process group and each bucket is flattened into a single buffer,
+        so only one ``all_reduce`` is issued per bucket instead of one collective per metric state.
+        """
+        if not (torch.distributed.is_available() and torch.distributed.is_initialized()):
+            return
+
+        result_metrics = [result_metric for result_metric in self.result_metrics if result_metric.is_tensor]
+
+        buckets = defaultdict(list)
+        for result_metric in result_metrics:
+            if result_metric._is_synced:
+                # let `torchmetrics` raise its error
                 result_metric.sync()
+            # cache prior to syncing, as done by `Metric.sync`
+            result_metric._cache = {attr: getattr(result_metric, attr) for attr in result_metric._defaults}
+            # all the states are reduced with `torch.sum`
+            for attr in result_metric._reductions:
+                state = getattr(result_metric, attr)
+                buckets[(state.dtype, state.device, result_metric.process_group)].append((result_metric, attr, state))
+
+        for (_, _, group), states in buckets.items():
+            buffer = torch.cat([state.reshape(-1) for _, _, state in states])
+            buffer = sync_ddp(buffer, group=group, reduce_op="sum")
+            synced_states = buffer.split([state.numel() for _, _, state in states])
+            for (result_metric, attr, state), synced_state in zip(states, synced_states):
+                setattr(result_metric, attr, synced_state.view_as(state))
+
+        for result_metric in result_metrics:
+            result_metric._is_synced = True
 
     def unsync(self) -> None:
         for result_metric in self.result_metrics:
@@ -629,6 +717,8 @@ class ResultCollection(dict):
 
     def __getstate__(self, drop_value: bool = True) -> dict:
         d = self.__dict__.copy()
+        # the arguments can hold objects which can't be pickled, e.g. `sync_dist_fn`
+        d.pop("_logged_args", None)
 
         # can't deepcopy tensors with grad_fn
         minimize = d["_minimize"]
@@ -647,6 +737,7 @@ class ResultCollection(dict):
         self, state: dict, map_location: Optional[Union[str, torch.device]] = None, sync_fn: Optional[Callable] = None
     ) -> None:
         self.__dict__.update({k: v for k, v in state.items() if k != "items"})
+        self._logged_args = {}
 
         def setstate(k: str, item: dict) -> Union[ResultMetric, ResultMetricCollection]:
             if not isinstance(item, dict):
@@ -36,7 +36,7 @@ from pytorch_lightning.utilities.auto_restart import (
     CaptureIterableDataset,
     FastForwardSampler,
 )
-from pytorch_lightning.utilities.data import has_iterable_dataset, has_len
+from pytorch_lightning.utilities.data import BucketBatchSampler, has_iterable_dataset, has_len
 from pytorch_lightning.utilities.debugging import InternalDebugger
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.imports import _fault_tolerant_enabled
@@ -65,6 +65,7 @@ class TrainerDataLoadingMixin(ABC):
     accelerator_connector: AcceleratorConnector
     dev_debugger: InternalDebugger
     call_hook: Callable
+    tuner: "pl.tuner.tuning.Tuner"
 
     def _worker_check(self, dataloader: DataLoader, name: str) -> None:
         if not isinstance(dataloader, DataLoader):
@@ -121,7 +122,9 @@ class TrainerDataLoadingMixin(ABC):
     def auto_add_sampler(self, dataloader: Any, shuffle: bool, mode: Optional[RunningStage] = None) -> Any:
         if isinstance(dataloader, CombinedLoader):
             # apply `auto_add_sampler` on all the collection of loaders
-            dataloader.loaders = apply_to_collection(dataloader.loaders, DataLoader, self.auto_add_sampler, shuffle)
+            dataloader.loaders = apply_to_collection(
+                dataloader.loaders, DataLoader, self.auto_add_sampler, shuffle, mode=mode
+            )
             return dataloader
 
         # don't do anything if it's not a dataloader
@@ -156,11 +159,22 @@ class TrainerDataLoadingMixin(ABC):
         is_predicting = mode == RunningStage.PREDICTING
         # checking the batch sampler type is different than PyTorch default.
         if (batch_sampler is not None and type(batch_sampler) is not BatchSampler) or is_predicting:
-            batch_sampler = type(batch_sampler)(
-                sampler,
-                batch_size=batch_sampler.batch_size,
-                drop_last=(False if is_predicting else batch_sampler.drop_last),
-            )
+            if isinstance(batch_sampler, BucketBatchSampler):
+                if sampler is dataloader.sampler:
+                    # not replaced by a distributed sampler, the indices of the original sampler are kept
+                    sampler = batch_sampler.sampler
+                batch_sampler = BucketBatchSampler(
+                    sampler,
+                    batch_sampler.lengths,
+                    batch_sampler.max_tokens,
+                    max_batch_size=batch_sampler.max_batch_size,
+                )
+            else:
+                batch_sampler = type(batch_sampler)(
+                    sampler,
+                    batch_size=batch_sampler.batch_size,
+                    drop_last=(False if is_predicting else batch_sampler.drop_last),
+                )
             if is_predicting:
                 batch_sampler = IndexBatchSamplerWrapper(batch_sampler)
 
@@ -202,6 +216,9 @@ class TrainerDataLoadingMixin(ABC):
         # kwargs to re-construct the dataloader
         dl_kwargs = {k: v for k, v in attrs.items() if k in non_defaults}
         dl_kwargs.update(self._resolve_batch_sampler(dataloader, sampler, mode=mode))
+        if mode == RunningStage.TRAINING:
+            # the arguments found by `Tuner.tune_dataloader`
+            dl_kwargs.update(self.tuner.dataloader_kwargs)
 
         required_args = {
             p.name
@@ -286,7 +303,7 @@ class TrainerDataLoadingMixin(ABC):
 
         # automatically add samplers
         self.train_dataloader = apply_to_collection(
-            self.train_dataloader, DataLoader, self.auto_add_sampler, shuffle=True
+            self.train_dataloader, DataLoader, self.auto_add_sampler, shuffle=True, mode=RunningStage.TRAINING
         )
 
         # check the workers recursively
@@ -16,9 +16,10 @@ import logging
 import os
 import traceback
 import warnings
+from contextlib import contextmanager
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
 from weakref import proxy
 
 import torch
@@ -40,6 +41,7 @@ from pytorch_lightning.profiler import (
     PassThroughProfiler,
     PyTorchProfiler,
     SimpleProfiler,
+    TimelineProfiler,
     XLAProfiler,
 )
 from pytorch_lightning.trainer.callback_hook import TrainerCallbackHookMixin
@@ -77,7 +79,8 @@ from pytorch_lightning.utilities import (
 from pytorch_lightning.utilities.debugging import InternalDebugger
 from pytorch_lightning.utilities.distributed import distributed_available
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-from pytorch_lightning.utilities.imports import _fault_tolerant_enabled
+from pytorch_lightning.utilities.imports import _fault_tolerant_enabled, _TORCH_GREATER_EQUAL_1_9
+from pytorch_lightning.utilities.metrics import _clone_inference_metric_states
 from pytorch_lightning.utilities.model_helpers import is_overridden
 from pytorch_lightning.utilities.model_summary import ModelSummary, summarize
 from pytorch_lightning.utilities.seed import reset_seed
@@ -158,6 +161,9 @@ class Trainer(
         move_metrics_to_cpu: bool = False,
         multiple_trainloader_mode: str = "max_size_cycle",
         stochastic_weight_avg: bool = False,
+        defer_metrics_transfer: bool = False,
+        inference_mode: bool = False,
+        threaded_data_fetching: Union[bool, int] = False,
     ):
         r"""
         Customize every aspect of training via flags
@@ -182,7 +188,9 @@ class Trainer(
                 finder trying to find the largest batch size that fits into memory.
                 The result will be stored in self.batch_size in the LightningModule.
                 Additionally, can be set to either `power` that estimates the batch size through
-                a power search or `binsearch` that estimates the batch size through a binary search.
+                a power search, `binsearch` that estimates the batch size through a binary search, `memory`
+                that predicts it from a model of the memory used or `throughput` that picks the batch size processing
+                the most samples per second.
 
             auto_select_gpus: If enabled and `gpus` is an integer, pick available
                 gpus automatically. This is especially useful when
@@ -322,6 +330,10 @@ class Trainer(
             move_metrics_to_cpu: Whether to force internal logged metrics to be moved to cpu.
                 This can save some gpu memory, but can make training slower. Use with attention.
 
+            defer_metrics_transfer: Whether to copy the metrics sent to the loggers to host asynchronously instead of
+                synchronizing the device every time they are logged. The metrics are sent to the loggers, with the
+                steps they were logged at, every ``flush_logs_every_n_steps`` steps and at the end of each epoch.
+
             multiple_trainloader_mode: How to loop over the datasets when there are multiple train loaders.
                 In 'max_size_cycle' mode, the trainer ends one epoch when the largest dataset is traversed,
                 and smaller datasets reload when running out of their data. In 'min_size' mode, all the datasets
@@ -330,6 +342,14 @@ class Trainer(
             stochastic_weight_avg: Whether to use `Stochastic Weight Averaging (SWA)
                 <https://pytorch.org/blog/pytorch-1.6-now-includes-stochastic-weight-averaging/>_`
 
+            inference_mode: Whether to run ``trainer.validate``, ``trainer.test`` and ``trainer.predict`` under
+                :func:`torch.inference_mode` instead of :func:`torch.no_grad`. Falls back to the latter with
+                PyTorch < 1.9.
+
+            threaded_data_fetching: Whether to fetch the training batches from the dataloader on a background thread,
+                overlapping it with the training step. An int sets the number of batches pre-fetched by the thread,
+                ``True`` pre-fetches a single one. Not supported with fault-tolerant training.
+
         """
         super().__init__()
         Trainer._log_api_event("init")
@@ -340,7 +360,7 @@ class Trainer(
         # init connectors
         self.dev_debugger = InternalDebugger(self)
         self.config_validator = ConfigValidator(self)
-        self.data_connector = DataConnector(self, multiple_trainloader_mode)
+        self.data_connector = DataConnector(self, multiple_trainloader_mode, threaded_data_fetching)
         self.optimizer_connector = OptimizerConnector(self)
 
         self.accelerator_connector = AcceleratorConnector(
@@ -371,6 +391,10 @@ class Trainer(
         self.slurm_connector = SLURMConnector(self)
         self.tuner = Tuner(self)
 
+        # which of the trainer, `LightningModule` and accelerator implement each hook passed to `call_hook`
+        self._hook_dispatch_table: Dict[str, Tuple[bool, bool, bool]] = {}
+        self._hook_owners: Optional[Tuple[Optional["pl.LightningModule"], Accelerator]] = None
+
         fit_loop = FitLoop(
             min_epochs=(1 if (min_epochs is None and min_steps is None) else min_epochs),
             max_epochs=(1000 if (max_epochs is None and max_steps is None) else max_epochs),
@@ -437,6 +461,7 @@ class Trainer(
             terminate_on_nan,
         )
         self._setup_on_init(num_sanity_val_steps)
+        self._inference_mode = inference_mode
 
         # configure tuner
         self.tuner.on_trainer_init(auto_lr_find, auto_scale_batch_size)
@@ -445,7 +470,9 @@ class Trainer(
         self.__init_profiler(profiler)
 
         # init logger flags
-        self.logger_connector.on_trainer_init(logger, flush_logs_every_n_steps, log_every_n_steps, move_metrics_to_cpu)
+        self.logger_connector.on_trainer_init(
+            logger, flush_logs_every_n_steps, log_every_n_steps, move_metrics_to_cpu, defer_metrics_transfer
+        )
 
         # init debugging flags
         self.debugging_connector.on_init_start(
@@ -776,7 +803,8 @@ class Trainer(
         scale_batch_size_kwargs: Optional[Dict[str, Any]] = None,
         lr_find_kwargs: Optional[Dict[str, Any]] = None,
         train_dataloader=None,  # TODO: remove with 1.6
-    ) -> Dict[str, Optional[Union[int, _LRFinder]]]:
+        tune_dataloader_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Optional[Union[int, _LRFinder, Dict[str, Any]]]]:
         r"""
         Runs routines to tune hyperparameters before training.
 
@@ -794,6 +822,9 @@ class Trainer(
             scale_batch_size_kwargs: Arguments for :func:`~pytorch_lightning.tuner.batch_size_scaling.scale_batch_size`
 
             lr_find_kwargs: Arguments for :func:`~pytorch_lightning.tuner.lr_finder.lr_find`
+
+            tune_dataloader_kwargs: Arguments for :func:`~pytorch_lightning.tuner.dataloader_tuning.tune_dataloader`.
+                The dataloader tuning only runs when they are passed.
         """
         Trainer._log_api_event("tune")
 
@@ -822,7 +853,12 @@ class Trainer(
             model, train_dataloaders=train_dataloaders, val_dataloaders=val_dataloaders, datamodule=datamodule
         )
 
-        result = self.tuner._tune(model, scale_batch_size_kwargs=scale_batch_size_kwargs, lr_find_kwargs=lr_find_kwargs)
+        result = self.tuner._tune(
+            model,
+            scale_batch_size_kwargs=scale_batch_size_kwargs,
+            lr_find_kwargs=lr_find_kwargs,
+            tune_dataloader_kwargs=tune_dataloader_kwargs,
+        )
 
         assert self.state.stopped
         self.tuning = False
@@ -862,6 +898,8 @@ class Trainer(
         # hook
         self.data_connector.prepare_data()
         self.callback_connector._attach_model_callbacks()
+        # the hooks implemented by the model might have changed since the last run
+        self._hook_owners = None
 
         if self._ckpt_path and not self.accelerator.restore_checkpoint_after_pre_dispatch:
             self._load_checkpoint_weights()
@@ -990,6 +1028,7 @@ class Trainer(
         self.accelerator.teardown()
         self._active_loop.teardown()
         self.logger_connector.teardown()
+        self.data_connector.teardown()
 
     def _dispatch(self):
         if self.evaluating:
@@ -1072,6 +1111,7 @@ class Trainer(
                 self.training_type_plugin.reconciliate_processes(traceback.format_exc())
             # give accelerators a chance to finish
             self.accelerator.on_train_end()
+            self.data_connector.teardown()
             self._on_exception()
             # reset bookkeeping
             self.state.stage = None
@@ -1089,7 +1129,7 @@ class Trainer(
         # reset trainer on this loop and all child loops in case user connected a custom loop
         self._evaluation_loop.trainer = self
 
-        with self.profiler.profile(f"run_{self.state.stage}_evaluation"), torch.no_grad():
+        with self.profiler.profile(f"run_{self.state.stage}_evaluation"), self._evaluation_context():
             eval_loop_results = self._evaluation_loop.run()
 
         # remove the tensors from the eval results
@@ -1105,9 +1145,23 @@ class Trainer(
         self.reset_predict_dataloader(self.lightning_module)
         # reset trainer on this loop and all child loops in case user connected a custom loop
         self.predict_loop.trainer = self
-        with torch.no_grad():
+        with self._evaluation_context():
             return self.predict_loop.run()
 
+    @contextmanager
+    def _evaluation_context(self) -> Generator:
+        # `torch.inference_mode` also skips the version counter and view tracking of the tensors created, which can
+        # then not be used by autograd afterwards
+        use_inference_mode = self._inference_mode and _TORCH_GREATER_EQUAL_1_9
+        context_manager = torch.inference_mode if use_inference_mode else torch.no_grad
+        try:
+            with context_manager():
+                yield
+        finally:
+            if use_inference_mode and self.lightning_module is not None:
+                # the metric states reset during the run would otherwise fail the in-place updates of a later `fit`
+                _clone_inference_metric_states(self.lightning_module)
+
     def _run_sanity_check(self, ref_model):
         using_val_step = ref_model.val_dataloader is not None and is_overridden("validation_step", ref_model)
         should_sanity_check = using_val_step and self.num_sanity_val_steps > 0 and self.limit_val_batches > 0
@@ -1230,29 +1284,12 @@ class Trainer(
             prev_fx_name = self.lightning_module._current_fx_name
             self.lightning_module._current_fx_name = hook_name
 
-        # always profile hooks
-        with self.profiler.profile(hook_name):
-
-            # first call trainer hook
-            if hasattr(self, hook_name):
-                trainer_hook = getattr(self, hook_name)
-                trainer_hook(*args, **kwargs)
-
-            # next call hook in lightningModule
-            output = None
-            model_ref = self.lightning_module
-            if is_overridden(hook_name, model_ref):
-                hook_fx = getattr(model_ref, hook_name)
-                output = hook_fx(*args, **kwargs)
-
-            # call the accelerator hook
-            if hasattr(self.accelerator, hook_name):
-                accelerator_hook = getattr(self.accelerator, hook_name)
-                accelerator_output = accelerator_hook(*args, **kwargs)
-                # Rely on the accelerator output if lightningModule hook returns nothing
-                # Required for cases such as DataParallel where we reduce the output for the user
-                # todo: move this data parallel logic into the data parallel plugin
-                output = accelerator_output if output is None else output
+        # performance: the profiler context is skipped when profiling is disabled
+        if isinstance(self.profiler, PassThroughProfiler):
+            output = self._call_hook_implementers(hook_name, *args, **kwargs)
+        else:
+            with self.profiler.profile(hook_name):
+                output = self._call_hook_implementers(hook_name, *args, **kwargs)
 
         if self.lightning_module:
             # restore current_fx when nested context
@@ -1260,6 +1297,45 @@ class Trainer(
 
         return output
 
+    def _hook_implementers(self, hook_name: str) -> Tuple[bool, bool, bool]:
+        """Returns whether the trainer, the ``LightningModule`` and the accelerator implement ``hook_name``. The
+        result is computed once per hook and recomputed when the ``LightningModule`` or the accelerator change."""
+        owners = (self.lightning_module, self.accelerator)
+        if self._hook_owners is None or any(a is not b for a, b in zip(owners, self._hook_owners)):
+            self._hook_owners = owners
+            self._hook_dispatch_table = {}
+        implementers = self._hook_dispatch_table.get(hook_name)
+        if implementers is None:
+            implementers = (
+                hasattr(self, hook_name),
+                is_overridden(hook_name, self.lightning_module),
+                hasattr(self.accelerator, hook_name),
+            )
+            self._hook_dispatch_table[hook_name] = implementers
+        return implementers
+
+    def _call_hook_implementers(self, hook_name: str, *args, **kwargs) -> Any:
+        trainer_hook, model_hook, accelerator_hook = self._hook_implementers(hook_name)
+
+        # first call trainer hook
+        if trainer_hook:
+            getattr(self, hook_name)(*args, **kwargs)
+
+        # next call hook in lightningModule
+        output = None
+        if model_hook:
+            output = getattr(self.lightning_module, hook_name)(*args, **kwargs)
+
+        # call the accelerator hook
+        if accelerator_hook:
+            accelerator_output = getattr(self.accelerator, hook_name)(*args, **kwargs)
+            # Rely on the accelerator output if lightningModule hook returns nothing
+            # Required for cases such as DataParallel where we reduce the output for the user
+            # todo: move this data parallel logic into the data parallel plugin
+            output = accelerator_output if output is None else output
+
+        return output
+
     @staticmethod
     def _parse_devices(
         gpus: Optional[Union[List[int], str, int]],
@@ -1285,6 +1361,7 @@ class Trainer(
                 "advanced": AdvancedProfiler,
                 "pytorch": PyTorchProfiler,
                 "xla": XLAProfiler,
+                "timeline": TimelineProfiler,
             }
             profiler = profiler.lower()
             if profiler not in PROFILERS:
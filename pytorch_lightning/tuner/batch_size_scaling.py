@@ -13,9 +13,14 @@
 # limitations under the License
 import logging
 import os
-from typing import Optional, Tuple
+import time
+from typing import List, Optional, Tuple
+
+import numpy as np
+import torch
 
 import pytorch_lightning as pl
+from pytorch_lightning.callbacks import Callback
 from pytorch_lightning.loggers.base import DummyLogger
 from pytorch_lightning.utilities import rank_zero_warn
 from pytorch_lightning.utilities.cloud_io import get_filesystem
@@ -26,6 +31,9 @@ from pytorch_lightning.utilities.parsing import lightning_getattr, lightning_has
 
 log = logging.getLogger(__name__)
 
+# relative growth of the peak memory needed to fit the memory model
+_MIN_MEMORY_GROWTH = 0.05
+
 
 def scale_batch_size(
     trainer: "pl.Trainer",
@@ -35,6 +43,8 @@ def scale_batch_size(
     init_val: int = 2,
     max_trials: int = 25,
     batch_arg_name: str = "batch_size",
+    memory_headroom: float = 0.1,
+    throughput_tolerance: float = 0.05,
 ) -> Optional[int]:
     """See :meth:`~pytorch_lightning.tuner.tuning.Tuner.scale_batch_size`"""
     if trainer.fast_dev_run:
@@ -75,8 +85,14 @@ def scale_batch_size(
         new_size = _run_power_scaling(trainer, model, new_size, batch_arg_name, max_trials)
     elif mode == "binsearch":
         new_size = _run_binsearch_scaling(trainer, model, new_size, batch_arg_name, max_trials)
+    elif mode == "memory":
+        new_size = _run_memory_scaling(trainer, model, new_size, batch_arg_name, max_trials, memory_headroom)
+    elif mode == "throughput":
+        new_size = _run_throughput_scaling(trainer, model, new_size, batch_arg_name, max_trials, throughput_tolerance)
     else:
-        raise ValueError("mode in method `scale_batch_size` could either be `power` or `binsearch`")
+        raise ValueError(
+            "mode in method `scale_batch_size` could either be `power`, `binsearch`, `memory` or `throughput`"
+        )
 
     garbage_collection_cuda()
     log.info(f"Finished batch size finder, will continue with full run using batch size {new_size}")
@@ -217,6 +233,297 @@ def _run_binsearch_scaling(
     return new_size
 
 
+def _run_memory_scaling(
+    trainer: "pl.Trainer",
+    model: "pl.LightningModule",
+    new_size: int,
+    batch_arg_name: str,
+    max_trials: int,
+    memory_headroom: float,
+) -> int:
+    """Batch scaling mode where the peak memory is measured at small batch sizes to fit a linear model of the memory
+    against the batch size. The largest batch size predicted to fit within the memory capacity minus the headroom is
+    then verified with a single trial.
+
+    The batch size is doubled until at least three sizes are measured and the peak memory grew by
+    ``_MIN_MEMORY_GROWTH``, so that the growth is not hidden by the measurement noise. On CPU, the peak includes the
+    memory of the whole process and grows slowly in relative terms, so the doubling also stops as soon as the model
+    fitted on the sizes measured so far predicts that the next size would not fit.
+    """
+    if not 0 <= memory_headroom < 1:
+        raise MisconfigurationException(f"`memory_headroom` should be in [0, 1), got {memory_headroom}.")
+    device = trainer.training_type_plugin.root_device
+    if device.type == "cpu" and not os.path.exists("/proc/self/clear_refs"):
+        raise MisconfigurationException("The `memory` batch size scaling mode on CPU requires a Linux `/proc`.")
+
+    budget = (1 - memory_headroom) * _memory_capacity(device)
+    sizes: List[int] = []
+    peaks: List[int] = []
+    for _ in range(max_trials):
+        try:
+            peak = _measure_peak_memory(trainer, model, device)
+        except RuntimeError as exception:
+            if not is_oom_error(exception):
+                raise
+            # the measurements already do not fit
+            garbage_collection_cuda()
+            new_size, _ = _adjust_batch_size(trainer, batch_arg_name, factor=0.5, desc="failed")
+            return new_size
+        sizes.append(new_size)
+        peaks.append(peak)
+        log.info(f"Batch size {new_size} uses a peak memory of {peak} bytes")
+        if len(sizes) >= 3 and peaks[-1] - peaks[0] >= _MIN_MEMORY_GROWTH * peaks[0]:
+            break
+        if len(sizes) >= 2 and np.polyval(np.polyfit(sizes[-3:], peaks[-3:], 1), 2 * new_size) > budget:
+            # the next size is predicted to not fit
+            break
+        new_size, changed = _adjust_batch_size(trainer, batch_arg_name, factor=2.0)
+        if not changed:
+            # the whole dataset is already used
+            return new_size
+        trainer.reset_train_dataloader(model)
+
+    else:
+        # not enough measurements to fit the model
+        if sizes:
+            new_size, _ = _adjust_batch_size(trainer, batch_arg_name, value=sizes[-1])
+        return new_size
+
+    # the largest sizes are the least affected by the noise
+    slope, intercept = np.polyfit(sizes[-3:], peaks[-3:], 1)
+    if slope <= 0:
+        rank_zero_warn("The peak memory does not grow with the batch size, keeping the largest size measured.")
+        return new_size
+
+    predicted = max(int((budget - intercept) // slope), 1)
+    new_size, changed = _adjust_batch_size(trainer, batch_arg_name, value=predicted, desc="modeled")
+    if changed:
+        trainer.reset_train_dataloader(model)
+    if max_trials <= len(sizes):
+        return new_size
+
+    # verify the prediction with a single trial
+    try:
+        peak = _measure_peak_memory(trainer, model, device)
+        if peak <= budget:
+            return new_size
+        rank_zero_warn(f"Batch size {new_size} uses {peak} bytes, more than the {int(budget)} bytes predicted to fit.")
+    except RuntimeError as exception:
+        if not is_oom_error(exception):
+            raise
+        garbage_collection_cuda()
+    # the model was wrong, use the largest measured size which fits
+    fitting = [size for size, peak in zip(sizes, peaks) if peak <= budget]
+    new_size, _ = _adjust_batch_size(trainer, batch_arg_name, value=fitting[-1] if fitting else sizes[0], desc="failed")
+    return new_size
+
+
+class _BatchSizeThroughput:
+    """Stores the samples per second measured for each batch size by the ``throughput`` batch size scaling mode.
+
+    Example::
+
+        trainer.tuner.scale_batch_size(model, mode="throughput")
+
+        # Results stored in
+        trainer.tuner.batch_size_throughput.results
+
+        # Plot using
+        trainer.tuner.batch_size_throughput.plot()
+
+        # Get suggestion
+        batch_size = trainer.tuner.batch_size_throughput.suggestion()
+    """
+
+    def __init__(self) -> None:
+        self.results = {"batch_size": [], "samples_per_sec": []}
+        self._optimal_idx: Optional[int] = None
+
+    def plot(self, suggest: bool = False, show: bool = False):
+        """Plot results from the throughput batch size scaling
+        Args:
+            suggest: if True, will mark suggested batch size to use with a red point
+
+            show: if True, will show figure
+        """
+        import matplotlib.pyplot as plt
+
+        sizes = self.results["batch_size"]
+        throughputs = self.results["samples_per_sec"]
+
+        fig, ax = plt.subplots()
+
+        # Plot the throughput as a function of the batch size
+        ax.plot(sizes, throughputs, marker="o")
+        ax.set_xscale("log")
+        ax.set_xlabel("Batch size")
+        ax.set_ylabel("Samples per second")
+
+        if suggest:
+            _ = self.suggestion()
+            if self._optimal_idx is not None:
+                ax.plot(
+                    sizes[self._optimal_idx], throughputs[self._optimal_idx], markersize=10, marker="o", color="red"
+                )
+
+        if show:
+            plt.show()
+
+        return fig
+
+    def suggestion(self, tolerance: float = 0.05) -> Optional[int]:
+        """Proposes the knee of the throughput curve: the smallest batch size reaching ``1 - tolerance`` of the best
+        throughput. Set ``tolerance=0`` to get the batch size with the best throughput.
+
+        Returns:
+            The suggested batch size or ``None`` if no batch size was measured.
+        """
+        throughputs = self.results["samples_per_sec"]
+        if not throughputs:
+            self._optimal_idx = None
+            return None
+        threshold = (1 - tolerance) * max(throughputs)
+        self._optimal_idx = next(i for i, throughput in enumerate(throughputs) if throughput >= threshold)
+        return self.results["batch_size"][self._optimal_idx]
+
+
+class _ThroughputCallback(Callback):
+    """Records the end time of each training batch, so that the throughput includes the time spent loading the
+    data."""
+
+    def __init__(self) -> None:
+        self.times: List[float] = []
+
+    def on_train_epoch_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule") -> None:
+        self.times = [time.perf_counter()]
+
+    def on_train_batch_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", *_) -> None:
+        if pl_module.device.type == "cuda":
+            # wait for the asynchronous kernels of this step
+            torch.cuda.synchronize(pl_module.device)
+        self.times.append(time.perf_counter())
+
+    def samples_per_sec(self, batch_size: int) -> float:
+        # the first batch pays for the warm up, e.g. starting the dataloader workers, unless it is the only one
+        times = self.times[1:] if len(self.times) > 2 else self.times
+        return batch_size * (len(times) - 1) / (times[-1] - times[0])
+
+
+def _run_throughput_scaling(
+    trainer: "pl.Trainer",
+    model: "pl.LightningModule",
+    new_size: int,
+    batch_arg_name: str,
+    max_trials: int,
+    throughput_tolerance: float,
+) -> int:
+    """Batch scaling mode where the size is doubled at each iteration until an OOM error is encountered, and the
+    samples per second are timed at each size. The smallest size within ``throughput_tolerance`` of the best
+    throughput is chosen."""
+    throughput = trainer.tuner.batch_size_throughput = _BatchSizeThroughput()
+    callback = _ThroughputCallback()
+    trainer.callbacks = [callback]
+    for _ in range(max_trials):
+        garbage_collection_cuda()
+        trainer.fit_loop.global_step = 0  # reset after each try
+        try:
+            trainer.tuner._run(model)
+        except RuntimeError as exception:
+            if is_oom_error(exception):
+                garbage_collection_cuda()
+                break
+            raise  # some other error not memory related
+        if len(callback.times) < 2:
+            # no batch was run
+            break
+        samples_per_sec = callback.samples_per_sec(new_size)
+        throughput.results["batch_size"].append(new_size)
+        throughput.results["samples_per_sec"].append(samples_per_sec)
+        log.info(f"Batch size {new_size} processes {samples_per_sec:.1f} samples per second")
+
+        new_size, changed = _adjust_batch_size(trainer, batch_arg_name, factor=2.0)
+        if not changed:
+            break
+        trainer.reset_train_dataloader(model)
+
+    suggestion = throughput.suggestion(throughput_tolerance)
+    if suggestion is not None:
+        new_size, _ = _adjust_batch_size(trainer, batch_arg_name, value=suggestion)
+    return new_size
+
+
+def _measure_peak_memory(trainer: "pl.Trainer", model: "pl.LightningModule", device: torch.device) -> int:
+    garbage_collection_cuda()
+    trainer.fit_loop.global_step = 0  # reset after each try
+    _reset_peak_memory(device)
+    trainer.tuner._run(model)
+    return _peak_memory(device)
+
+
+def _reset_peak_memory(device: torch.device) -> None:
+    if device.type == "cuda":
+        torch.cuda.reset_peak_memory_stats(device)
+    else:
+        # resets the peak resident set size reported as `VmHWM`
+        try:
+            with open("/proc/self/clear_refs", "w") as f:
+                f.write("5")
+        except PermissionError as exception:
+            raise MisconfigurationException(
+                "The `memory` batch size scaling mode on CPU needs to write to `/proc/self/clear_refs` to reset the"
+                " peak memory, which is not permitted in this environment."
+            ) from exception
+
+
+def _peak_memory(device: torch.device) -> int:
+    """Returns the peak memory in bytes since the last call to ``_reset_peak_memory``."""
+    if device.type == "cuda":
+        return torch.cuda.max_memory_allocated(device)
+    return _read_proc_kb("/proc/self/status", "VmHWM:")
+
+
+def _memory_capacity(device: torch.device) -> int:
+    """Returns the memory in bytes which the process can use, including what it already uses."""
+    if device.type == "cuda":
+        return torch.cuda.get_device_properties(device).total_memory
+    available = _read_proc_kb("/proc/meminfo", "MemAvailable:")
+    cgroup_available = _cgroup_memory_available()
+    if cgroup_available is not None:
+        # `MemAvailable` is the memory of the host, not the one of the container
+        available = min(available, cgroup_available)
+    return _read_proc_kb("/proc/self/status", "VmRSS:") + available
+
+
+def _cgroup_memory_available() -> Optional[int]:
+    """Returns the memory in bytes left under the limit of the cgroup of the process, ``None`` if it is not
+    limited."""
+    for limit_path, usage_path in (
+        # cgroup v2
+        ("/sys/fs/cgroup/memory.max", "/sys/fs/cgroup/memory.current"),
+        # cgroup v1
+        ("/sys/fs/cgroup/memory/memory.limit_in_bytes", "/sys/fs/cgroup/memory/memory.usage_in_bytes"),
+    ):
+        try:
+            with open(limit_path) as f:
+                limit = f.read().strip()
+            with open(usage_path) as f:
+                usage = int(f.read().strip())
+        except (OSError, ValueError):
+            continue
+        if limit == "max":
+            return None
+        return max(int(limit) - usage, 0)
+    return None
+
+
+def _read_proc_kb(path: str, key: str) -> int:
+    with open(path) as f:
+        for line in f:
+            if line.startswith(key):
+                return int(line.split()[1]) * 1024
+    raise MisconfigurationException(f"`{key}` not found in `{path}`.")
+
+
 def _adjust_batch_size(
     trainer: "pl.Trainer",
     batch_arg_name: str = "batch_size",
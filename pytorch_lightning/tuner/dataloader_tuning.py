@@ -0,0 +1,243 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License
+import itertools
+import logging
+import multiprocessing
+import os
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import torch
+from torch.utils.data import DataLoader
+
+import pytorch_lightning as pl
+from pytorch_lightning.callbacks import Callback
+from pytorch_lightning.loggers.base import DummyLogger
+from pytorch_lightning.trainer.states import RunningStage
+from pytorch_lightning.utilities import rank_zero_warn
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.cloud_io import get_filesystem
+from pytorch_lightning.utilities.data import has_iterable_dataset, has_len
+from pytorch_lightning.utilities.enums import DeviceType
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.utilities.imports import _TORCH_GREATER_EQUAL_1_7
+
+log = logging.getLogger(__name__)
+
+
+def tune_dataloader(
+    trainer: "pl.Trainer",
+    model: "pl.LightningModule",
+    num_workers: Optional[Sequence[int]] = None,
+    prefetch_factor: Sequence[int] = (2, 4),
+    persistent_workers: Sequence[bool] = (False, True),
+    pin_memory: Optional[Sequence[bool]] = None,
+    steps_per_trial: int = 10,
+    num_batches: int = 20,
+) -> Optional[Dict[str, Any]]:
+    """See :meth:`~pytorch_lightning.tuner.tuning.Tuner.tune_dataloader`"""
+    if trainer.fast_dev_run:
+        rank_zero_warn("Skipping dataloader tuning since fast_dev_run is enabled.", UserWarning)
+        return
+    if steps_per_trial < 2 or num_batches < 1:
+        raise MisconfigurationException(
+            f"`steps_per_trial` should be at least 2 and `num_batches` at least 1,"
+            f" got {steps_per_trial} and {num_batches}."
+        )
+
+    # the previously tuned arguments are measured again with the rest of the grid
+    trainer.tuner.dataloader_kwargs = {}
+    save_path = os.path.join(trainer.default_root_dir, "tune_dataloader_temp_model.ckpt")
+
+    __tune_dataloader_dump_params(trainer)
+    trainer.auto_lr_find = False
+    trainer.auto_scale_batch_size = False
+    callback = _StepTimeCallback()
+    trainer.callbacks = [callback]
+    trainer.logger = DummyLogger()
+    trainer.fit_loop.max_steps = steps_per_trial
+    trainer.fit_loop.current_epoch = 0
+    trainer.fit_loop.global_step = 0
+    if trainer.progress_bar_callback:
+        trainer.progress_bar_callback.disable()
+    # required for saving the model
+    trainer.optimizers, trainer.lr_schedulers = [], []
+    trainer.model = model
+    trainer.save_checkpoint(str(save_path))
+
+    # measure the model step time, the batches are fetched by the dataloaders as they are configured
+    trainer.tuner._run(model)
+    step_time = callback.step_time()
+    loaders = []
+    apply_to_collection(trainer.train_dataloader.loaders, DataLoader, loaders.append)
+
+    if trainer.is_global_zero:
+        trainer.checkpoint_connector.restore(str(save_path))
+        fs = get_filesystem(str(save_path))
+        if fs.exists(save_path):
+            fs.rm(save_path)
+    __tune_dataloader_restore_params(trainer)
+    if trainer.progress_bar_callback:
+        trainer.progress_bar_callback.enable()
+
+    if step_time is None:
+        rank_zero_warn("Skipping dataloader tuning as the model step time could not be measured.", UserWarning)
+        return
+    if not loaders or any(has_iterable_dataset(dl) for dl in loaders):
+        # the workers of an `IterableDataset` would each produce the full dataset unless it splits itself
+        rank_zero_warn("Skipping dataloader tuning as it requires map-style datasets.", UserWarning)
+        return
+
+    if num_workers is None:
+        num_cpus = multiprocessing.cpu_count()
+        num_workers = sorted({0, num_cpus} | {2 ** i for i in range(num_cpus.bit_length()) if 2 ** i < num_cpus})
+    if pin_memory is None:
+        # pinned memory is required for asynchronous copies to the GPU
+        pin_memory = (trainer._device_type == DeviceType.GPU,)
+    epoch_length = min(len(dl) for dl in loaders) if all(has_len(dl) for dl in loaders) else float("inf")
+
+    fetch_times = []
+    for config in _grid(num_workers, prefetch_factor, persistent_workers, pin_memory):
+        trainer.tuner.dataloader_kwargs = config
+        candidates = [trainer.replace_sampler(dl, dl.sampler, mode=RunningStage.TRAINING) for dl in loaders]
+        trainer.tuner.dataloader_kwargs = {}
+        fetch_time = _measure_fetch_time(candidates, num_batches, epoch_length)
+        log.info(f"Dataloader configuration {config} fetches a batch in {fetch_time * 1000:.3f} ms")
+        fetch_times.append((config, fetch_time))
+
+    # the configurations are ordered from the cheapest to the most expensive. Without workers, the batches are fetched
+    # between the steps instead of in the background, so only the configurations with workers hide the fetch time
+    config = next(
+        (config for config, fetch_time in fetch_times if config["num_workers"] > 0 and fetch_time < step_time), None
+    )
+    if config is None:
+        config = min(fetch_times, key=lambda x: _iteration_time(x[0], x[1], step_time))[0]
+        rank_zero_warn(
+            f"No dataloader configuration with workers fetches the batches faster than the model step"
+            f" ({step_time * 1000:.3f} ms). The fastest one is used: {config}."
+        )
+    log.info(f"Finished dataloader tuning, will continue with full run using {config}")
+    trainer.tuner.dataloader_kwargs = config
+    # the dataloaders attached by the step time measurement are re-instantiated with the arguments found
+    trainer.reset_train_dataloader(model)
+    return config
+
+
+def __tune_dataloader_dump_params(trainer: "pl.Trainer") -> None:
+    trainer.__dumped_params = {
+        "auto_lr_find": trainer.auto_lr_find,
+        "auto_scale_batch_size": trainer.auto_scale_batch_size,
+        "callbacks": trainer.callbacks,
+        "logger": trainer.logger,
+        "max_steps": trainer.max_steps,
+        "current_epoch": trainer.current_epoch,
+        "model": trainer.model,
+    }
+
+
+def __tune_dataloader_restore_params(trainer: "pl.Trainer") -> None:
+    trainer.auto_lr_find = trainer.__dumped_params["auto_lr_find"]
+    trainer.auto_scale_batch_size = trainer.__dumped_params["auto_scale_batch_size"]
+    trainer.callbacks = trainer.__dumped_params["callbacks"]
+    trainer.logger = trainer.__dumped_params["logger"]
+    trainer.fit_loop.max_steps = trainer.__dumped_params["max_steps"]
+    trainer.fit_loop.current_epoch = trainer.__dumped_params["current_epoch"]
+    trainer.model = trainer.__dumped_params["model"]
+    del trainer.__dumped_params
+
+
+def _grid(
+    num_workers: Sequence[int],
+    prefetch_factor: Sequence[int],
+    persistent_workers: Sequence[bool],
+    pin_memory: Sequence[bool],
+) -> List[Dict[str, Any]]:
+    """Returns the valid dataloader configurations, from the one using the fewest resources to the one using the
+    most."""
+    configs = []
+    for workers, pin in itertools.product(sorted(num_workers), sorted(pin_memory)):
+        if not _TORCH_GREATER_EQUAL_1_7:
+            configs.append({"num_workers": workers, "pin_memory": pin})
+            continue
+        if workers == 0:
+            # both arguments require workers
+            configs.append({"num_workers": 0, "pin_memory": pin, "prefetch_factor": 2, "persistent_workers": False})
+            continue
+        for persistent, prefetch in itertools.product(sorted(persistent_workers), sorted(prefetch_factor)):
+            configs.append(
+                {
+                    "num_workers": workers,
+                    "pin_memory": pin,
+                    "prefetch_factor": prefetch,
+                    "persistent_workers": persistent,
+                }
+            )
+    return configs
+
+
+def _iteration_time(config: Dict[str, Any], fetch_time: float, step_time: float) -> float:
+    """Estimates the duration of a training iteration with the given dataloader configuration."""
+    if config["num_workers"] == 0:
+        return step_time + fetch_time
+    return max(step_time, fetch_time)
+
+
+def _measure_fetch_time(loaders: List[DataLoader], num_batches: int, epoch_length: float) -> float:
+    """Returns the time spent fetching a batch from each dataloader, including the start of the workers spread over
+    the batches of an epoch."""
+    if getattr(loaders[0], "persistent_workers", False):
+        # the workers are only started by the first epoch
+        for dl in loaders:
+            next(iter(dl))
+    num_batches = int(min(num_batches, epoch_length - 1))
+
+    start = time.perf_counter()
+    iterators = [iter(dl) for dl in loaders]
+    for iterator in iterators:
+        next(iterator)
+    warm_up = time.perf_counter() - start
+    if num_batches < 1:
+        return warm_up
+
+    start = time.perf_counter()
+    for _ in range(num_batches):
+        for iterator in iterators:
+            next(iterator)
+    fetch_time = (time.perf_counter() - start) / num_batches
+    # shut down the workers
+    del iterators
+    return fetch_time + warm_up / epoch_length
+
+
+class _StepTimeCallback(Callback):
+    """Records the time spent by the model on each training batch, excluding the time spent fetching it."""
+
+    def __init__(self) -> None:
+        self.start: Optional[float] = None
+        self.durations: List[float] = []
+
+    def on_train_batch_start(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", *_) -> None:
+        self.start = time.perf_counter()
+
+    def on_train_batch_end(self, trainer: "pl.Trainer", pl_module: "pl.LightningModule", *_) -> None:
+        if pl_module.device.type == "cuda":
+            # wait for the asynchronous kernels of this step
+            torch.cuda.synchronize(pl_module.device)
+        self.durations.append(time.perf_counter() - self.start)
+
+    def step_time(self) -> Optional[float]:
+        # the first step pays for the warm up
+        durations = self.durations[1:]
+        return float(np.median(durations)) if durations else None
@@ -13,9 +13,11 @@
 # limitations under the License.
 import importlib
 import logging
+import math
 import os
+from copy import deepcopy
 from functools import wraps
-from typing import Callable, Optional, Sequence
+from typing import Any, Callable, List, Optional, Sequence
 
 import numpy as np
 import torch
@@ -25,6 +27,7 @@ from torch.optim.lr_scheduler import _LRScheduler
 import pytorch_lightning as pl
 from pytorch_lightning.callbacks import Callback
 from pytorch_lightning.loggers.base import DummyLogger
+from pytorch_lightning.plugins import ParallelPlugin
 from pytorch_lightning.utilities import rank_zero_warn
 from pytorch_lightning.utilities.cloud_io import get_filesystem
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -39,6 +42,33 @@ else:
 
 log = logging.getLogger(__name__)
 
+# every learning rate is trained for `num_training` steps when several are evaluated in one run
+_MULTI_LR_NUM_TRAINING = 20
+# the loss within which the largest learning rate is suggested, relative to the lowest loss
+_MULTI_LR_LOSS_TOLERANCE = 0.05
+
+
+def _get_single_optimizer(optim_conf: Any) -> Optimizer:
+    # Decide the structure of the output from configure_optimizers
+    # Same logic as method `init_optimizers` in trainer/optimizers.py
+    if isinstance(optim_conf, Optimizer):
+        optimizers = [optim_conf]
+    elif isinstance(optim_conf, (list, tuple)) and len(optim_conf) == 2 and isinstance(optim_conf[0], list):
+        optimizers, _ = optim_conf
+    elif isinstance(optim_conf, dict):
+        optimizers = [optim_conf["optimizer"]]
+    elif isinstance(optim_conf, (list, tuple)) and isinstance(optim_conf[0], dict):
+        optimizers = [opt_dict["optimizer"] for opt_dict in optim_conf]
+    elif isinstance(optim_conf, (list, tuple)):
+        optimizers = [optim_conf]
+
+    if len(optimizers) != 1:
+        raise MisconfigurationException(
+            f"`model.configure_optimizers()` returned {len(optimizers)}, but"
+            " learning rate finder only works with single optimizer"
+        )
+    return optimizers[0]
+
 
 def _determine_lr_attr_name(trainer: "pl.Trainer", model: "pl.LightningModule") -> str:
     if isinstance(trainer.auto_lr_find, str):
@@ -72,6 +102,9 @@ class _LRFinder:
 
         num_training: number of steps to take between lr_min and lr_max
 
+        num_lrs: number of learning rates evaluated in one run. When larger than 1, the results hold the smoothed loss
+            reached by each learning rate after ``num_training`` steps instead of the losses of a single sweep.
+
     Example::
         # Run lr finder
         lr_finder = trainer.lr_find(model)
@@ -86,13 +119,14 @@ class _LRFinder:
         lr = lr_finder.suggestion()
     """
 
-    def __init__(self, mode: str, lr_min: float, lr_max: float, num_training: int):
+    def __init__(self, mode: str, lr_min: float, lr_max: float, num_training: int, num_lrs: int = 1):
         assert mode in ("linear", "exponential"), "mode should be either `linear` or `exponential`"
 
         self.mode = mode
         self.lr_min = lr_min
         self.lr_max = lr_max
         self.num_training = num_training
+        self.num_lrs = num_lrs
 
         self.results = {}
         self._total_batch_idx = 0  # for debug purpose
@@ -105,27 +139,13 @@ class _LRFinder:
 
         @wraps(configure_optimizers)
         def func():
-            # Decide the structure of the output from configure_optimizers
-            # Same logic as method `init_optimizers` in trainer/optimizers.py
-            optim_conf = configure_optimizers()
-            if isinstance(optim_conf, Optimizer):
-                optimizers = [optim_conf]
-            elif isinstance(optim_conf, (list, tuple)) and len(optim_conf) == 2 and isinstance(optim_conf[0], list):
-                optimizers, _ = optim_conf
-            elif isinstance(optim_conf, dict):
-                optimizers = [optim_conf["optimizer"]]
-            elif isinstance(optim_conf, (list, tuple)) and isinstance(optim_conf[0], dict):
-                optimizers = [opt_dict["optimizer"] for opt_dict in optim_conf]
-            elif isinstance(optim_conf, (list, tuple)):
-                optimizers = [optim_conf]
-
-            if len(optimizers) != 1:
-                raise MisconfigurationException(
-                    f"`model.configure_optimizers()` returned {len(optimizers)}, but"
-                    " learning rate finder only works with single optimizer"
-                )
-
-            optimizer = optimizers[0]
+            optimizer = _get_single_optimizer(configure_optimizers())
+
+            if self.num_lrs > 1:
+                # the model itself evaluates the first learning rate, the others are evaluated by its copies
+                for param_group in optimizer.param_groups:
+                    param_group["lr"] = self.evaluated_lrs()[0]
+                return [optimizer], []
 
             new_lrs = [self.lr_min] * len(optimizer.param_groups)
             for param_group, new_lr in zip(optimizer.param_groups, new_lrs):
@@ -170,6 +190,12 @@ class _LRFinder:
 
         return fig
 
+    def evaluated_lrs(self) -> List[float]:
+        """The learning rates evaluated when ``num_lrs > 1``, spaced between ``lr_min`` and ``lr_max`` following
+        the mode."""
+        space = np.linspace if self.mode == "linear" else np.geomspace
+        return space(self.lr_min, self.lr_max, self.num_lrs).tolist()
+
     def suggestion(self, skip_begin: int = 10, skip_end: int = 1):
         """This will propose a suggestion for choice of initial learning rate
         as the point with the steepest negative gradient.
@@ -179,7 +205,11 @@ class _LRFinder:
             skip_begin: how many samples to skip in the beginning. Prevent too naive estimates
             skip_end: how many samples to skip in the end. Prevent too optimistic estimates
 
+        When several learning rates were evaluated, no sample is skipped as there is a single loss per
+        learning rate, and the learning rates whose training diverged are ignored.
         """
+        if self.num_lrs > 1:
+            return self._multi_lr_suggestion()
         try:
             loss = np.array(self.results["loss"][skip_begin:-skip_end])
             loss = loss[np.isfinite(loss)]
@@ -191,22 +221,54 @@ class _LRFinder:
             log.exception("Failed to compute suggesting for `lr`. There might not be enough points.")
             self._optimal_idx = None
 
+    def _multi_lr_suggestion(self) -> Optional[float]:
+        # the losses come from independent runs, so the largest learning rate reaching about the lowest loss is picked
+        loss = np.array(self.results["loss"], dtype=float)
+        finite = np.flatnonzero(np.isfinite(loss))
+        if not len(finite):
+            log.error("Failed to compute a suggestion for `lr`. The training diverged with every learning rate.")
+            self._optimal_idx = None
+            return
+        best_loss = loss[finite].min()
+        close = finite[loss[finite] <= best_loss + _MULTI_LR_LOSS_TOLERANCE * abs(best_loss)]
+        self._optimal_idx = int(max(close, key=lambda i: self.results["lr"][i]))
+        return self.results["lr"][self._optimal_idx]
+
 
 def lr_find(
     trainer: "pl.Trainer",
     model: "pl.LightningModule",
     min_lr: float = 1e-8,
     max_lr: float = 1,
-    num_training: int = 100,
+    num_training: Optional[int] = None,
     mode: str = "exponential",
     early_stop_threshold: float = 4.0,
     update_attr: bool = False,
+    num_lrs: int = 1,
 ) -> Optional[_LRFinder]:
     """See :meth:`~pytorch_lightning.tuner.tuning.Tuner.lr_find`"""
     if trainer.fast_dev_run:
         rank_zero_warn("Skipping learning rate finder since fast_dev_run is enabled.", UserWarning)
         return
 
+    if num_lrs < 1:
+        raise MisconfigurationException(f"`num_lrs` should be a positive integer, got {num_lrs}.")
+    if num_lrs > 1:
+        # the copies of the model are trained by the callback, outside of the training type and precision plugins
+        if not model.automatic_optimization:
+            raise MisconfigurationException("`num_lrs > 1` is only supported with automatic optimization.")
+        if trainer.precision != 32:
+            raise MisconfigurationException(
+                f"`num_lrs > 1` is only supported with 32-bit precision, got `Trainer(precision={trainer.precision})`."
+            )
+        if isinstance(trainer.training_type_plugin, ParallelPlugin):
+            raise MisconfigurationException("`num_lrs > 1` is only supported when training on a single device.")
+        if trainer.gradient_clip_val:
+            raise MisconfigurationException("`num_lrs > 1` is not supported with gradient clipping.")
+    if num_training is None:
+        # the copies are trained one after the other, each run takes `num_lrs` times as many training steps
+        num_training = 100 if num_lrs == 1 else _MULTI_LR_NUM_TRAINING
+
     # Determine lr attr
     if update_attr:
         lr_attr_name = _determine_lr_attr_name(trainer, model)
@@ -219,10 +281,13 @@ def lr_find(
     trainer.auto_lr_find = False
 
     # Initialize lr finder object (stores results)
-    lr_finder = _LRFinder(mode, min_lr, max_lr, num_training)
+    lr_finder = _LRFinder(mode, min_lr, max_lr, num_training, num_lrs=num_lrs)
 
     # Use special lr logger callback
-    trainer.callbacks = [_LRCallback(num_training, early_stop_threshold, progress_bar_refresh_rate=1)]
+    if num_lrs > 1:
+        trainer.callbacks = [_MultiLRCallback(lr_finder.evaluated_lrs(), early_stop_threshold)]
+    else:
+        trainer.callbacks = [_LRCallback(num_training, early_stop_threshold, progress_bar_refresh_rate=1)]
 
     # No logging
     trainer.logger = DummyLogger()
@@ -301,6 +366,10 @@ def __lr_finder_restore_params(trainer, model):
     del trainer.__dumped_params
 
 
+def _noop(*_: Any, **__: Any) -> None:
+    return None
+
+
 class _LRCallback(Callback):
     """Special callback used by the learning rate finder. This callbacks log
     the learning rate before each batch and log the corresponding loss after
@@ -375,6 +444,93 @@ class _LRCallback(Callback):
         self.losses.append(smoothed_loss)
 
 
+class _MultiLRCallback(Callback):
+    """Special callback used by the learning rate finder to evaluate several learning rates in one run. The model
+    is trained with the first learning rate. When the training starts, a copy of the model is made for each of the
+    other learning rates, and every batch is used to train the copies as well, each with its own optimizer.
+
+    Args:
+        lrs: the learning rates to evaluate
+        early_stop_threshold: threshold for stopping the training with a learning rate. If its loss is larger
+            than ``early_stop_threshold`` times the best loss it reached, the learning rate is considered diverged and
+            its loss is ``nan``. To disable, set to ``None``.
+        beta: smoothing value, the loss of each learning rate is a running average of its loss values logged until
+            now. ``beta`` controls the forget rate i.e. if ``beta=0`` all past information is ignored.
+    """
+
+    def __init__(self, lrs: List[float], early_stop_threshold: Optional[float] = 4.0, beta: float = 0.98):
+        self.lrs = lrs
+        self.early_stop_threshold = early_stop_threshold
+        self.beta = beta
+        # the last smoothed loss of each learning rate
+        self.losses = [float("nan")] * len(lrs)
+        self.avg_losses = [0.0] * len(lrs)
+        self.num_steps = [0] * len(lrs)
+        self.diverged = [False] * len(lrs)
+        self.best_losses = [float("inf")] * len(lrs)
+        self.models: List["pl.LightningModule"] = []
+        self.optimizers: List[Optimizer] = []
+
+    def on_train_start(self, trainer, pl_module):
+        """Called when the training starts, copies the model and creates its optimizer for each learning rate"""
+        for lr in self.lrs[1:]:
+            # the copies share the trainer and are already on the device of the model
+            model = deepcopy(pl_module, memo={id(trainer): trainer})
+            # use the method of the copy instead of the one patched by the learning rate finder
+            model.__dict__.pop("configure_optimizers", None)
+            # the values logged by the copies would be mixed with the values logged by the model
+            model.log = model.log_dict = _noop
+            optimizer = _get_single_optimizer(model.configure_optimizers())
+            for param_group in optimizer.param_groups:
+                param_group["lr"] = lr
+            self.models.append(model)
+            self.optimizers.append(optimizer)
+
+    def on_train_batch_start(self, trainer, pl_module, batch, batch_idx, dataloader_idx):
+        """Called before each training batch, trains the copies of the model on it"""
+        should_step = (trainer.fit_loop.batch_idx + 1) % trainer.accumulate_grad_batches == 0
+        for i, (model, optimizer) in enumerate(zip(self.models, self.optimizers), 1):
+            if self.diverged[i]:
+                continue
+            output = model.training_step(batch, batch_idx)
+            loss = output["loss"] if isinstance(output, dict) else output
+            if loss is None:
+                continue
+            (loss / trainer.accumulate_grad_batches).backward()
+            if should_step:
+                optimizer.step()
+                optimizer.zero_grad()
+                self._update(i, loss.item())
+
+    def on_train_batch_end(self, trainer, pl_module, outputs, batch, batch_idx, dataloader_idx):
+        """Called when the training batch ends, logs the loss of the model"""
+        if (trainer.fit_loop.batch_idx + 1) % trainer.accumulate_grad_batches != 0:
+            return
+        if not self.diverged[0]:
+            self._update(0, trainer.fit_loop.running_loss.last().item())
+        if all(self.diverged):
+            trainer.fit_loop.max_steps = trainer.global_step  # stop signal
+
+    def on_train_end(self, trainer, pl_module):
+        """Called when the training ends, frees the copies of the model"""
+        self.models, self.optimizers = [], []
+
+    def _update(self, index: int, loss: float) -> None:
+        # Avg loss (loss with momentum) + smoothing
+        self.avg_losses[index] = self.beta * self.avg_losses[index] + (1 - self.beta) * loss
+        self.num_steps[index] += 1
+        smoothed_loss = self.avg_losses[index] / (1 - self.beta ** self.num_steps[index])
+        if not math.isfinite(smoothed_loss) or (
+            self.early_stop_threshold is not None
+            and smoothed_loss > self.early_stop_threshold * self.best_losses[index]
+        ):
+            self.diverged[index] = True
+            self.losses[index] = float("nan")
+            return
+        self.losses[index] = smoothed_loss
+        self.best_losses[index] = min(self.best_losses[index], smoothed_loss)
+
+
 class _LinearLR(_LRScheduler):
     """
     Linearly increases the learning rate between two boundaries over a number of iterations.
@@ -11,11 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Sequence, Union
 
 import pytorch_lightning as pl
 from pytorch_lightning.trainer.states import TrainerStatus
-from pytorch_lightning.tuner.batch_size_scaling import scale_batch_size
+from pytorch_lightning.tuner.batch_size_scaling import _BatchSizeThroughput, scale_batch_size
+from pytorch_lightning.tuner.dataloader_tuning import tune_dataloader
 from pytorch_lightning.tuner.lr_finder import _LRFinder, lr_find
 from pytorch_lightning.utilities.types import EVAL_DATALOADERS, TRAIN_DATALOADERS
 
@@ -25,6 +26,10 @@ class Tuner:
 
     def __init__(self, trainer: "pl.Trainer") -> None:
         self.trainer = trainer
+        # the samples per second measured by the last ``throughput`` batch size scaling
+        self.batch_size_throughput: Optional[_BatchSizeThroughput] = None
+        # the arguments found by ``tune_dataloader``, applied when the train dataloaders are re-instantiated
+        self.dataloader_kwargs: Dict[str, Any] = {}
 
     def on_trainer_init(self, auto_lr_find: Union[str, bool], auto_scale_batch_size: Union[str, bool]) -> None:
         self.trainer.auto_lr_find = auto_lr_find
@@ -35,7 +40,8 @@ class Tuner:
         model: "pl.LightningModule",
         scale_batch_size_kwargs: Optional[Dict[str, Any]] = None,
         lr_find_kwargs: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Optional[Union[int, _LRFinder]]]:
+        tune_dataloader_kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Optional[Union[int, _LRFinder, Dict[str, Any]]]]:
         scale_batch_size_kwargs = scale_batch_size_kwargs or {}
         lr_find_kwargs = lr_find_kwargs or {}
         # return a dict instead of a tuple so BC is not broken if a new tuning procedure is added
@@ -52,6 +58,10 @@ class Tuner:
             lr_find_kwargs.setdefault("update_attr", True)
             result["lr_find"] = lr_find(self.trainer, model, **lr_find_kwargs)
 
+        # Run the dataloader tuning last, as the batch size changes the time spent loading the data
+        if tune_dataloader_kwargs is not None:
+            result["tune_dataloader"] = tune_dataloader(self.trainer, model, **tune_dataloader_kwargs)
+
         self.trainer.state.status = TrainerStatus.FINISHED
 
         return result
@@ -75,6 +85,8 @@ class Tuner:
         max_trials: int = 25,
         batch_arg_name: str = "batch_size",
         train_dataloader=None,  # TODO: remove with 1.6
+        memory_headroom: float = 0.1,
+        throughput_tolerance: float = 0.05,
     ) -> Optional[int]:
         """
         Iteratively try to find the largest batch size for a given model
@@ -96,6 +108,14 @@ class Tuner:
                 - ``'power'`` (default): Keep multiplying the batch size by 2, until we get an OOM error.
                 - ``'binsearch'``: Initially keep multiplying by 2 and after encountering an OOM error
                     do a binary search between the last successful batch size and the batch size that failed.
+                - ``'memory'``: Measure the peak memory at three small batch sizes and fit a linear model of the
+                    memory against the batch size. The largest batch size predicted to fit is verified with a single
+                    trial, so no OOM error is needed. The CUDA memory statistics are used on GPUs and the peak resident
+                    set size on CPUs, which requires Linux.
+                - ``'throughput'``: Keep multiplying the batch size by 2 until an OOM error, timing the samples per
+                    second processed at each size, data loading included. The smallest batch size within
+                    ``throughput_tolerance`` of the best throughput is chosen. The measurements are stored in
+                    ``trainer.tuner.batch_size_throughput``, which can plot them.
 
             steps_per_trial: number of steps to run with a given batch size.
                 Ideally 1 should be enough to test if a OOM error occurs,
@@ -114,6 +134,11 @@ class Tuner:
                 - ``model.hparams``
                 - ``model.datamodule``
                 - ``trainer.datamodule`` (the datamodule passed to the tune method)
+
+            memory_headroom: fraction of the memory left free by the batch size found in the ``'memory'`` mode.
+
+            throughput_tolerance: relative loss of throughput accepted to pick a smaller batch size in the
+                ``'throughput'`` mode. Set it to ``0`` to pick the batch size with the best throughput.
         """
         self.trainer.auto_scale_batch_size = True
         result = self.trainer.tune(
@@ -128,6 +153,8 @@ class Tuner:
                 "init_val": init_val,
                 "max_trials": max_trials,
                 "batch_arg_name": batch_arg_name,
+                "memory_headroom": memory_headroom,
+                "throughput_tolerance": throughput_tolerance,
             },
         )
         self.trainer.auto_scale_batch_size = False
@@ -141,11 +168,12 @@ class Tuner:
         datamodule: Optional["pl.LightningDataModule"] = None,
         min_lr: float = 1e-8,
         max_lr: float = 1,
-        num_training: int = 100,
+        num_training: Optional[int] = None,
         mode: str = "exponential",
         early_stop_threshold: float = 4.0,
         update_attr: bool = False,
         train_dataloader=None,  # TODO: remove with 1.6
+        num_lrs: int = 1,
     ) -> Optional[_LRFinder]:
         """
         Enables the user to do a range test of good initial learning rates,
@@ -166,7 +194,8 @@ class Tuner:
 
             max_lr: maximum learning rate to investigate
 
-            num_training: number of learning rates to test
+            num_training: number of learning rates to test. Defaults to 100, or to 20 steps per learning rate when
+                ``num_lrs > 1``.
 
             mode: Search strategy to update learning rate after each batch:
 
@@ -179,10 +208,19 @@ class Tuner:
 
             update_attr: Whether to update the learning rate attribute or not.
 
+            num_lrs: number of learning rates to evaluate in one run, spaced between ``min_lr`` and
+                ``max_lr`` following ``mode``. When larger than 1, a copy of the model is trained from the same
+                initial weights with each learning rate for ``num_training`` steps, on the same batches, instead
+                of sweeping the learning rate with a scheduler. The copies are trained one after the other on
+                each batch, so the run takes ``num_lrs * num_training`` training steps. The copies and their
+                optimizer states are kept on the device of the model. Only supported with automatic optimization and
+                32-bit precision, on a single device and without gradient clipping.
+
         Raises:
             MisconfigurationException:
                 If learning rate/lr in ``model`` or ``model.hparams`` isn't overridden when ``auto_lr_find=True``,
-                or if you are using more than one optimizer.
+                or if you are using more than one optimizer, or if ``num_lrs`` is used with manual
+                optimization, another precision than 32, several devices or gradient clipping.
         """
         self.trainer.auto_lr_find = True
         result = self.trainer.tune(
@@ -198,7 +236,80 @@ class Tuner:
                 "mode": mode,
                 "early_stop_threshold": early_stop_threshold,
                 "update_attr": update_attr,
+                "num_lrs": num_lrs,
             },
         )
         self.trainer.auto_lr_find = False
         return result["lr_find"]
+
+    def tune_dataloader(
+        self,
+        model: "pl.LightningModule",
+        train_dataloaders: Optional[Union[TRAIN_DATALOADERS, "pl.LightningDataModule"]] = None,
+        datamodule: Optional["pl.LightningDataModule"] = None,
+        num_workers: Optional[Sequence[int]] = None,
+        prefetch_factor: Sequence[int] = (2, 4),
+        persistent_workers: Sequence[bool] = (False, True),
+        pin_memory: Optional[Sequence[bool]] = None,
+        steps_per_trial: int = 10,
+        num_batches: int = 20,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Finds the cheapest train dataloader configuration which loads the batches faster than the model
+        processes them.
+
+        The model step time is measured first by running ``steps_per_trial`` training steps. Then, each
+        configuration of the grid is benchmarked by re-instantiating the train dataloaders with it and fetching
+        ``num_batches`` batches, without running the model. Configurations are tried from the one using the fewest
+        resources to the one using the most, and the first one with workers fetching a batch faster than a step is
+        kept. Without workers, the batches are fetched between the steps rather than during them, so these
+        configurations only compete on the duration of a whole iteration when no configuration with workers is fast
+        enough. In that case the fastest one is used.
+
+        The arguments found are stored in ``trainer.tuner.dataloader_kwargs`` and are applied every time the train
+        dataloaders are re-instantiated by the trainer, like it does to add a ``DistributedSampler``.
+
+        Args:
+            model: Model to tune.
+
+            train_dataloaders: A collection of :class:`torch.utils.data.DataLoader` or a
+                :class:`~pytorch_lightning.core.datamodule.LightningDataModule` specifying training samples.
+                In the case of multiple dataloaders, please see this :ref:`page <multiple-training-dataloaders>`.
+
+            datamodule: An instance of :class:`~pytorch_lightning.core.datamodule.LightningDataModule`.
+
+            num_workers: values of ``num_workers`` to try. Defaults to ``0``, the powers of 2 below the number of
+                CPUs and the number of CPUs.
+
+            prefetch_factor: values of ``prefetch_factor`` to try when there are workers.
+
+            persistent_workers: values of ``persistent_workers`` to try when there are workers.
+
+            pin_memory: values of ``pin_memory`` to try. Defaults to ``True`` when training on GPUs and
+                ``False`` otherwise.
+
+            steps_per_trial: number of training steps run to measure the model step time.
+
+            num_batches: number of batches fetched to benchmark each configuration.
+
+        Returns:
+            The ``DataLoader`` arguments chosen, or ``None`` if the tuning was skipped.
+
+        Raises:
+            MisconfigurationException:
+                If ``steps_per_trial`` is lower than 2 or ``num_batches`` is lower than 1.
+        """
+        result = self.trainer.tune(
+            model,
+            train_dataloaders=train_dataloaders,
+            datamodule=datamodule,
+            tune_dataloader_kwargs={
+                "num_workers": num_workers,
+                "prefetch_factor": prefetch_factor,
+                "persistent_workers": persistent_workers,
+                "pin_memory": pin_memory,
+                "steps_per_trial": steps_per_trial,
+                "num_batches": num_batches,
+            },
+        )
+        return result["tune_dataloader"]
@@ -12,30 +12,136 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import io
+import operator
+import pickle
+import zipfile
 from pathlib import Path
-from typing import Any, Callable, Dict, IO, Optional, Union
+from typing import Any, Callable, Dict, IO, Optional, Sequence, Set, Union
 
 import fsspec
 import torch
 from fsspec.implementations.local import AbstractFileSystem, LocalFileSystem
 from packaging.version import Version
 
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.imports import _compare_version
+
+# the skipped storages are replaced with ``meta`` storages, and ``torch.load`` ignores its ``pickle_module`` in 1.13
+_SKIP_STORAGES_AVAILABLE = _compare_version("torch", operator.ge, "1.10.0") and not (
+    _compare_version("torch", operator.ge, "1.13.0") and _compare_version("torch", operator.lt, "2.0.0")
+)
+
 
 def load(
     path_or_url: Union[str, IO, Path],
     map_location: Optional[
         Union[str, Callable, torch.device, Dict[Union[str, torch.device], Union[str, torch.device]]]
     ] = None,
+    skip_keys: Optional[Sequence[str]] = None,
 ) -> Any:
+    """Loads a checkpoint with :func:`torch.load`, with additional handling for ``fsspec`` remote loading of files.
+
+    Args:
+        path_or_url: Path, URL or file-like object to load from.
+        map_location: How to remap storage locations, see :func:`torch.load`.
+        skip_keys: Top-level keys of the checkpoint dictionary which are dropped without reading their tensors.
+    """
+    if str(path_or_url).startswith("http"):
+        checkpoint = torch.hub.load_state_dict_from_url(str(path_or_url), map_location=map_location)
+        return _drop_keys(checkpoint, skip_keys) if skip_keys else checkpoint
     if not isinstance(path_or_url, (str, Path)):
         # any sort of BytesIO or similiar
-        return torch.load(path_or_url, map_location=map_location)
-    if str(path_or_url).startswith("http"):
-        return torch.hub.load_state_dict_from_url(str(path_or_url), map_location=map_location)
+        return _torch_load(path_or_url, map_location, skip_keys)
     fs = get_filesystem(path_or_url)
     with fs.open(path_or_url, "rb") as f:
+        return _torch_load(f, map_location, skip_keys)
+
+
+def _torch_load(f: IO, map_location: Any, skip_keys: Optional[Sequence[str]]) -> Any:
+    if not skip_keys:
         return torch.load(f, map_location=map_location)
+    position = f.tell()
+    is_zipfile = zipfile.is_zipfile(f)
+    f.seek(position)
+    if not is_zipfile or not _SKIP_STORAGES_AVAILABLE:
+        # the legacy serialization reads every storage after the unpickling, so nothing can be skipped
+        return _drop_keys(torch.load(f, map_location=map_location), skip_keys)
+
+    # first pass: unpickle the checkpoint with placeholders for all the storages to find the ones which are only
+    # referenced by the skipped keys, without reading any of them
+    pickle_module = _SkipStoragesPickleModule(skip_storages=None)
+    checkpoint = torch.load(f, map_location=map_location, pickle_module=pickle_module)
+    storage_keys = {storage._cdata: key for key, storage in pickle_module.placeholders.items()}
+    kept_storages, skipped_storages = set(), set()
+    if isinstance(checkpoint, dict):
+        for key, value in checkpoint.items():
+            _collect_storage_keys(value, storage_keys, skipped_storages if key in skip_keys else kept_storages)
+    del checkpoint
+
+    # second pass: read every storage but those
+    f.seek(position)
+    pickle_module = _SkipStoragesPickleModule(skip_storages=skipped_storages - kept_storages)
+    return _drop_keys(torch.load(f, map_location=map_location, pickle_module=pickle_module), skip_keys)
+
+
+def _drop_keys(checkpoint: Any, keys: Sequence[str]) -> Any:
+    if isinstance(checkpoint, dict):
+        for key in keys:
+            checkpoint.pop(key, None)
+    return checkpoint
+
+
+def _collect_storage_keys(obj: Any, storage_keys: Dict[int, str], keys: Set[str]) -> None:
+    def collect(tensor: torch.Tensor) -> None:
+        key = storage_keys.get(tensor.storage()._cdata)
+        if key is not None:
+            keys.add(key)
+
+    apply_to_collection(obj, torch.Tensor, collect)
+
+
+class _SkipStoragesUnpickler(pickle.Unpickler):
+    """Unpickler which replaces the storages of the archive listed in ``skip_storages`` (all of them when ``None``)
+    with empty ``meta`` storages instead of reading them."""
+
+    skip_storages: Optional[Set[str]] = None
+    placeholders: Dict[str, Any] = {}
+
+    @property
+    def persistent_load(self) -> Callable:
+        return self._persistent_load
+
+    @persistent_load.setter
+    def persistent_load(self, fn: Callable) -> None:
+        # ``torch.load`` sets the function which reads the storages from the archive
+        self._load_storage = fn
+
+    def _persistent_load(self, saved_id: tuple) -> Any:
+        # ``("storage", storage_type, key, location, numel)``
+        _, storage_type, key, _, numel = saved_id
+        if self.skip_storages is not None and key not in self.skip_storages:
+            return self._load_storage(saved_id)
+        if key not in self.placeholders:
+            dtype = getattr(storage_type, "dtype", torch.uint8)
+            if not isinstance(dtype, torch.dtype):
+                dtype = storage_type().dtype
+            self.placeholders[key] = torch.empty(numel, dtype=dtype, device="meta").storage()
+        return self.placeholders[key]
+
+
+class _SkipStoragesPickleModule:
+    """Replaces the ``pickle`` module passed to :func:`torch.load` to use a ``_SkipStoragesUnpickler``."""
+
+    __name__ = "pickle"
+
+    def __init__(self, skip_storages: Optional[Set[str]]) -> None:
+        self.placeholders = {}
+        self.Unpickler = type(
+            "_SkipStoragesUnpickler",
+            (_SkipStoragesUnpickler,),
+            {"skip_storages": skip_storages, "placeholders": self.placeholders},
+        )
+        self.load = pickle.load
 
 
 def get_filesystem(path: Union[str, Path]) -> AbstractFileSystem:
@@ -50,6 +156,8 @@ def get_filesystem(path: Union[str, Path]) -> AbstractFileSystem:
 def atomic_save(checkpoint: Dict[str, Any], filepath: Union[str, Path]) -> None:
     """Saves a checkpoint atomically, avoiding the creation of incomplete checkpoints.
 
+    The checkpoint is streamed to the filesystem without being serialized in memory first.
+
     Args:
         checkpoint: The object to save.
             Built to be used with the ``dump_checkpoint`` method, but can deal with anything which ``torch.save``
@@ -58,13 +166,25 @@ def atomic_save(checkpoint: Dict[str, Any], filepath: Union[str, Path]) -> None:
             This points to the file that the checkpoint will be stored in.
     """
 
-    bytesbuffer = io.BytesIO()
+    fs = get_filesystem(filepath)
+    # stream into a temporary file next to the destination and swap it in once complete. The rename is atomic on local
+    # filesystems. Remote ones commit the temporary object even when the save fails, as closing the file always does,
+    # so the destination is only replaced by a complete checkpoint
+    tmp_filepath = f"{filepath}.part"
+    try:
+        with fs.open(tmp_filepath, "wb") as f:
+            _torch_save(checkpoint, f)
+        fs.mv(tmp_filepath, str(filepath))
+    finally:
+        if fs.exists(tmp_filepath):
+            fs.rm(tmp_filepath)
+
+
+def _torch_save(checkpoint: Dict[str, Any], f: IO) -> None:
     # Can't use the new zipfile serialization for 1.6.0 because there's a bug in
     # torch.hub.load_state_dict_from_url() that prevents it from loading the new files.
     # More details can be found here: https://github.com/pytorch/pytorch/issues/42239
     if Version(torch.__version__).release[:3] == (1, 6, 0):
-        torch.save(checkpoint, bytesbuffer, _use_new_zipfile_serialization=False)
+        torch.save(checkpoint, f, _use_new_zipfile_serialization=False)
     else:
-        torch.save(checkpoint, bytesbuffer)
-    with fsspec.open(filepath, "wb") as f:
-        f.write(bytesbuffer.getvalue())
+        torch.save(checkpoint, f)
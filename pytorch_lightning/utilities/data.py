@@ -12,12 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Iterable, Mapping, Union
+from typing import Any, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple, Union
 
 import torch
-from torch.utils.data import DataLoader, IterableDataset
+from torch.utils.data import DataLoader, IterableDataset, Sampler
 
 from pytorch_lightning.utilities import rank_zero_warn
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 
 BType = Union[torch.Tensor, str, Mapping[Any, "BType"], Iterable["BType"]]
 
@@ -84,3 +85,62 @@ def get_len(dataloader: DataLoader) -> Union[int, float]:
         return len(dataloader)
 
     return float("inf")
+
+
+class BucketBatchSampler(Sampler):
+    """Groups the samples of similar lengths into batches of up to ``max_tokens`` padded tokens.
+
+    The indices of ``sampler`` are sorted by length and batched greedily, so that the number of samples times the length
+    of the longest one stays within ``max_tokens``. This avoids most of the compute spent on padding variable-length
+    inputs. As the order of the samples changes, ``trainer.predict`` returns the predictions of a dataloader using it
+    per sample, in the order of the dataset indices.
+
+    Args:
+        sampler: The sampler of the dataset indices to batch. Its indices are sorted, so it should not shuffle.
+        lengths: The length of each sample of the dataset, indexed by the dataset indices.
+        max_tokens: The maximum number of samples times the length of the longest one in a batch. A sample longer than
+            this is put in a batch of its own.
+        max_batch_size: An optional maximum number of samples in a batch.
+
+    Example::
+
+        lengths = [len(tokens) for tokens in dataset]
+        batch_sampler = BucketBatchSampler(SequentialSampler(dataset), lengths, max_tokens=4096)
+        dataloader = DataLoader(dataset, batch_sampler=batch_sampler, collate_fn=pad_collate)
+        predictions = trainer.predict(model, dataloaders=dataloader)
+    """
+
+    drop_last = False
+
+    def __init__(
+        self, sampler: Sampler, lengths: Sequence[int], max_tokens: int, max_batch_size: Optional[int] = None
+    ) -> None:
+        if max_tokens < 1 or (max_batch_size is not None and max_batch_size < 1):
+            raise MisconfigurationException(
+                f"`max_tokens` and `max_batch_size` should be at least 1, got {max_tokens} and {max_batch_size}."
+            )
+        self.sampler = sampler
+        self.lengths = lengths
+        self.max_tokens = max_tokens
+        self.max_batch_size = max_batch_size
+        # the number of batches, computed once per number of indices of the sampler
+        self._num_batches: Optional[Tuple[int, int]] = None
+
+    def __iter__(self) -> Iterator[List[int]]:
+        indices = sorted(self.sampler, key=lambda i: self.lengths[i])
+        batch: List[int] = []
+        for idx in indices:
+            # sorted by length, so the new sample is the longest of the batch
+            too_many_tokens = (len(batch) + 1) * self.lengths[idx] > self.max_tokens
+            if batch and (too_many_tokens or len(batch) == self.max_batch_size):
+                yield batch
+                batch = []
+            batch.append(idx)
+        if batch:
+            yield batch
+
+    def __len__(self) -> int:
+        num_indices = len(self.sampler)
+        if self._num_batches is None or self._num_batches[0] != num_indices:
+            self._num_batches = (num_indices, sum(1 for _ in self))
+        return self._num_batches[1]
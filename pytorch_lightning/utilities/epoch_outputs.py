@@ -0,0 +1,178 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Reducers folding the step outputs into the epoch outputs as they are produced."""
+import tempfile
+from abc import ABC, abstractmethod
+from copy import deepcopy
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
+
+import numpy as np
+import torch
+
+import pytorch_lightning as pl
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+
+
+class EpochOutputReducer(ABC):
+    """Base class of the reducers returned by
+    :meth:`~pytorch_lightning.core.lightning.LightningModule.configure_epoch_output_reducers`.
+
+    A reducer folds the values returned under one key by the steps of an epoch. The values are detached before they
+    are passed to :meth:`update`, and :meth:`compute` returns what is passed to the ``*_epoch_end`` hook.
+    """
+
+    @abstractmethod
+    def update(self, value: torch.Tensor) -> None:
+        """Folds the value of a step."""
+
+    @abstractmethod
+    def compute(self) -> Any:
+        """Returns the reduced value of the epoch."""
+
+
+class SumReducer(EpochOutputReducer):
+    """Sums the values, keeping a single tensor on their device."""
+
+    def __init__(self) -> None:
+        self.total: Optional[torch.Tensor] = None
+
+    def update(self, value: torch.Tensor) -> None:
+        self.total = value if self.total is None else self.total + value
+
+    def compute(self) -> Optional[torch.Tensor]:
+        return self.total
+
+
+class MeanReducer(EpochOutputReducer):
+    """Averages the values of the steps, keeping a single tensor on their device."""
+
+    def __init__(self) -> None:
+        self.total: Optional[torch.Tensor] = None
+        self.count = 0
+
+    def update(self, value: torch.Tensor) -> None:
+        self.total = value.float() if self.total is None else self.total + value
+        self.count += 1
+
+    def compute(self) -> Optional[torch.Tensor]:
+        return self.total / self.count if self.total is not None else None
+
+
+class CatReducer(EpochOutputReducer):
+    """Moves the values to CPU as they arrive and concatenates them along their first dimension, scalars are
+    stacked."""
+
+    def __init__(self) -> None:
+        self.values: List[torch.Tensor] = []
+
+    def update(self, value: torch.Tensor) -> None:
+        self.values.append(value.cpu().reshape(-1, *value.shape[1:]))
+
+    def compute(self) -> Optional[torch.Tensor]:
+        return torch.cat(self.values) if self.values else None
+
+
+class DiskReducer(EpochOutputReducer):
+    """Writes the values to a temporary file as they arrive and returns them concatenated along their first
+    dimension as a tensor backed by a memory-mapped file, so neither the device nor the host memory grows with the
+    number of steps. Scalars are stacked.
+
+    Args:
+        dirpath: Directory of the temporary file. The default temporary directory is used when ``None``.
+    """
+
+    def __init__(self, dirpath: Optional[str] = None) -> None:
+        self.dirpath = dirpath
+        self._file: Optional[Any] = None
+        self._dtype: Optional[np.dtype] = None
+        self._trailing_shape: Optional[Tuple[int, ...]] = None
+        self._length = 0
+
+    def update(self, value: torch.Tensor) -> None:
+        if value.dtype == torch.bfloat16:
+            # not supported by numpy
+            value = value.float()
+        array = value.cpu().reshape(-1, *value.shape[1:]).numpy()
+        if self._file is None:
+            self._file = tempfile.TemporaryFile(dir=self.dirpath)
+            self._dtype, self._trailing_shape = array.dtype, array.shape[1:]
+        elif array.shape[1:] != self._trailing_shape or array.dtype != self._dtype:
+            raise MisconfigurationException(
+                f"`DiskReducer` expects values of the same dtype and trailing shape, got {array.dtype}"
+                f" {tuple(array.shape)} after {self._dtype} {self._trailing_shape}."
+            )
+        self._file.write(np.ascontiguousarray(array).tobytes())
+        self._length += len(array)
+
+    def compute(self) -> Optional[torch.Tensor]:
+        if self._file is None:
+            return None
+        self._file.flush()
+        # copy-on-write, so the tensor is writable without modifying the file
+        array = np.memmap(self._file, dtype=self._dtype, mode="c", shape=(self._length, *self._trailing_shape))
+        return torch.from_numpy(array)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # the values of an epoch are not kept
+        return {"dirpath": self.dirpath}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__(**state)
+
+
+_REDUCERS = {"sum": SumReducer, "mean": MeanReducer, "cat": CatReducer, "disk": DiskReducer}
+
+
+class _EpochOutputReduction:
+    """Folds the step outputs of an epoch with the reducers declared by the ``LightningModule``.
+
+    The keys of the outputs without a reducer are dropped.
+    """
+
+    def __init__(self, reducers: Mapping[str, Union[str, EpochOutputReducer]]) -> None:
+        self.reducers: Dict[str, EpochOutputReducer] = {}
+        for key, reducer in reducers.items():
+            if isinstance(reducer, str) and reducer in _REDUCERS:
+                reducer = _REDUCERS[reducer]()
+            elif isinstance(reducer, EpochOutputReducer):
+                # each dataloader or optimizer folds its outputs separately
+                reducer = deepcopy(reducer)
+            else:
+                raise MisconfigurationException(
+                    f"The reducer of `{key}` should be one of {list(_REDUCERS)} or an `EpochOutputReducer`,"
+                    f" got {reducer!r}."
+                )
+            self.reducers[key] = reducer
+
+    @classmethod
+    def from_module(cls, model: "pl.LightningModule") -> Optional["_EpochOutputReduction"]:
+        reducers = model.configure_epoch_output_reducers()
+        return cls(reducers) if reducers is not None else None
+
+    def update(self, output: Any) -> None:
+        if output is None:
+            return
+        if not isinstance(output, Mapping):
+            raise MisconfigurationException(
+                "The step outputs should be dictionaries when `configure_epoch_output_reducers` is overridden,"
+                f" got {type(output).__name__}."
+            )
+        for key, reducer in self.reducers.items():
+            if key in output:
+                value = output[key]
+                value = value.detach() if isinstance(value, torch.Tensor) else torch.as_tensor(value)
+                reducer.update(value)
+
+    def compute(self) -> Dict[str, Any]:
+        return {key: reducer.compute() for key, reducer in self.reducers.items()}
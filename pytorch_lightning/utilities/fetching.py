@@ -12,27 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import queue
+import threading
 from abc import ABC, abstractmethod
 from collections.abc import Iterable, Iterator
 from contextlib import contextmanager
-from copy import deepcopy
-from functools import partial
 from typing import Any, Callable, Generator, List, Optional, Tuple
 
 import torch
 from torch.utils.data.dataloader import DataLoader
 
 import pytorch_lightning as pl
-from pytorch_lightning.trainer.supporters import CombinedLoader, CycleIterator
-from pytorch_lightning.utilities.apply_func import apply_to_collection, apply_to_collections
-from pytorch_lightning.utilities.auto_restart import (
-    _add_capture_metadata_collate,
-    IteratorState,
-    MergedIteratorState,
-    patch_dataloader_iterator,
-)
+from pytorch_lightning.trainer.supporters import CombinedLoader
+from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
-from pytorch_lightning.utilities.imports import _fault_tolerant_training
 
 
 class AbstractDataFetcher(ABC):
@@ -89,8 +82,6 @@ class AbstractDataFetcher(ABC):
         batch_to_device: Optional[Callable] = None,
         profiler: "Optional[pl.profiler.base.BaseProfiler]" = None,
     ) -> None:
-        self._add_capture_metadata_collate(dataloader)
-
         self.dataloader = dataloader
         self.stage = stage
         self.batch_to_device = batch_to_device
@@ -99,62 +90,12 @@ class AbstractDataFetcher(ABC):
         if self.profiler is not None and stage is None:
             raise MisconfigurationException("When providing a profiler, the stage should be provided too.")
 
-    @staticmethod
-    def _add_capture_metadata_collate(dataloader: Iterable) -> None:
-        if not isinstance(dataloader, (DataLoader, CombinedLoader)):
-            return
-
-        if isinstance(dataloader, CombinedLoader):
-            dataloader = dataloader.loaders
-
-        def add_capture_metadata_collate(dataloader: DataLoader):
-            if not isinstance(dataloader.collate_fn, partial):
-                _add_capture_metadata_collate(dataloader)
-
-        apply_to_collection(dataloader, DataLoader, add_capture_metadata_collate)
-
     def append_batch(self, batch) -> None:
         self.batches.append(batch)
 
     def pop_batch(self) -> Any:
         return self.batches.pop(0)
 
-    def _apply_patch(self):
-        def _apply_patch_fn(loader: DataLoader, iterator: Iterator):
-            if isinstance(loader, CycleIterator):
-                loader = loader.loader
-                # cycle_iterator = iterator
-                iterator = iterator._loader_iter
-
-            if isinstance(loader, DataLoader) and _fault_tolerant_training():
-                loader._lightning_fetcher = self
-                patch_dataloader_iterator(loader, iterator, self)
-
-        apply_to_collections(self.loaders, self.loader_iters, (Iterator, DataLoader), _apply_patch_fn)
-
-    def _store_dataloader_iter_state(
-        self, dataloader_iter: Iterator, dataloader_iter_states: List[IteratorState]
-    ) -> None:
-        if getattr(dataloader_iter, "cache_states", None) is None:
-            dataloader_iter.cache_states = {}
-
-        if getattr(dataloader_iter, "state", None) is None:
-            dataloader_iter.state = MergedIteratorState()
-
-        for iter_state in dataloader_iter_states:
-            iter_name = iter_state.name
-            if iter_name not in dataloader_iter.cache_states:
-                dataloader_iter.cache_states[iter_name] = []
-            dataloader_iter.cache_states[iter_name].append(iter_state)
-
-        if self.fetched >= self.prefetch_batches:
-            for iter_state in dataloader_iter_states:
-                if len(dataloader_iter.state):
-                    dataloader_iter.previous_state = deepcopy(dataloader_iter.state)
-                iter_name = iter_state.name
-                state = dataloader_iter.cache_states[iter_name].pop(0)
-                dataloader_iter.state.update(iter_name, state)
-
     @property
     def loaders(self) -> List[DataLoader]:
         if self.dataloader is None:
@@ -195,7 +136,6 @@ class AbstractDataFetcher(ABC):
             raise MisconfigurationException("The iterate hasn't been provided. HINT: Did you call setup function ?.")
         self.reset()
         self.dataloader_iter = iter(self.dataloader)
-        self._apply_patch()
         self.prefetching(self.prefetch_batches)
         return self
 
@@ -304,7 +244,7 @@ class DataFetcher(AbstractDataFetcher):
 
     def _get_queued_batch(self) -> Tuple[Any, bool]:
         self.wait()
-        batch = self.batches.pop(0)
+        batch = self.pop_batch()
         if not self.store_on_device:
             batch = self.move_data_to_device(batch)
         is_last = len(self.batches) == 0
@@ -370,6 +310,118 @@ class InterBatchParallelDataFetcher(DataFetcher):
         event.wait()
 
 
+class ThreadedDataFetcher(DataFetcher):
+
+    """This class pulls batches from the dataloader iterator(s) on a background thread, so the host-side latency of
+    ``__next__`` (decoding, remote reads, ``CombinedLoader`` fan-out, ...) is hidden behind the training step.
+
+    code-block::
+
+        Without a worker thread:
+
+        main:   [next][step][next][step][next][step]
+
+        With a worker thread:
+
+        worker: [next][next][next][next]...
+        main:         [step][step][step]...
+
+    The ``(batch, is_last)`` contract and the profiler actions of :class:`DataFetcher` are preserved. Only the
+    ``next`` call runs on the worker thread: moving the batch to the device and recording the profiler actions
+    happen on the thread consuming the fetcher.
+
+    Args:
+        prefetch_batches: Number of batches to be pre-fetched. At most ``prefetch_batches + 1`` batches are loaded
+            ahead of the one being consumed, including the one held to detect the last batch. With the default of 0,
+            no batch can be loaded while the previous one is consumed.
+        store_on_device: Whether to store the pre-fetched batches on device.
+    """
+
+    _SENTINEL = object()
+
+    def __init__(
+        self,
+        prefetch_batches: int = 0,
+        store_on_device: bool = False,
+    ) -> None:
+        self._queue: Optional[queue.Queue] = None
+        self._slots: Optional[threading.Semaphore] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        super().__init__(prefetch_batches=prefetch_batches, store_on_device=store_on_device)
+
+    def prefetching(self, prefetch_batches: int) -> None:
+        self._start_worker(prefetch_batches)
+        # the other batches wait in the queue, only the one used to detect the last batch is held here
+        super().prefetching(1)
+
+    def pop_batch(self) -> Any:
+        batch = super().pop_batch()
+        # let the worker load a new batch in place of the consumed one
+        self._slots.release()
+        return batch
+
+    def _start_worker(self, prefetch_batches: int) -> None:
+        self._stop_event.clear()
+        self._queue = queue.Queue()
+        self._slots = threading.Semaphore(prefetch_batches)
+        self._thread = threading.Thread(
+            target=self._worker_loop,
+            args=(self.dataloader_iter, self._queue, self._slots),
+            name="ThreadedDataFetcher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _stop_worker(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._queue = None
+        self._slots = None
+
+    def _worker_loop(self, dataloader_iter: Iterator, output_queue: queue.Queue, slots: threading.Semaphore) -> None:
+        while True:
+            # wait for a consumed batch to free a slot, checking regularly whether the worker should stop
+            while not slots.acquire(timeout=0.1):
+                if self._stop_event.is_set():
+                    return
+            if self._stop_event.is_set():
+                return
+            try:
+                batch = next(dataloader_iter)
+            except StopIteration:
+                output_queue.put(self._SENTINEL)
+                return
+            except BaseException as e:
+                # forward the exception to be re-raised on the consuming thread
+                output_queue.put(e)
+                return
+            output_queue.put(batch)
+
+    def _fetch_next_batch(self):
+        with self.apply_profiler(f"get_{self.stage}_batch"):
+            with self.fetching_context():
+                data = self.on_fetch_start()
+                with self.apply_profiler(f"fetch_next_{self.stage}_batch"):
+                    batch = self._queue.get()
+                if batch is self._SENTINEL or isinstance(batch, BaseException):
+                    # keep the item available for any subsequent call
+                    self._queue.put(batch)
+                    if batch is self._SENTINEL:
+                        raise StopIteration
+                    raise batch
+                self.fetched += 1
+                self.on_fetch_end(batch, data)
+
+    def reset(self) -> None:
+        if getattr(self, "_thread", None) is not None:
+            self._stop_worker()
+        super().reset()
+
+
 class StepFuncDataLoaderIter:
 
     """This class is a wrapper to keep track of dataloader iterator fetching event while left entirely to user
@@ -16,6 +16,7 @@ import numbers
 from typing import Any
 
 import torch
+from torchmetrics import Metric
 
 from pytorch_lightning.utilities.apply_func import apply_to_collection
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -38,3 +39,16 @@ def metrics_to_scalars(metrics: Any) -> Any:
         return value.item()
 
     return apply_to_collection(metrics, torch.Tensor, to_item)
+
+
+def _clone_inference_metric_states(module: torch.nn.Module) -> None:
+    """Replaces the states of the ``torchmetrics`` metrics of ``module`` which are inference tensors, e.g. reset
+    under :func:`torch.inference_mode`, with normal tensors so that they can be updated in-place outside of it."""
+
+    def clone(tensor: torch.Tensor) -> torch.Tensor:
+        return tensor.clone() if tensor.is_inference() else tensor
+
+    for metric in module.modules():
+        if isinstance(metric, Metric):
+            for name in metric._defaults:
+                setattr(metric, name, apply_to_collection(getattr(metric, name), torch.Tensor, clone))
@@ -0,0 +1,134 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Sharing in-memory data between the processes of a node."""
+import os
+import tempfile
+import uuid
+from typing import Any, Callable, NamedTuple, Optional, TypeVar, Union
+
+import numpy as np
+import torch
+
+import pytorch_lightning as pl
+from pytorch_lightning.utilities.apply_func import apply_to_collection
+from pytorch_lightning.utilities.distributed import distributed_available
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+
+T = TypeVar("T")
+
+_SHM_DIR = "/dev/shm"
+
+
+class _SharedArray(NamedTuple):
+    """Reference to an array written to a node-local file, sent to the other processes instead of the array."""
+
+    index: int
+    is_tensor: bool
+    is_bfloat16: bool
+
+
+def share_on_node(
+    training_type_plugin: "pl.plugins.TrainingTypePlugin",
+    name: str,
+    fn: Callable[[], T],
+    dirpath: Optional[str] = None,
+) -> T:
+    """Builds some data on the local rank 0 of each node only and shares its tensors and NumPy arrays with the other
+    processes of the node without copying them.
+
+    The arrays are written to files in ``dirpath``, which every process of the node maps to memory copy-on-write. The
+    files are removed once mapped, the memory is released when the last process is done with it. The other values of
+    the collection returned by ``fn`` are the ones built on the global rank 0, sent to the other processes as they are.
+    The data must have the same structure on every node, otherwise a ``MisconfigurationException`` is raised.
+
+    NumPy arrays are returned as ``np.memmap`` arrays, which are copied when pickled, e.g. when the data is sent to the
+    workers of a ``DataLoader`` started with the ``spawn`` method. Tensors are moved to shared memory by
+    ``torch.multiprocessing`` instead, so return tensors if the data is sent to such processes.
+
+    Without distributed processes, ``fn`` is called and its result returned as is.
+
+    Args:
+        training_type_plugin: The plugin of the processes sharing the data, used to synchronize them.
+        name: The name of the data, unique among the calls of this function within a run.
+        fn: Builds the data, called on the local rank 0 of each node.
+        dirpath: The directory of the files. Defaults to ``/dev/shm``, a memory-backed filesystem, when available.
+
+    Returns:
+        The result of ``fn``, whose arrays and tensors are backed by shared memory.
+    """
+    if not distributed_available():
+        return fn()
+    if dirpath is None:
+        dirpath = _SHM_DIR if os.path.isdir(_SHM_DIR) else tempfile.gettempdir()
+    token = training_type_plugin.broadcast(uuid.uuid4().hex)
+    prefix = os.path.join(dirpath, f"pl-{token}-{name}-node{training_type_plugin.node_rank}")
+
+    structure = None
+    if training_type_plugin.local_rank == 0:
+        structure = _write(fn(), prefix)
+    training_type_plugin.barrier("share_on_node_write")
+    # the files of each node are loaded with the structure of the global rank 0
+    node_structure = structure
+    structure = training_type_plugin.broadcast(structure)
+    mismatch = training_type_plugin.local_rank == 0 and _refs(node_structure) != _refs(structure)
+    mismatch = torch.tensor(int(mismatch), device=training_type_plugin.root_device)
+    if training_type_plugin.reduce(mismatch, reduce_op="sum"):
+        if training_type_plugin.local_rank == 0:
+            _remove(node_structure, prefix)
+        raise MisconfigurationException(
+            f"The data `{name}` shared on each node does not have the same structure on every node. `fn` should"
+            " return the same collection of tensors and arrays on every node."
+        )
+    data = apply_to_collection(structure, _SharedArray, _load, prefix)
+    training_type_plugin.barrier("share_on_node_load")
+
+    if training_type_plugin.local_rank == 0:
+        _remove(structure, prefix)
+    return data
+
+
+def _write(data: Any, prefix: str) -> Any:
+    """Writes the arrays of the collection to files and replaces them with references to them."""
+    index = 0
+
+    def write(array: Union[torch.Tensor, np.ndarray]) -> _SharedArray:
+        nonlocal index
+        ref = _SharedArray(index, isinstance(array, torch.Tensor), getattr(array, "dtype", None) == torch.bfloat16)
+        if ref.is_tensor:
+            # numpy does not support bfloat16, its bits are written instead
+            array = (array.view(torch.int16) if ref.is_bfloat16 else array).detach().cpu().numpy()
+        np.save(f"{prefix}-{index}.npy", np.ascontiguousarray(array))
+        index += 1
+        return ref
+
+    return apply_to_collection(data, (torch.Tensor, np.ndarray), write)
+
+
+def _load(ref: _SharedArray, prefix: str) -> Union[torch.Tensor, np.ndarray]:
+    array = np.load(f"{prefix}-{ref.index}.npy", mmap_mode="c")
+    if not ref.is_tensor:
+        return array
+    tensor = torch.from_numpy(array)
+    return tensor.view(torch.bfloat16) if ref.is_bfloat16 else tensor
+
+
+def _remove(structure: Any, prefix: str) -> None:
+    for ref in _refs(structure):
+        os.remove(f"{prefix}-{ref.index}.npy")
+
+
+def _refs(structure: Any) -> list:
+    refs = []
+    apply_to_collection(structure, _SharedArray, refs.append)
+    return refs
@@ -132,3 +132,32 @@ def test_resume_callback_state_saved_by_type(tmpdir):
     trainer = Trainer(default_root_dir=tmpdir, max_steps=2, callbacks=[callback], resume_from_checkpoint=ckpt_path)
     trainer.fit(model)
     assert callback.state == 111
+
+
+def test_callbacks_only_called_when_implemented(tmpdir):
+    """Test that the trainer only calls the callbacks overriding a hook, and that the implementers are recomputed
+    when the callbacks change."""
+
+    class TrainStartCallback(Callback):
+        def on_train_start(self, trainer, pl_module):
+            pass
+
+    train_start_callback, default_callback = TrainStartCallback(), Callback()
+    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=True, callbacks=[train_start_callback, default_callback])
+    assert train_start_callback in trainer._callbacks_with_hook("on_train_start")
+    assert default_callback not in trainer._callbacks_with_hook("on_train_start")
+    assert train_start_callback not in trainer._callbacks_with_hook("on_train_end")
+
+    # hooks patched on the instance are called
+    default_callback.on_train_end = Mock()
+    mock_callback = Mock()
+    trainer.callbacks.append(mock_callback)
+    trainer.fit(BoringModel())
+    default_callback.on_train_end.assert_called_once()
+    assert mock_callback.on_train_end.call_count == 1
+    assert trainer._callbacks_with_hook("on_train_start")[-1] is mock_callback
+
+    trainer.callbacks.remove(mock_callback)
+    assert trainer._callbacks_with_hook("on_train_start")[-1] is not mock_callback
+    trainer.callbacks = [mock_callback]
+    assert trainer._callbacks_with_hook("on_train_start") == [mock_callback]
@@ -12,10 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
+
+import numpy as np
 import pytest
+import torch
 
 from pytorch_lightning import Trainer
-from pytorch_lightning.callbacks import BasePredictionWriter
+from pytorch_lightning.callbacks import BasePredictionWriter, ShardedPredictionWriter
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.helpers import BoringModel
 
@@ -62,3 +66,51 @@ def test_prediction_writer(tmpdir):
     trainer.predict(model, dataloaders=model.train_dataloader(), return_predictions=False)
     assert not cb.write_on_batch_end_called
     assert cb.write_on_epoch_end_called
+
+
+@pytest.mark.parametrize("file_format", ["npy", "pt"])
+def test_sharded_prediction_writer(tmpdir, file_format):
+    """Test the predictions are streamed to shard files per dataloader."""
+    model = BoringModel()
+    writer = ShardedPredictionWriter(tmpdir, batches_per_shard=2, file_format=file_format, max_queue_size=1)
+    trainer = Trainer(limit_predict_batches=5, callbacks=writer)
+    dataloaders = [model.train_dataloader(), model.train_dataloader()]
+    results = trainer.predict(model, dataloaders=dataloaders, return_predictions=False)
+    assert results is None
+    assert writer._thread is None
+
+    for dataloader_idx in range(2):
+        shards = [f"predictions-dl{dataloader_idx}-rank0-{i:05d}.{file_format}" for i in range(3)]
+        assert set(shards) <= set(os.listdir(tmpdir))
+        if file_format == "npy":
+            predictions = np.concatenate([np.load(os.path.join(tmpdir, shard)) for shard in shards])
+        else:
+            predictions = [torch.load(os.path.join(tmpdir, shard))["predictions"] for shard in shards]
+            assert [len(p) for p in predictions] == [2, 2, 1]
+            predictions = torch.cat([p for shard in predictions for p in shard]).numpy()
+        expected = torch.cat([model(batch) for batch in list(dataloaders[dataloader_idx])[:5]]).detach().numpy()
+        np.testing.assert_allclose(predictions, expected, rtol=1e-5)
+
+
+def test_sharded_prediction_writer_raises(tmpdir):
+    with pytest.raises(MisconfigurationException, match="`file_format` should be one of"):
+        ShardedPredictionWriter(tmpdir, file_format="csv")
+
+    class DictModel(BoringModel):
+        def predict_step(self, batch, batch_idx, dataloader_idx=None):
+            return {"y": self(batch)}
+
+    model = DictModel()
+    writer = ShardedPredictionWriter(tmpdir)
+    trainer = Trainer(limit_predict_batches=2, callbacks=writer)
+    with pytest.raises(MisconfigurationException, match="The `npy` format requires the predictions to be tensors"):
+        trainer.predict(model, dataloaders=model.train_dataloader(), return_predictions=False)
+
+    class FailingWriter(ShardedPredictionWriter):
+        def write_shard(self, *_):
+            raise RuntimeError("disk full")
+
+    model = BoringModel()
+    trainer = Trainer(limit_predict_batches=4, callbacks=FailingWriter(tmpdir, batches_per_shard=1))
+    with pytest.raises(RuntimeError, match="disk full"):
+        trainer.predict(model, dataloaders=model.train_dataloader(), return_predictions=False)
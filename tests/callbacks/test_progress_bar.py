@@ -24,7 +24,7 @@ from torch.utils.data.dataloader import DataLoader
 
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint, ProgressBar, ProgressBarBase
-from pytorch_lightning.callbacks.progress import tqdm
+from pytorch_lightning.callbacks.progress.tqdm_progress import Tqdm as tqdm
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.helpers.boring_model import BoringModel, RandomDataset
 from tests.helpers.runif import RunIf
@@ -421,7 +421,7 @@ class PrintModel(BoringModel):
         return super().predict_step(*args, **kwargs)
 
 
-@mock.patch("pytorch_lightning.callbacks.progress.tqdm.write")
+@mock.patch("pytorch_lightning.callbacks.progress.tqdm_progress.Tqdm.write")
 def test_progress_bar_print(tqdm_write, tmpdir):
     """Test that printing in the LightningModule redirects arguments to the progress bar."""
     model = PrintModel()
@@ -448,7 +448,7 @@ def test_progress_bar_print(tqdm_write, tmpdir):
     ]
 
 
-@mock.patch("pytorch_lightning.callbacks.progress.tqdm.write")
+@mock.patch("pytorch_lightning.callbacks.progress.tqdm_progress.Tqdm.write")
 def test_progress_bar_print_no_train(tqdm_write, tmpdir):
     """Test that printing in the LightningModule redirects arguments to the progress bar without training."""
     model = PrintModel()
@@ -475,7 +475,7 @@ def test_progress_bar_print_no_train(tqdm_write, tmpdir):
 
 
 @mock.patch("builtins.print")
-@mock.patch("pytorch_lightning.callbacks.progress.tqdm.write")
+@mock.patch("pytorch_lightning.callbacks.progress.tqdm_progress.Tqdm.write")
 def test_progress_bar_print_disabled(tqdm_write, mock_print, tmpdir):
     """Test that printing in LightningModule goes through built-in print function when progress bar is disabled."""
     model = PrintModel()
@@ -515,6 +515,37 @@ def test_progress_bar_can_be_pickled():
     pickle.dumps(bar)
 
 
+def test_progress_bar_refresh_interval(tmpdir):
+    """Test that the bars are rendered by a background thread and reach the totals when ``refresh_interval`` is
+    set."""
+
+    class CurrentProgressBar(ProgressBar):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.get_metrics_calls = 0
+
+        def get_metrics(self, trainer, pl_module):
+            self.get_metrics_calls += 1
+            return super().get_metrics(trainer, pl_module)
+
+    progress_bar = CurrentProgressBar(refresh_interval=0.01)
+    trainer = Trainer(
+        default_root_dir=tmpdir, callbacks=[progress_bar], limit_train_batches=20, limit_val_batches=5, max_epochs=2
+    )
+    trainer.fit(BoringModel())
+    assert progress_bar.main_progress_bar.n == 25
+    # the metrics are collected at most once per interval and at the end of validation
+    assert progress_bar.get_metrics_calls < 2 * 20
+    assert progress_bar._render_thread is None
+    pickle.loads(pickle.dumps(ProgressBar(refresh_interval=0.01)))
+
+    trainer.test(BoringModel())
+    assert progress_bar.test_progress_bar.n == progress_bar.total_test_batches
+
+    with pytest.raises(MisconfigurationException, match="`refresh_interval` should be positive"):
+        ProgressBar(refresh_interval=0)
+
+
 @RunIf(min_gpus=2, special=True)
 def test_progress_bar_max_val_check_interval_0(tmpdir):
     _test_progress_bar_max_val_check_interval(
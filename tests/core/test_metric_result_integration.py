@@ -28,6 +28,7 @@ import tests.helpers.utils as tutils
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.trainer.connectors.logger_connector.result import _Sync, MetricSource, ResultCollection
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.imports import _fault_tolerant_enabled, _TORCH_GREATER_EQUAL_1_7
 from tests.helpers import BoringModel
 from tests.helpers.runif import RunIf
@@ -557,3 +558,58 @@ def test_metric_collections(tmpdir):
 
     trainer = Trainer(default_root_dir=tmpdir, max_epochs=2, limit_train_batches=2, limit_val_batches=0)
     trainer.fit(model)
+
+
+def test_result_collection_batched_epoch_compute():
+    """Test that the epoch values of the tensor metrics are computed with a single sync call per reduction."""
+    sync_fn = mock.Mock(side_effect=lambda x, *_, **__: x)
+    result = ResultCollection(True, torch.device("cpu"))
+    for batch_size, value in ((1, 1.0), (3, 5.0)):
+        result.batch_size = batch_size
+        for i in range(10):
+            result.log("training_step", f"mean_{i}", torch.tensor(value + i), sync_dist=True, sync_dist_fn=sync_fn)
+            result.log("training_step", f"sum_{i}", torch.tensor(value + i), reduce_fx="sum", sync_dist_fn=sync_fn)
+            result.log("training_step", f"max_{i}", torch.tensor(value + i), reduce_fx="max", sync_dist_fn=sync_fn)
+
+    # one call per reduce op, the values and batch sizes of the mean metrics are synced together
+    metrics = result.metrics(on_step=False)[MetricSource.LOG]
+    assert sync_fn.call_count == 3
+    for i in range(10):
+        assert metrics[f"mean_{i}"] == (1.0 + i + 3 * (5.0 + i)) / 4
+        assert metrics[f"sum_{i}"] == 1.0 + i + 3 * (5.0 + i)
+        assert metrics[f"max_{i}"] == 5.0 + i
+
+    with pytest.raises(MisconfigurationException, match="with different arguments"):
+        result.log("training_step", "mean_0", torch.tensor(1.0), prog_bar=True)
+
+
+def _ddp_coalesced_sync_fn(rank, worldsize):
+    _setup_ddp(rank, worldsize)
+    result = ResultCollection(True, torch.device("cpu"))
+    for i in range(10):
+        result.log("training_step", f"mean_{i}", torch.tensor(float(rank + i)))
+        result.log("training_step", f"sum_{i}", torch.tensor(float(rank + i)), reduce_fx="sum")
+    result.log("training_step", "step", torch.tensor([rank, rank + 1.0]), on_step=True, on_epoch=False)
+
+    with mock.patch("torch.distributed.all_reduce", wraps=dist.all_reduce) as all_reduce:
+        result.sync()
+    # all the states share the same dtype, device and group
+    assert all_reduce.call_count == 1
+    for i in range(10):
+        assert result[f"training_step.mean_{i}"].value == 2 * i + 1
+        assert result[f"training_step.mean_{i}"].cumulated_batch_size == 2
+        assert result[f"training_step.sum_{i}"].value == 2 * i + 1
+    assert torch.equal(result["training_step.step"].value, torch.tensor([1.0, 3.0]))
+
+    result.unsync()
+    assert result["training_step.mean_0"].value == rank
+    assert not result["training_step.mean_0"]._is_synced
+
+
+@RunIf(skip_windows=True)
+def test_result_collection_coalesced_sync():
+    """Test that `ResultCollection.sync` reduces all the states with a single collective."""
+    tutils.set_random_master_port()
+
+    worldsize = 2
+    mp.spawn(_ddp_coalesced_sync_fn, args=(worldsize,), nprocs=worldsize)
@@ -103,3 +103,22 @@ def test_file_logger_log_hyperparams(tmpdir):
     path_yaml = os.path.join(logger.log_dir, ExperimentWriter.NAME_HPARAMS_FILE)
     params = load_hparams_from_yaml(path_yaml)
     assert all(n in params for n in hparams)
+
+
+def test_file_logger_appends_metrics(tmpdir):
+    """Verify that saving appends the buffered metrics and extends the header when new keys are logged."""
+    logger = CSVLogger(tmpdir)
+    logger.log_metrics({"a": 1}, 0)
+    logger.save()
+    logger.log_metrics({"a": 2}, 1)
+    logger.save()
+    assert logger.experiment.metrics == []
+
+    path_csv = os.path.join(logger.log_dir, ExperimentWriter.NAME_METRICS_FILE)
+    with open(path_csv) as fp:
+        assert fp.read().splitlines() == ["a,step", "1,0", "2,1"]
+
+    logger.log_metrics({"b": 3}, 2)
+    logger.save()
+    with open(path_csv) as fp:
+        assert fp.read().splitlines() == ["a,step,b", "1,0,", "2,1,", ",2,3"]
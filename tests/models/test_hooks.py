@@ -363,6 +363,7 @@ class HookedModel(BoringModel):
             dict(name="on_epoch_start"),
             dict(name=f"Callback.on_{fn}_epoch_start", args=(trainer, model)),
             dict(name=f"on_{fn}_epoch_start"),
+            dict(name="configure_epoch_output_reducers"),
             *HookedModel._eval_batch(fn, trainer, model, batches, key, device=device),
             dict(name=f"{fn}_epoch_end", args=([outputs] * batches,)),
             dict(name=f"Callback.on_{fn}_epoch_end", args=(trainer, model)),
@@ -524,6 +525,7 @@ def test_trainer_model_hook_system_fit(tmpdir, kwargs, automatic_optimization):
         dict(name="train_dataloader"),
         dict(name="Callback.on_train_start", args=(trainer, model)),
         dict(name="on_train_start"),
+        dict(name="configure_epoch_output_reducers"),
         dict(name="Callback.on_epoch_start", args=(trainer, model)),
         dict(name="on_epoch_start"),
         dict(name="Callback.on_train_epoch_start", args=(trainer, model)),
@@ -640,6 +642,7 @@ def test_trainer_model_hook_system_fit_no_val_and_resume(tmpdir):
         dict(name="val_dataloader"),
         dict(name="Callback.on_train_start", args=(trainer, model)),
         dict(name="on_train_start"),
+        dict(name="configure_epoch_output_reducers"),
         dict(name="Callback.on_epoch_start", args=(trainer, model)),
         dict(name="on_epoch_start"),
         dict(name="Callback.on_train_epoch_start", args=(trainer, model)),
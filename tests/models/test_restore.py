@@ -388,6 +388,29 @@ def test_load_model_from_checkpoint(tmpdir, model_template):
     new_trainer.test(pretrained_model)
 
 
+@pytest.mark.parametrize("skip_training_state", [False, True])
+def test_load_from_checkpoint_skip_training_state(tmpdir, skip_training_state):
+    """Verify ``load_from_checkpoint`` only skips the training state of the checkpoint when asked to."""
+
+    class TestModel(BoringModel):
+        def on_load_checkpoint(self, checkpoint):
+            assert "state_dict" in checkpoint
+            assert ("optimizer_states" in checkpoint) is not skip_training_state
+            self.on_load_checkpoint_called = True
+
+    model = TestModel()
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_train_batches=2, limit_val_batches=2)
+    trainer.fit(model)
+    assert "optimizer_states" in torch.load(trainer.checkpoint_callback.best_model_path)
+
+    pretrained_model = TestModel.load_from_checkpoint(
+        trainer.checkpoint_callback.best_model_path, skip_training_state=skip_training_state
+    )
+    assert pretrained_model.on_load_checkpoint_called
+    for old_p, new_p in zip(model.parameters(), pretrained_model.parameters()):
+        assert torch.equal(old_p, new_p)
+
+
 @RunIf(min_gpus=2)
 def test_dp_resume(tmpdir):
     """Make sure DP continues training correctly."""
@@ -11,15 +11,28 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
+import os
 from typing import Any, Dict, Optional
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import torch
 
 from pytorch_lightning import Trainer
 from pytorch_lightning.callbacks import ModelCheckpoint
-from pytorch_lightning.plugins import CheckpointIO, DeepSpeedPlugin, SingleDevicePlugin, TPUSpawnPlugin
+from pytorch_lightning.plugins import (
+    AsyncCheckpointIO,
+    CheckpointIO,
+    DDPSpawnPlugin,
+    DeepSpeedPlugin,
+    DeltaCheckpointIO,
+    ShardedCheckpointIO,
+    SingleDevicePlugin,
+    TorchCheckpointIO,
+    TPUSpawnPlugin,
+)
+from pytorch_lightning.plugins.io.delta_plugin import _digest
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from pytorch_lightning.utilities.types import _PATH
 from tests.helpers.boring_model import BoringModel
@@ -84,3 +97,265 @@ def test_checkpoint_plugin_called(tmpdir):
 def test_no_checkpoint_io_plugin_support(plugin_cls):
     with pytest.raises(MisconfigurationException, match="currently does not support custom checkpoint plugins"):
         plugin_cls().checkpoint_io = CustomCheckpointIO()
+
+
+def test_async_checkpoint_io_plugin(tmpdir):
+    """Test that the ``AsyncCheckpointIO`` writes the checkpoints and waits for them at the end of fit."""
+    checkpoint_plugin = AsyncCheckpointIO()
+    checkpoint_plugin.checkpoint_io = MagicMock(wraps=TorchCheckpointIO())
+    ck = ModelCheckpoint(dirpath=tmpdir, save_last=True)
+
+    model = BoringModel()
+    trainer = Trainer(default_root_dir=tmpdir, plugins=[checkpoint_plugin], callbacks=ck, max_epochs=2)
+    trainer.fit(model)
+
+    assert checkpoint_plugin.checkpoint_io.save_checkpoint.call_count == 5
+    assert checkpoint_plugin._executor is None
+    assert os.path.isfile(ck.last_model_path)
+    assert os.path.isfile(ck.best_model_path)
+    trainer.test(model, ckpt_path=ck.last_model_path)
+
+
+def test_async_checkpoint_io_snapshot_and_errors(tmpdir):
+    """Test that the ``AsyncCheckpointIO`` saves a snapshot of the tensors and propagates errors."""
+    checkpoint_plugin = AsyncCheckpointIO()
+    weight = torch.zeros(2)
+    checkpoint_plugin.save_checkpoint({"weight": weight}, str(tmpdir / "a.ckpt"))
+    # in-place updates after the call should not leak into the saved checkpoint
+    weight.add_(1)
+    assert torch.equal(checkpoint_plugin.load_checkpoint(str(tmpdir / "a.ckpt"))["weight"], torch.zeros(2))
+
+    checkpoint_plugin.checkpoint_io = MagicMock(wraps=TorchCheckpointIO())
+    checkpoint_plugin.load_checkpoint(str(tmpdir / "a.ckpt"), storage_options={"anon": True})
+    checkpoint_plugin.checkpoint_io.load_checkpoint.assert_called_with(
+        str(tmpdir / "a.ckpt"), storage_options={"anon": True}
+    )
+
+    checkpoint_plugin.checkpoint_io = MagicMock(spec=CheckpointIO)
+    checkpoint_plugin.checkpoint_io.save_checkpoint.side_effect = OSError("disk full")
+    checkpoint_plugin.save_checkpoint({"weight": weight}, str(tmpdir / "b.ckpt"))
+    with pytest.raises(RuntimeError, match="saving a checkpoint asynchronously"):
+        checkpoint_plugin.teardown()
+    assert checkpoint_plugin._executor is None
+
+    with pytest.raises(MisconfigurationException, match="`max_pending_saves` should be at least 1"):
+        AsyncCheckpointIO(max_pending_saves=0)
+
+
+def test_sharded_checkpoint_io_save_load(tmpdir):
+    """Test that the shards written by each rank are gathered back into the full checkpoint."""
+    checkpoint = {
+        "state_dict": {"a": torch.rand(4), "b": torch.rand(2, 2), "c": torch.rand(3)},
+        "optimizer_states": [{"state": {0: {"exp_avg": torch.rand(4)}}}],
+        "epoch": 3,
+    }
+    path = str(tmpdir / "epoch=3.ckpt")
+    checkpoint_plugin = ShardedCheckpointIO()
+    for rank in range(2):
+        checkpoint_plugin.save_shard(checkpoint, path, global_rank=rank, num_shards=2)
+    assert sorted(os.listdir(path)) == ["manifest.ckpt", "shard-00000-of-00002.ckpt", "shard-00001-of-00002.ckpt"]
+    # the tensors are split across the shards
+    assert all(torch.load(os.path.join(path, f"shard-0000{r}-of-00002.ckpt")) for r in range(2))
+
+    loaded = checkpoint_plugin.load_checkpoint(path)
+    assert loaded["epoch"] == 3
+    for k, v in checkpoint["state_dict"].items():
+        assert torch.equal(loaded["state_dict"][k], v)
+    assert torch.equal(
+        loaded["optimizer_states"][0]["state"][0]["exp_avg"], checkpoint["optimizer_states"][0]["state"][0]["exp_avg"]
+    )
+
+    # single file checkpoints can still be loaded
+    torch.save(checkpoint, str(tmpdir / "single.ckpt"))
+    assert checkpoint_plugin.load_checkpoint(str(tmpdir / "single.ckpt"))["epoch"] == 3
+
+
+@pytest.mark.parametrize("num_processes", [1, pytest.param(2, marks=RunIf(skip_windows=True))])
+def test_sharded_checkpoint_io_trainer(tmpdir, num_processes):
+    """Test that sharded checkpoints are written by every process and can be used to resume training."""
+    ck = ModelCheckpoint(dirpath=tmpdir, save_last=True)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[ShardedCheckpointIO()],
+        callbacks=ck,
+        max_epochs=1,
+        num_processes=num_processes,
+        accelerator="ddp_cpu" if num_processes > 1 else None,
+    )
+    trainer.fit(BoringModel())
+
+    last_path = os.path.join(tmpdir, "last.ckpt")
+    assert os.path.isdir(last_path)
+    assert f"shard-{num_processes - 1:05d}-of-{num_processes:05d}.ckpt" in os.listdir(last_path)
+
+    trainer = Trainer(
+        default_root_dir=tmpdir, plugins=[ShardedCheckpointIO()], max_epochs=2, resume_from_checkpoint=last_path
+    )
+    trainer.fit(BoringModel())
+    assert trainer.current_epoch == 1
+
+
+def test_sharded_checkpoint_io_signature():
+    """Test the signature tells apart checkpoints whose tensors only share the number of elements."""
+    checkpoint = {"state_dict": {"a": torch.rand(4)}, "epoch": 1}
+    assert ShardedCheckpointIO.signature(checkpoint) == ShardedCheckpointIO.signature(
+        {"state_dict": {"a": torch.rand(4)}, "epoch": 1}
+    )
+    for other in (
+        {"state_dict": {"a": torch.rand(2, 2)}, "epoch": 1},
+        {"state_dict": {"a": torch.rand(4, dtype=torch.float64)}, "epoch": 1},
+        {"state_dict": {"b": torch.rand(4)}, "epoch": 1},
+        {"state_dict": {"a": torch.rand(4)}, "epoch": 2},
+    ):
+        assert ShardedCheckpointIO.signature(checkpoint) != ShardedCheckpointIO.signature(other)
+
+
+class _RankLocalOptimizerStatesPlugin(DDPSpawnPlugin):
+    @property
+    def rank_local_checkpoint_keys(self):
+        return ("optimizer_states",) if self.checkpoint_io.saves_rank_local_states else ()
+
+
+@RunIf(skip_windows=True)
+def test_sharded_checkpoint_io_rank_local_states(tmpdir):
+    """Test that the rank-local states are written by every rank and restored on the rank which saved them."""
+    ck = ModelCheckpoint(dirpath=tmpdir, save_last=True)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[_RankLocalOptimizerStatesPlugin(), ShardedCheckpointIO()],
+        callbacks=ck,
+        max_epochs=1,
+        num_processes=2,
+        accelerator="ddp_cpu",
+    )
+    trainer.fit(BoringModel())
+
+    last_path = os.path.join(tmpdir, "last.ckpt")
+    assert {"rank-00000-of-00002.ckpt", "rank-00001-of-00002.ckpt"} <= set(os.listdir(last_path))
+    checkpoint = ShardedCheckpointIO().load_checkpoint(last_path)
+    assert checkpoint[CheckpointIO.RANK_LOCAL_KEYS] == ["optimizer_states"]
+    assert len(checkpoint["optimizer_states"]) == 2
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        plugins=[_RankLocalOptimizerStatesPlugin(), ShardedCheckpointIO()],
+        max_epochs=2,
+        num_processes=2,
+        accelerator="ddp_cpu",
+        resume_from_checkpoint=last_path,
+    )
+    trainer.fit(BoringModel())
+    assert trainer.current_epoch == 1
+
+    # the optimizer states can only be restored by as many processes
+    trainer = Trainer(
+        default_root_dir=tmpdir, plugins=[ShardedCheckpointIO()], max_epochs=2, resume_from_checkpoint=last_path
+    )
+    with pytest.raises(MisconfigurationException, match="saved by 2 processes and can only be restored by as many"):
+        trainer.fit(BoringModel())
+
+
+def _packs(dirpath):
+    return sorted(p for p in os.listdir(os.path.join(dirpath, ".blobs")) if p.endswith(".pack"))
+
+
+def test_delta_checkpoint_io_save_load(tmpdir):
+    """Test that unchanged tensors are not written again and that the full checkpoint is restored."""
+    frozen, weight = torch.rand(4), torch.rand(2, 2)
+    checkpoint_plugin = DeltaCheckpointIO()
+    checkpoint_plugin.save_checkpoint(
+        {"state_dict": {"frozen": frozen, "weight": weight}, "step": 1}, os.path.join(tmpdir, "1.ckpt")
+    )
+    assert len(_packs(tmpdir)) == 1
+
+    weight = weight + 1
+    checkpoint_plugin.save_checkpoint(
+        {"state_dict": {"frozen": frozen, "weight": weight}, "step": 2}, os.path.join(tmpdir, "2.ckpt")
+    )
+    packs = _packs(tmpdir)
+    assert len(packs) == 2
+    # only the modified tensor is written to the new pack
+    assert len(torch.load(os.path.join(tmpdir, ".blobs", next(p for p in packs if p.startswith("2.ckpt"))))) == 1
+
+    loaded = checkpoint_plugin.load_checkpoint(os.path.join(tmpdir, "2.ckpt"))
+    assert loaded["step"] == 2
+    assert torch.equal(loaded["state_dict"]["frozen"], frozen)
+    assert torch.equal(loaded["state_dict"]["weight"], weight)
+
+    checkpoint_plugin.consolidate(os.path.join(tmpdir, "2.ckpt"), os.path.join(tmpdir, "full.pt"))
+    assert torch.equal(torch.load(os.path.join(tmpdir, "full.pt"))["state_dict"]["weight"], weight)
+
+    # once the first checkpoint is removed, only the tensors referenced by the second one are kept. the files not
+    # written by the plugin are not read
+    os.remove(os.path.join(tmpdir, "1.ckpt"))
+    with open(os.path.join(tmpdir, "notes.txt"), "w") as f:
+        f.write("not a checkpoint")
+    checkpoint_plugin.compact(tmpdir)
+    with open(os.path.join(tmpdir, ".blobs", "manifest.json")) as f:
+        assert json.load(f) == ["2.ckpt"]
+
+    # the manifest is not left incomplete when writing it fails
+    with patch("json.dump", side_effect=RuntimeError("disk full")), pytest.raises(RuntimeError, match="disk full"):
+        checkpoint_plugin.compact(tmpdir)
+    assert "manifest.json.part" not in os.listdir(os.path.join(tmpdir, ".blobs"))
+    with open(os.path.join(tmpdir, ".blobs", "manifest.json")) as f:
+        assert json.load(f) == ["2.ckpt"]
+    packs = [torch.load(os.path.join(tmpdir, ".blobs", p)) for p in _packs(tmpdir)]
+    assert sum(len(p) for p in packs) == 2
+    loaded = DeltaCheckpointIO().load_checkpoint(os.path.join(tmpdir, "2.ckpt"))
+    assert torch.equal(loaded["state_dict"]["frozen"], frozen)
+
+    # the removed tensors are written again when needed
+    checkpoint_plugin.save_checkpoint({"state_dict": {"weight": weight - 1}}, os.path.join(tmpdir, "3.ckpt"))
+    assert torch.equal(
+        checkpoint_plugin.load_checkpoint(os.path.join(tmpdir, "3.ckpt"))["state_dict"]["weight"], weight - 1
+    )
+
+
+def test_delta_checkpoint_io_trainer(tmpdir):
+    """Test that training can be resumed from delta checkpoints saved every few steps."""
+    model = BoringModel()
+    model.layer.bias.requires_grad_(False)
+    dirpath = os.path.join(tmpdir, "not_compacted")
+    ck = ModelCheckpoint(dirpath=dirpath, every_n_train_steps=2)
+    trainer = Trainer(default_root_dir=tmpdir, plugins=[DeltaCheckpointIO()], callbacks=ck, max_steps=6)
+    trainer.fit(model)
+    # the packs of the removed checkpoints are kept, as the directories are not compacted by default
+    assert len(_packs(dirpath)) == 3
+
+    model = BoringModel()
+    model.layer.bias.requires_grad_(False)
+    ck = ModelCheckpoint(dirpath=tmpdir, every_n_train_steps=2)
+    trainer = Trainer(
+        default_root_dir=tmpdir, plugins=[DeltaCheckpointIO(compact_on_teardown=True)], callbacks=ck, max_steps=6
+    )
+    trainer.fit(model)
+
+    # the frozen bias is only written by the first checkpoint, the other packs were removed when compacting
+    packs = _packs(tmpdir)
+    assert len(packs) == 2
+    assert any(p.startswith("epoch=0-step=1.ckpt") for p in packs)
+    trainer = Trainer(
+        default_root_dir=tmpdir, plugins=[DeltaCheckpointIO()], max_steps=8, resume_from_checkpoint=ck.best_model_path
+    )
+    trainer.fit(BoringModel())
+    assert trainer.global_step == 8
+
+
+def test_delta_checkpoint_io_digest():
+    """Test that quantized and sparse tensors are hashed by their content."""
+    x = torch.rand(4, 3)
+    quantized = torch.quantize_per_tensor(x, 0.1, 2, torch.quint8)
+    assert _digest(quantized) == _digest(torch.quantize_per_tensor(x.clone(), 0.1, 2, torch.quint8))
+    assert _digest(quantized) != _digest(torch.quantize_per_tensor(x, 0.2, 2, torch.quint8))
+    assert _digest(quantized) != _digest(torch.quantize_per_tensor(x, 0.1, 3, torch.quint8))
+
+    scales, zero_points = torch.tensor([0.1, 0.2, 0.3]), torch.tensor([0, 1, 2])
+    per_channel = torch.quantize_per_channel(x, scales, zero_points, 1, torch.quint8)
+    assert _digest(per_channel) == _digest(torch.quantize_per_channel(x, scales, zero_points, 1, torch.quint8))
+    assert _digest(per_channel) != _digest(torch.quantize_per_channel(x, scales * 2, zero_points, 1, torch.quint8))
+
+    sparse = torch.tensor([[0.0, 1.0], [2.0, 0.0]]).to_sparse()
+    assert _digest(sparse) == _digest(torch.tensor([[0.0, 1.0], [2.0, 0.0]]).to_sparse())
+    assert _digest(sparse) != _digest(torch.tensor([[0.0, 1.0], [3.0, 0.0]]).to_sparse())
+    assert _digest(sparse) != _digest(sparse.to_dense())
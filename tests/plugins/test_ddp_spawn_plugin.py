@@ -11,9 +11,12 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import os
+
 import torch
 
 from pytorch_lightning import Trainer
+from pytorch_lightning.callbacks import ModelCheckpoint
 from pytorch_lightning.plugins import DDPSpawnPlugin
 from tests.helpers.boring_model import BoringDataModule, BoringModel
 from tests.helpers.runif import RunIf
@@ -77,3 +80,34 @@ def test_ddp_spawn_extra_parameters(tmpdir):
     trainer.fit(model, datamodule=dm)
     assert trainer.callback_metrics[val_name] == torch.tensor(val)
     assert model.test_val == "test_val"
+
+
+class DDPSpawnCopyPlugin(DDPSpawnPlugin):
+    def model_to_device(self):
+        # new memory for the weights, like moving them to a GPU
+        for param in self.model.parameters():
+            param.data = param.data.clone()
+
+
+@RunIf(skip_windows=True)
+def test_ddp_spawn_weights_shared_memory(tmpdir):
+    """Tests the final weights are copied to the shared memory of the main process instead of a checkpoint file."""
+    model = BoringModel()
+    initial_weight = model.layer.weight.clone()
+    checkpoint = ModelCheckpoint(dirpath=tmpdir)
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=1,
+        limit_train_batches=4,
+        limit_val_batches=2,
+        num_processes=2,
+        plugins=DDPSpawnCopyPlugin(),
+        callbacks=checkpoint,
+    )
+    trainer.fit(model)
+
+    assert not any(f.endswith(".tmp_end.ckpt") for f in os.listdir(tmpdir))
+    assert not torch.equal(model.layer.weight, initial_weight)
+    # without a monitor, the best checkpoint is the one saved at the end of the epoch
+    last_state_dict = torch.load(checkpoint.best_model_path)["state_dict"]
+    assert all(torch.equal(v, last_state_dict[k]) for k, v in model.state_dict().items())
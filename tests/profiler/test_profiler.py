@@ -11,11 +11,13 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import json
 import logging
 import os
 import platform
 import time
 from copy import deepcopy
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -24,7 +26,13 @@ import torch
 from pytorch_lightning import Callback, Trainer
 from pytorch_lightning.loggers.base import LoggerCollection
 from pytorch_lightning.loggers.tensorboard import TensorBoardLogger
-from pytorch_lightning.profiler import AdvancedProfiler, PassThroughProfiler, PyTorchProfiler, SimpleProfiler
+from pytorch_lightning.profiler import (
+    AdvancedProfiler,
+    PassThroughProfiler,
+    PyTorchProfiler,
+    SimpleProfiler,
+    TimelineProfiler,
+)
 from pytorch_lightning.profiler.pytorch import RegisterRecordFunction
 from pytorch_lightning.utilities import _TORCH_GREATER_EQUAL_1_7
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -108,6 +116,35 @@ def test_simple_profiler_value_errors(simple_profiler):
     simple_profiler.stop(action)
 
 
+def test_simple_profiler_streaming_stats():
+    """Ensure the statistics are exact while the memory is bounded by the reservoir and calls can be sampled."""
+    profiler = SimpleProfiler(reservoir_size=10, sample_every=3)
+    for _ in range(100):
+        with profiler.profile("a"):
+            pass
+
+    stats = profiler.recorded_stats["a"]
+    assert stats.num_calls == 100
+    # the calls 0, 3, ..., 99 are timed
+    assert stats.count == 34
+    assert len(profiler.recorded_durations["a"]) == 10
+    assert profiler.recorded_durations["a"] is stats.reservoir
+    assert stats.min <= stats.mean <= stats.max
+    assert 0 <= stats.std <= stats.max - stats.min
+    assert stats.estimated_total == pytest.approx(stats.mean * 100)
+    p50, p95, p99 = stats.percentiles()
+    assert stats.min <= p50 <= p95 <= p99 <= stats.max
+    summary = profiler.summary()
+    assert "Std duration (s)" in summary
+    assert "P99 (s)" in summary
+
+    # the reservoir is bounded by default
+    assert SimpleProfiler().reservoir_size == 1024
+
+    with pytest.raises(MisconfigurationException, match="`sample_every` should be a positive integer"):
+        SimpleProfiler(sample_every=0)
+
+
 def test_simple_profiler_deepcopy(tmpdir):
     simple_profiler = SimpleProfiler(dirpath=tmpdir, filename="test")
     simple_profiler.describe()
@@ -160,6 +197,52 @@ def test_simple_profiler_logs(tmpdir, caplog, simple_profiler):
     assert caplog.text.count("Profiler Report") == 2
 
 
+def test_timeline_profiler_ring_buffer():
+    """Ensure only the latest events are kept, oldest first."""
+    profiler = TimelineProfiler(capacity=3)
+    for i in range(5):
+        with profiler.profile(f"action_{i}"):
+            pass
+
+    events = [e for e in profiler.trace_events() if e["ph"] == "X"]
+    assert [e["name"] for e in events] == ["action_2", "action_3", "action_4"]
+    assert all(e["dur"] >= 0 for e in events)
+    assert events[0]["ts"] <= events[1]["ts"] <= events[2]["ts"]
+
+    with pytest.raises(ValueError):
+        profiler.stop("action_0")
+
+
+def test_timeline_profiler_trace(tmpdir):
+    """Ensure the trace file of each stage is written and the actions are forwarded to the wrapped profiler."""
+    profiler = TimelineProfiler(dirpath=tmpdir, profiler=SimpleProfiler())
+    model = BoringModel()
+    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=2, profiler=profiler, logger=False)
+    trainer.fit(model)
+    trainer.test(model)
+
+    with open(tmpdir / "fit-timeline.trace.json") as f:
+        events = json.load(f)["traceEvents"]
+    names = {e["name"] for e in events if e["ph"] == "X"}
+    assert {"get_train_batch", "training_step_and_backward", "on_train_batch_end"} <= names
+    assert (tmpdir / "test-timeline.trace.json").exists()
+    assert profiler.profiler.recorded_stats["training_step_and_backward"].count == 2
+
+    TimelineProfiler.merge(
+        [tmpdir / "fit-timeline.trace.json", tmpdir / "test-timeline.trace.json"], tmpdir / "all.json"
+    )
+    with open(tmpdir / "all.json") as f:
+        assert len(json.load(f)["traceEvents"]) > len(events)
+
+
+def test_timeline_profiler_trace_filename(tmpdir):
+    """Ensure the trace files are named after the global rank, as the local ranks repeat on each node."""
+    profiler = TimelineProfiler(dirpath=tmpdir)
+    profiler.setup(stage="fit", local_rank=0)
+    with mock.patch("pytorch_lightning.utilities.distributed.rank_zero_only.rank", 3):
+        assert profiler._prepare_trace_filename() == "fit-timeline-3.trace.json"
+
+
 @pytest.fixture
 def advanced_profiler(tmpdir):
     return AdvancedProfiler(dirpath=tmpdir, filename="profiler")
@@ -491,6 +574,7 @@ def test_pytorch_profiler_deepcopy(tmpdir):
         ("Simple", SimpleProfiler),
         ("advanced", AdvancedProfiler),
         ("pytorch", PyTorchProfiler),
+        ("timeline", TimelineProfiler),
     ],
 )
 def test_trainer_profiler_correct_args(profiler, expected):
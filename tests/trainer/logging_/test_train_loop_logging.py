@@ -18,6 +18,7 @@ Test logging in the training loop
 import collections
 import itertools
 from re import escape
+from unittest import mock
 
 import numpy as np
 import pytest
@@ -660,3 +661,30 @@ def test_log_gpu_memory_without_logging_on_step(tmpdir):
     trainer.fit(model)
 
     assert "gpu_id: 1/memory.used (MB)" in trainer.logged_metrics
+
+
+@pytest.mark.parametrize("gpus", [None, pytest.param(1, marks=RunIf(min_gpus=1))])
+def test_defer_metrics_transfer(tmpdir, gpus):
+    """Test that the deferred metrics are sent to the loggers in bulk with the steps they were logged at."""
+
+    class TestModel(BoringModel):
+        def training_step(self, batch, batch_idx):
+            self.log("value", torch.tensor(float(self.global_step), device=self.device))
+            # the metrics are only sent to the logger at the end of the epoch
+            assert agg_and_log_metrics.call_count == (3 if self.current_epoch else 0)
+            return super().training_step(batch, batch_idx)
+
+    trainer = Trainer(
+        default_root_dir=tmpdir,
+        max_epochs=2,
+        limit_train_batches=3,
+        limit_val_batches=0,
+        log_every_n_steps=1,
+        defer_metrics_transfer=True,
+        gpus=gpus,
+    )
+    with mock.patch.object(trainer.logger, "agg_and_log_metrics") as agg_and_log_metrics:
+        trainer.fit(TestModel())
+
+    calls = [(c.kwargs["step"], c.args[0]) for c in agg_and_log_metrics.call_args_list]
+    assert calls == [(step, {"value": float(step), "epoch": step // 3}) for step in range(6)]
@@ -29,6 +29,7 @@ from omegaconf import OmegaConf
 from torch.nn.parallel.distributed import DistributedDataParallel
 from torch.optim import SGD
 from torch.utils.data import DataLoader
+from torchmetrics import MeanSquaredError
 
 import tests.helpers.utils as tutils
 from pytorch_lightning import Callback, LightningDataModule, LightningModule, Trainer
@@ -1322,6 +1323,60 @@ def test_trainer_predict_grad(tmpdir):
     assert x.expand_as(x).grad_fn is not None
 
 
+@RunIf(min_torch="1.9")
+@pytest.mark.parametrize("inference_mode", [False, True])
+def test_trainer_inference_mode(tmpdir, inference_mode):
+    """Test the evaluation and prediction steps run under `torch.inference_mode` when enabled."""
+
+    class CustomBoringModel(BoringModel):
+        def validation_step(self, batch, batch_idx):
+            assert torch.is_inference_mode_enabled() == inference_mode
+            assert not torch.is_grad_enabled()
+            return super().validation_step(batch, batch_idx)
+
+        def predict_step(self, batch, batch_idx, dataloader_idx=None):
+            assert torch.is_inference_mode_enabled() == inference_mode
+            assert not torch.is_grad_enabled()
+            return super().predict_step(batch, batch_idx, dataloader_idx)
+
+    model = CustomBoringModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir, limit_val_batches=2, limit_predict_batches=2, inference_mode=inference_mode
+    )
+    trainer.validate(model)
+    predictions = trainer.predict(model, dataloaders=model.val_dataloader())
+    assert all(p.is_inference() == inference_mode for p in predictions)
+    assert torch.is_grad_enabled()
+
+
+@RunIf(min_torch="1.9")
+def test_trainer_inference_mode_validate_then_fit(tmpdir):
+    """Test the metrics reset under `torch.inference_mode` by `trainer.validate` can be updated by `trainer.fit`."""
+
+    class MetricModel(BoringModel):
+        def __init__(self):
+            super().__init__()
+            self.mse = MeanSquaredError()
+
+        def training_step(self, batch, batch_idx):
+            self.mse(self(batch), torch.zeros(len(batch), 2))
+            self.log("train_mse", self.mse)
+            return super().training_step(batch, batch_idx)
+
+        def validation_step(self, batch, batch_idx):
+            self.mse(self(batch), torch.zeros(len(batch), 2))
+            self.log("val_mse", self.mse)
+            return super().validation_step(batch, batch_idx)
+
+    model = MetricModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir, max_epochs=1, limit_train_batches=2, limit_val_batches=2, inference_mode=True
+    )
+    trainer.validate(model)
+    assert not any(getattr(model.mse, name).is_inference() for name in model.mse._defaults)
+    trainer.fit(model)
+
+
 @pytest.mark.parametrize("progress_bar_refresh_rate", [0, 5, None])
 @pytest.mark.parametrize("datamodule", [False, True])
 def test_trainer_predict_cpu(tmpdir, datamodule, progress_bar_refresh_rate):
@@ -0,0 +1,98 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from unittest import mock
+
+import pytest
+import torch
+from torch.utils.data import DataLoader
+
+from pytorch_lightning import Trainer
+from pytorch_lightning.tuner.dataloader_tuning import _grid
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from tests.helpers import BoringModel, RandomDataset
+
+
+class WorkersModel(BoringModel):
+    def train_dataloader(self):
+        return DataLoader(RandomDataset(32, 64), batch_size=2)
+
+
+def test_tune_dataloader_grid():
+    """Check the grid only holds valid configurations, from the cheapest to the most expensive."""
+    configs = _grid(num_workers=[2, 0], prefetch_factor=[4, 2], persistent_workers=[True, False], pin_memory=[False])
+    assert configs == [
+        {"num_workers": 0, "pin_memory": False, "prefetch_factor": 2, "persistent_workers": False},
+        {"num_workers": 2, "pin_memory": False, "prefetch_factor": 2, "persistent_workers": False},
+        {"num_workers": 2, "pin_memory": False, "prefetch_factor": 4, "persistent_workers": False},
+        {"num_workers": 2, "pin_memory": False, "prefetch_factor": 2, "persistent_workers": True},
+        {"num_workers": 2, "pin_memory": False, "prefetch_factor": 4, "persistent_workers": True},
+    ]
+
+
+@pytest.mark.parametrize(
+    ["fetch_times", "expected_workers"],
+    [
+        # the cheapest configuration faster than the step
+        ({0: 1.0, 1: 0.0, 2: 0.0}, 1),
+        # none is fast enough, the fastest is used
+        ({0: 2.0, 1: 1.5, 2: 1.0}, 2),
+        # without workers, the fetch time adds up to the step time
+        ({0: 0.0, 1: 0.0, 2: 0.0}, 1),
+        # unless the configurations with workers are slower
+        ({0: 0.0, 1: 2.0, 2: 1.0}, 0),
+    ],
+)
+def test_tune_dataloader(tmpdir, fetch_times, expected_workers):
+    """Check the dataloader tuning picks a configuration from the measurements and that it is applied to the
+    train dataloaders."""
+    model = WorkersModel()
+    initial_weight = model.layer.weight.clone()
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_val_batches=0, limit_train_batches=2)
+
+    def measure(loaders, *_):
+        assert all(dl.dataset is loaders[0].dataset for dl in loaders)
+        return fetch_times[loaders[0].num_workers]
+
+    with mock.patch("pytorch_lightning.tuner.dataloader_tuning._measure_fetch_time", side_effect=measure):
+        config = trainer.tuner.tune_dataloader(
+            model, num_workers=[0, 1, 2], prefetch_factor=(2,), persistent_workers=(False,), steps_per_trial=3
+        )
+    assert config == {
+        "num_workers": expected_workers,
+        "pin_memory": False,
+        "prefetch_factor": 2,
+        "persistent_workers": False,
+    }
+    assert trainer.tuner.dataloader_kwargs == config
+    # the weights trained while measuring the step time are restored
+    assert torch.equal(model.layer.weight, initial_weight)
+
+    trainer.fit(model)
+    assert trainer.train_dataloader.loaders.num_workers == expected_workers
+    # the other arguments are kept
+    assert trainer.train_dataloader.loaders.batch_size == 2
+
+
+def test_tune_dataloader_measures_fetch_time(tmpdir):
+    """Check the fetch times are measured without mocking."""
+    model = WorkersModel()
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_val_batches=0)
+    config = trainer.tuner.tune_dataloader(model, num_workers=[0, 1], steps_per_trial=2, num_batches=2)
+    assert config["num_workers"] in (0, 1)
+
+
+def test_tune_dataloader_raises(tmpdir):
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1)
+    with pytest.raises(MisconfigurationException, match="`steps_per_trial` should be at least 2"):
+        trainer.tuner.tune_dataloader(WorkersModel(), steps_per_trial=1)
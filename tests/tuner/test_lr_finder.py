@@ -18,6 +18,7 @@ import pytest
 import torch
 
 from pytorch_lightning import seed_everything, Trainer
+from pytorch_lightning.tuner.lr_finder import lr_find
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
 from tests.base import EvalModelTemplate
 from tests.helpers import BoringModel
@@ -282,3 +283,56 @@ def test_lr_finder_ends_before_num_training(tmpdir):
     trainer = Trainer(default_root_dir=tmpdir)
     num_training = 3
     trainer.tuner.lr_find(model=model, num_training=num_training)
+
+
+def test_lr_finder_num_lrs(tmpdir):
+    """Test several learning rates are evaluated in one run, each copy of the model starting from the same weights."""
+
+    class TestModel(BoringModel):
+        def __init__(self, learning_rate=0.1):
+            super().__init__()
+            self.save_hyperparameters()
+
+    seed_everything(1)
+    model = TestModel()
+    before_lr = model.hparams.learning_rate
+    initial_weight = model.layer.weight.clone()
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=2)
+    lr_finder = trainer.tuner.lr_find(model, min_lr=1e-4, max_lr=10, num_lrs=6)
+
+    assert lr_finder.num_training == 20
+
+    assert lr_finder.results["lr"] == pytest.approx([1e-4, 1e-3, 1e-2, 1e-1, 1, 10])
+    assert len(lr_finder.results["loss"]) == 6
+    # the model is trained with the first learning rate, the copies with the others
+    assert all(torch.isfinite(torch.tensor(lr_finder.results["loss"][:3])))
+    assert torch.equal(model.layer.weight, initial_weight)
+    assert model.hparams.learning_rate == before_lr
+
+    # the largest learning rate within the tolerance of the lowest loss is suggested
+    lr_finder.results["loss"] = [1.0, 0.99, 0.5, 0.51, float("nan"), float("nan")]
+    assert lr_finder.suggestion() == pytest.approx(1e-1)
+    lr_finder.results["loss"] = [1.0, 0.99, 0.5, 0.6, float("nan"), float("nan")]
+    assert lr_finder.suggestion() == pytest.approx(1e-2)
+    lr_finder.results["loss"] = [float("nan")] * 6
+    assert lr_finder.suggestion() is None
+
+    with pytest.raises(MisconfigurationException, match="`num_lrs` should be a positive integer"):
+        trainer.tuner.lr_find(model, num_lrs=0)
+
+
+@pytest.mark.parametrize(
+    "trainer_kwargs, match",
+    [
+        ({"precision": 64}, "only supported with 32-bit precision"),
+        ({"accelerator": "ddp_cpu", "num_processes": 2}, "only supported when training on a single device"),
+        ({"gradient_clip_val": 1.0}, "not supported with gradient clipping"),
+    ],
+)
+def test_lr_finder_num_lrs_unsupported(tmpdir, trainer_kwargs, match):
+    """Test several learning rates can only be evaluated when the copies of the model are trained like the model."""
+    model = BoringModel()
+    model.learning_rate = 0.1
+    trainer = Trainer(default_root_dir=tmpdir, **trainer_kwargs)
+    with pytest.raises(MisconfigurationException, match=match):
+        lr_find(trainer, model, num_lrs=4)
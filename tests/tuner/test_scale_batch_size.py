@@ -11,8 +11,10 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import io
 import os
 from copy import deepcopy
+from unittest import mock
 
 import pytest
 import torch
@@ -20,6 +22,7 @@ from torch.utils.data import DataLoader
 
 import tests.helpers.utils as tutils
 from pytorch_lightning import Trainer
+from pytorch_lightning.tuner.batch_size_scaling import _cgroup_memory_available, _memory_capacity, _reset_peak_memory
 from pytorch_lightning.tuner.tuning import Tuner
 from pytorch_lightning.utilities import AMPType
 from pytorch_lightning.utilities.exceptions import MisconfigurationException
@@ -246,6 +249,117 @@ def test_scale_batch_size_no_trials(tmpdir):
     assert result == 2
 
 
+@pytest.mark.skipif(not os.path.exists("/proc/self/clear_refs"), reason="requires Linux")
+def test_scale_batch_size_memory_mode(tmpdir):
+    """Check the `memory` mode predicts the batch size from the peak memory of three small batch sizes."""
+    model = BatchSizeModel(batch_size=2)
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_val_batches=0, limit_train_batches=1)
+
+    # 1000 bytes plus 100 bytes per sample, 4545 bytes are available with the headroom
+    def peak_memory(_):
+        return 1000 + 100 * model.batch_size
+
+    with mock.patch(
+        "pytorch_lightning.tuner.batch_size_scaling._peak_memory", side_effect=peak_memory
+    ) as peak_mock, mock.patch("pytorch_lightning.tuner.batch_size_scaling._memory_capacity", return_value=5050):
+        result = trainer.tuner.scale_batch_size(model, mode="memory", init_val=2, memory_headroom=0.1)
+
+    assert result == 35
+    assert model.batch_size == 35
+    # the three measurements and the verification
+    assert peak_mock.call_count == 4
+
+    with pytest.raises(MisconfigurationException, match="`memory_headroom` should be in"):
+        trainer.tuner.scale_batch_size(model, mode="memory", memory_headroom=1)
+
+
+@pytest.mark.skipif(not os.path.exists("/proc/self/clear_refs"), reason="requires Linux")
+def test_scale_batch_size_memory_mode_capped(tmpdir):
+    """Check the `memory` mode stops doubling the batch size once the next one is predicted to not fit, even if the
+    peak memory did not grow enough yet."""
+    model = BatchSizeModel(batch_size=2)
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_val_batches=0, limit_train_batches=1)
+
+    # the per-sample memory is small compared to the memory of the process, 101790 bytes are available
+    def peak_memory(_):
+        return 100000 + 100 * model.batch_size
+
+    with mock.patch(
+        "pytorch_lightning.tuner.batch_size_scaling._peak_memory", side_effect=peak_memory
+    ) as peak_mock, mock.patch("pytorch_lightning.tuner.batch_size_scaling._memory_capacity", return_value=113100):
+        result = trainer.tuner.scale_batch_size(model, mode="memory", init_val=2, memory_headroom=0.1)
+
+    assert result == 17
+    # 2, 4, 8 and 16 are measured, 32 is predicted to not fit
+    assert peak_mock.call_count == 5
+
+
+@pytest.mark.parametrize(
+    "files, expected",
+    [
+        # cgroup v2
+        ({"/sys/fs/cgroup/memory.max": "3072\n", "/sys/fs/cgroup/memory.current": "1024\n"}, 2048),
+        ({"/sys/fs/cgroup/memory.max": "max\n", "/sys/fs/cgroup/memory.current": "1024\n"}, None),
+        # cgroup v1
+        (
+            {
+                "/sys/fs/cgroup/memory/memory.limit_in_bytes": "3072\n",
+                "/sys/fs/cgroup/memory/memory.usage_in_bytes": "1024\n",
+            },
+            2048,
+        ),
+        ({}, None),
+    ],
+)
+def test_cgroup_memory_available(files, expected):
+    """Check the memory left under the cgroup limit is read for both cgroup versions."""
+
+    def fake_open(path, *_, **__):
+        if path not in files:
+            raise FileNotFoundError(path)
+        return io.StringIO(files[path])
+
+    with mock.patch("builtins.open", side_effect=fake_open):
+        assert _cgroup_memory_available() == expected
+
+
+def test_memory_capacity_cgroup_limit():
+    """Check the CPU memory capacity is bounded by the cgroup limit rather than the memory of the host."""
+    proc = {"VmRSS:": 1000, "MemAvailable:": 10000}
+    with mock.patch(
+        "pytorch_lightning.tuner.batch_size_scaling._read_proc_kb", side_effect=lambda _, key: proc[key]
+    ), mock.patch("pytorch_lightning.tuner.batch_size_scaling._cgroup_memory_available", return_value=500):
+        assert _memory_capacity(torch.device("cpu")) == 1500
+    with mock.patch(
+        "pytorch_lightning.tuner.batch_size_scaling._read_proc_kb", side_effect=lambda _, key: proc[key]
+    ), mock.patch("pytorch_lightning.tuner.batch_size_scaling._cgroup_memory_available", return_value=None):
+        assert _memory_capacity(torch.device("cpu")) == 11000
+
+
+def test_reset_peak_memory_permission_error():
+    """Check a clear error is raised when `/proc/self/clear_refs` cannot be written to."""
+    with mock.patch("builtins.open", side_effect=PermissionError), pytest.raises(
+        MisconfigurationException, match="needs to write to `/proc/self/clear_refs`"
+    ):
+        _reset_peak_memory(torch.device("cpu"))
+
+
+def test_scale_batch_size_throughput_mode(tmpdir):
+    """Check the `throughput` mode times each batch size and picks the suggested one."""
+    model = BatchSizeModel(batch_size=2)
+    trainer = Trainer(default_root_dir=tmpdir, max_epochs=1, limit_val_batches=0, limit_train_batches=1)
+    result = trainer.tuner.scale_batch_size(model, mode="throughput", init_val=2, max_trials=3, steps_per_trial=2)
+
+    throughput = trainer.tuner.batch_size_throughput
+    assert throughput.results["batch_size"] == [2, 4, 8]
+    assert all(t > 0 for t in throughput.results["samples_per_sec"])
+    assert result == model.batch_size == throughput.suggestion()
+
+    throughput.results = {"batch_size": [2, 4, 8, 16], "samples_per_sec": [100, 190, 200, 195]}
+    assert throughput.suggestion() == 4
+    assert throughput.suggestion(tolerance=0) == 8
+
+
 def test_scale_batch_size_fails_with_unavailable_mode(tmpdir):
     """Check the tuning raises error when called with mode that does not exist."""
 
@@ -263,7 +377,7 @@ def test_scale_batch_size_fails_with_unavailable_mode(tmpdir):
         auto_scale_batch_size="ThisModeDoesNotExist",
     )
 
-    with pytest.raises(ValueError, match="could either be `power` or `binsearch`"):
+    with pytest.raises(ValueError, match="could either be `power`, `binsearch`, `memory` or `throughput`"):
         trainer.tune(model)
-    with pytest.raises(ValueError, match="could either be `power` or `binsearch`"):
+    with pytest.raises(ValueError, match="could either be `power`, `binsearch`, `memory` or `throughput`"):
         trainer.tuner.scale_batch_size(model, mode="ThisModeDoesNotExist")
@@ -0,0 +1,97 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import io
+import os
+from unittest import mock
+
+import pytest
+import torch
+
+from pytorch_lightning.utilities.cloud_io import _SKIP_STORAGES_AVAILABLE, _SkipStoragesPickleModule, atomic_save
+from pytorch_lightning.utilities.cloud_io import get_filesystem
+from pytorch_lightning.utilities.cloud_io import load as pl_load
+
+
+def test_atomic_save_local(tmpdir):
+    filepath = os.path.join(tmpdir, "model.ckpt")
+    atomic_save({"weight": torch.ones(2)}, filepath)
+    assert os.listdir(tmpdir) == ["model.ckpt"]
+    assert torch.equal(pl_load(filepath)["weight"], torch.ones(2))
+
+    # overwriting an existing checkpoint
+    atomic_save({"weight": torch.zeros(2)}, filepath)
+    assert os.listdir(tmpdir) == ["model.ckpt"]
+    assert torch.equal(pl_load(filepath)["weight"], torch.zeros(2))
+
+
+@pytest.mark.parametrize("remote", [False, True])
+def test_atomic_save_failure_keeps_previous_checkpoint(tmpdir, remote):
+    dirpath = "memory://failure" if remote else str(tmpdir)
+    filepath = f"{dirpath}/model.ckpt"
+    fs = get_filesystem(filepath)
+    atomic_save({"weight": torch.ones(2)}, filepath)
+
+    def partial_save(checkpoint, f, **kwargs):
+        f.write(b"partial")
+        raise RuntimeError("serialization failed")
+
+    with mock.patch("torch.save", side_effect=partial_save), pytest.raises(RuntimeError):
+        atomic_save({"weight": torch.zeros(2)}, filepath)
+
+    assert [os.path.basename(p) for p in fs.ls(dirpath, detail=False)] == ["model.ckpt"]
+    assert torch.equal(pl_load(filepath)["weight"], torch.ones(2))
+
+
+def test_atomic_save_remote():
+    filepath = "memory://checkpoints/model.ckpt"
+    atomic_save({"weight": torch.ones(2)}, filepath)
+    assert torch.equal(pl_load(filepath)["weight"], torch.ones(2))
+
+
+@pytest.mark.parametrize("use_new_zipfile_serialization", [True, False])
+def test_load_skip_keys(use_new_zipfile_serialization):
+    weight = torch.arange(6.0)
+    module = torch.nn.Linear(2, 2)
+    checkpoint = {
+        "state_dict": module.state_dict(),
+        "views": (weight[:4], weight[2:]),
+        "parameter": torch.nn.Parameter(torch.ones(2)),
+        "optimizer_states": [{"exp_avg": torch.zeros(2, 2)}],
+    }
+    buffer = io.BytesIO()
+    torch.save(checkpoint, buffer, _use_new_zipfile_serialization=use_new_zipfile_serialization)
+    buffer.seek(0)
+
+    pickle_modules = []
+
+    def pickle_module(*args, **kwargs):
+        pickle_modules.append(_SkipStoragesPickleModule(*args, **kwargs))
+        return pickle_modules[-1]
+
+    with mock.patch("pytorch_lightning.utilities.cloud_io._SkipStoragesPickleModule", pickle_module):
+        loaded = pl_load(buffer, skip_keys=["optimizer_states"])
+
+    assert list(loaded) == ["state_dict", "views", "parameter"]
+    if use_new_zipfile_serialization and _SKIP_STORAGES_AVAILABLE:
+        # the first pass does not read any storage, the second one all but the skipped one
+        assert len(pickle_modules) == 2
+        assert len(pickle_modules[0].placeholders) == 5
+        assert len(pickle_modules[1].placeholders) == 1
+    # the ``_metadata`` of the ``state_dict`` is kept
+    assert loaded["state_dict"]._metadata == checkpoint["state_dict"]._metadata
+    torch.nn.Linear(2, 2).load_state_dict(loaded["state_dict"])
+    # views still share their storage
+    assert loaded["views"][0].storage().data_ptr() == loaded["views"][1].storage().data_ptr()
+    assert torch.equal(loaded["views"][1], weight[2:])
+    assert isinstance(loaded["parameter"], torch.nn.Parameter)
@@ -1,9 +1,21 @@
+from unittest import mock
+
 import pytest
 import torch
+from torch.nn.utils.rnn import pad_sequence
+from torch.utils.data import Dataset, SequentialSampler, SubsetRandomSampler
 from torch.utils.data.dataloader import DataLoader
 
-from pytorch_lightning.utilities.data import extract_batch_size, get_len, has_iterable_dataset, has_len
-from tests.helpers.boring_model import RandomDataset, RandomIterableDataset
+from pytorch_lightning import Trainer
+from pytorch_lightning.utilities.data import (
+    BucketBatchSampler,
+    extract_batch_size,
+    get_len,
+    has_iterable_dataset,
+    has_len,
+)
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from tests.helpers.boring_model import BoringModel, RandomDataset, RandomIterableDataset
 
 
 def test_extract_batch_size():
@@ -53,3 +65,49 @@ def test_get_len():
 
     assert isinstance(value, float)
     assert value == float("inf")
+
+
+def test_bucket_batch_sampler():
+    lengths = [5, 1, 3, 8, 2, 2, 20]
+    sampler = BucketBatchSampler(SequentialSampler(lengths), lengths, max_tokens=8)
+    # sorted by length, each batch holds at most 8 padded tokens and a longer sample is batched alone
+    assert list(sampler) == [[1, 4, 5], [2], [0], [3], [6]]
+    assert len(sampler) == 5
+    # the number of batches is computed once
+    with mock.patch.object(BucketBatchSampler, "__iter__", side_effect=AssertionError):
+        assert len(sampler) == 5
+
+    sampler = BucketBatchSampler(SubsetRandomSampler([0, 1, 2, 3]), lengths, max_tokens=100, max_batch_size=3)
+    assert list(sampler) == [[1, 2, 0], [3]]
+
+    with pytest.raises(MisconfigurationException, match="`max_tokens` and `max_batch_size` should be at least 1"):
+        BucketBatchSampler(SequentialSampler(lengths), lengths, max_tokens=0)
+
+
+def test_bucket_batch_sampler_predict(tmpdir):
+    """Test the predictions of a dataloader using a `BucketBatchSampler` are returned in the dataset order."""
+
+    class SequenceDataset(Dataset):
+        def __init__(self, lengths):
+            self.lengths = lengths
+
+        def __getitem__(self, idx):
+            return torch.full((self.lengths[idx],), float(idx))
+
+        def __len__(self):
+            return len(self.lengths)
+
+    class SequenceModel(BoringModel):
+        def predict_step(self, batch, batch_idx, dataloader_idx=None):
+            assert batch.numel() <= 8
+            return {"idx": batch[:, 0], "length": (batch == batch[:, :1]).sum(1)}
+
+    lengths = [5, 1, 3, 8, 2, 2, 4]
+    dataset = SequenceDataset(lengths)
+    batch_sampler = BucketBatchSampler(SequentialSampler(dataset), lengths, max_tokens=8)
+    dataloader = DataLoader(dataset, batch_sampler=batch_sampler, collate_fn=lambda x: pad_sequence(x, True, -1.0))
+
+    trainer = Trainer(default_root_dir=tmpdir)
+    predictions = trainer.predict(SequenceModel(), dataloaders=dataloader)
+    assert [p["idx"].item() for p in predictions] == list(range(len(lengths)))
+    assert [p["length"].item() for p in predictions] == lengths
@@ -0,0 +1,122 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import pytest
+import torch
+from torch.utils.data import DataLoader
+
+from pytorch_lightning import Trainer
+from pytorch_lightning.utilities.epoch_outputs import _EpochOutputReduction, DiskReducer, EpochOutputReducer
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from tests.helpers import BoringModel, RandomDataset
+
+
+class MaxReducer(EpochOutputReducer):
+    def __init__(self):
+        self.max = None
+
+    def update(self, value):
+        self.max = value if self.max is None else torch.maximum(self.max, value)
+
+    def compute(self):
+        return self.max
+
+
+def test_epoch_output_reduction(tmpdir):
+    """Test the step outputs are folded by each reducer."""
+    reduction = _EpochOutputReduction(
+        {"sum": "sum", "mean": "mean", "cat": "cat", "disk": DiskReducer(dirpath=str(tmpdir)), "max": MaxReducer()}
+    )
+    outputs = [torch.arange(2.0, requires_grad=True) + i for i in range(3)]
+    for x in outputs:
+        reduction.update({"sum": x, "mean": x, "cat": x, "disk": x, "max": x, "dropped": x})
+    reduction.update(None)
+
+    result = reduction.compute()
+    assert set(result) == {"sum", "mean", "cat", "disk", "max"}
+    torch.testing.assert_allclose(result["sum"], torch.tensor([3.0, 6.0]))
+    torch.testing.assert_allclose(result["mean"], torch.tensor([1.0, 2.0]))
+    torch.testing.assert_allclose(result["cat"], torch.tensor([0.0, 1.0, 1.0, 2.0, 2.0, 3.0]))
+    torch.testing.assert_allclose(result["disk"], result["cat"])
+    torch.testing.assert_allclose(result["max"], torch.tensor([2.0, 3.0]))
+    assert not result["sum"].requires_grad
+
+    # scalars are stacked
+    reduction = _EpochOutputReduction({"cat": "cat", "disk": "disk"})
+    for i in range(3):
+        reduction.update({"cat": torch.tensor(i), "disk": i})
+    result = reduction.compute()
+    assert result["cat"].tolist() == result["disk"].tolist() == [0, 1, 2]
+
+    with pytest.raises(MisconfigurationException, match="The reducer of `x` should be one of"):
+        _EpochOutputReduction({"x": "median"})
+    with pytest.raises(MisconfigurationException, match="The step outputs should be dictionaries"):
+        reduction.update(torch.tensor(1.0))
+    with pytest.raises(MisconfigurationException, match="expects values of the same dtype and trailing shape"):
+        reduction.update({"disk": torch.ones(2, 2)})
+
+
+def test_epoch_output_reducers_in_loops(tmpdir):
+    """Test the epoch end hooks receive the reduced outputs, per dataloader."""
+
+    class TestModel(BoringModel):
+        def training_step(self, batch, batch_idx):
+            output = super().training_step(batch, batch_idx)
+            output["preds"] = batch.argmax(-1)
+            return output
+
+        def training_epoch_end(self, outputs):
+            # `x` is only returned by the validation steps
+            assert outputs["x"] is None
+            assert outputs["loss"].ndim == 0
+            assert outputs["preds"].shape == (4,)
+            assert outputs["preds"].device == torch.device("cpu")
+            self.training_epoch_end_called = True
+
+        def validation_step(self, batch, batch_idx, dataloader_idx):
+            output = super().validation_step(batch, batch_idx)
+            output["preds"] = batch.argmax(-1)
+            return output
+
+        def val_dataloader(self):
+            return [DataLoader(RandomDataset(32, 6), batch_size=2), DataLoader(RandomDataset(32, 10), batch_size=2)]
+
+        def validation_epoch_end(self, outputs):
+            assert len(outputs) == 2
+            assert [len(out["preds"]) for out in outputs] == [6, 10]
+            assert all(out["x"].ndim == 0 for out in outputs)
+            self.validation_epoch_end_called = True
+
+        def configure_epoch_output_reducers(self):
+            return {"loss": "mean", "x": "sum", "preds": "cat"}
+
+    model = TestModel()
+    trainer = Trainer(
+        default_root_dir=tmpdir, max_epochs=1, limit_train_batches=4, num_sanity_val_steps=0, weights_summary=None
+    )
+    trainer.fit(model)
+    assert model.training_epoch_end_called
+    assert model.validation_epoch_end_called
+
+
+def test_evaluation_outputs_not_kept_without_epoch_end(tmpdir):
+    """Test the evaluation step outputs are not kept when there is no epoch end hook to receive them."""
+
+    class TestModel(BoringModel):
+        def on_validation_epoch_end(self):
+            assert self.trainer.fit_loop.epoch_loop.val_loop.epoch_loop.outputs == []
+
+    model = TestModel()
+    model.validation_epoch_end = None
+    trainer = Trainer(default_root_dir=tmpdir, fast_dev_run=2, weights_summary=None)
+    trainer.fit(model)
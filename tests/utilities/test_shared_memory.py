@@ -0,0 +1,100 @@
+# Copyright The PyTorch Lightning team.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import os
+
+import numpy as np
+import pytest
+import torch
+
+from pytorch_lightning import LightningDataModule
+from pytorch_lightning.plugins import DDPSpawnPlugin
+from pytorch_lightning.plugins.environments import LightningEnvironment
+from pytorch_lightning.utilities.exceptions import MisconfigurationException
+from pytorch_lightning.utilities.shared_memory import share_on_node
+from tests.helpers.runif import RunIf
+
+
+def _build(rank):
+    assert rank == 0
+    return {
+        "tensor": torch.arange(6.0).view(2, 3),
+        "bfloat16": torch.ones(3, dtype=torch.bfloat16),
+        "arrays": [np.arange(4), np.zeros((0, 2))],
+        "name": "data",
+    }
+
+
+def _test_share_on_node(rank, world_size, tmpdir):
+    os.environ["MASTER_ADDR"] = "localhost"
+    os.environ["MASTER_PORT"] = "8089"
+    torch.distributed.init_process_group("gloo", rank=rank, world_size=world_size)
+    plugin = DDPSpawnPlugin(parallel_devices=[torch.device("cpu")] * world_size)
+    plugin.cluster_environment = LightningEnvironment()
+    plugin.set_world_ranks(rank)
+    plugin.dist.rank, plugin.dist.device = rank, torch.device("cpu")
+
+    data = share_on_node(plugin, "train", lambda: _build(rank), dirpath=str(tmpdir))
+    torch.testing.assert_allclose(data["tensor"], torch.arange(6.0).view(2, 3))
+    assert data["bfloat16"].dtype == torch.bfloat16
+    assert torch.equal(data["bfloat16"], torch.ones(3, dtype=torch.bfloat16))
+    assert isinstance(data["arrays"][0], np.memmap)
+    np.testing.assert_array_equal(data["arrays"][0], np.arange(4))
+    assert data["arrays"][1].shape == (0, 2)
+    assert data["name"] == "data"
+    # the files are removed once mapped by all the processes
+    torch.distributed.barrier()
+    assert os.listdir(tmpdir) == []
+    # copy-on-write
+    data["tensor"] += rank
+    torch.testing.assert_allclose(data["tensor"], torch.arange(6.0).view(2, 3) + rank)
+
+
+@RunIf(skip_windows=True)
+def test_share_on_node(tmpdir):
+    """Test the data is built on the local rank 0 only and mapped by the other processes of the node."""
+    world_size = 2
+    torch.multiprocessing.spawn(_test_share_on_node, args=(world_size, tmpdir), nprocs=world_size)
+
+
+def _test_share_on_node_mismatch(rank, world_size, tmpdir):
+    os.environ["MASTER_ADDR"] = "localhost"
+    os.environ["MASTER_PORT"] = "8090"
+    # a single process on each node
+    os.environ["NODE_RANK"] = str(rank)
+    torch.distributed.init_process_group("gloo", rank=rank, world_size=world_size)
+    plugin = DDPSpawnPlugin(parallel_devices=[torch.device("cpu")], num_nodes=world_size)
+    plugin.cluster_environment = LightningEnvironment()
+    plugin.set_world_ranks(0)
+    plugin.dist.rank, plugin.dist.device = rank, torch.device("cpu")
+    assert plugin.local_rank == 0 and plugin.global_rank == rank
+
+    with pytest.raises(MisconfigurationException, match="does not have the same structure on every node"):
+        share_on_node(plugin, "train", lambda: [torch.ones(2)] * (rank + 1), dirpath=str(tmpdir))
+    # the files written by each node are removed
+    torch.distributed.barrier()
+    assert os.listdir(tmpdir) == []
+
+
+@RunIf(skip_windows=True)
+def test_share_on_node_mismatch(tmpdir):
+    """Test an error is raised on every process when the nodes build data with different structures."""
+    world_size = 2
+    torch.multiprocessing.spawn(_test_share_on_node_mismatch, args=(world_size, tmpdir), nprocs=world_size)
+
+
+def test_datamodule_share_on_node():
+    """Test the data is built as usual without distributed processes."""
+    datamodule = LightningDataModule()
+    data = {"x": torch.ones(2)}
+    assert datamodule.share_on_node("x", lambda: data) is data